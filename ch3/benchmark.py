@@ -0,0 +1,143 @@
+# benchmark.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Dict, List, Optional, Callable, Tuple
+from random import Random
+from time import perf_counter
+from csp import CSP, first_unassigned, mrv, dom_wdeg, domain_order, lcv
+from map_coloring import MapColoringConstraint
+from queens import QueensConstraint
+from graph_coloring import random_graph, dsatur, color_graph
+from word_search import generate_grid, solve_word_search
+
+
+def queens_csp(n: int) -> CSP[int, int]:
+    columns: List[int] = list(range(1, n + 1))
+    rows: Dict[int, List[int]] = {column: list(range(1, n + 1)) for column in columns}
+    csp: CSP[int, int] = CSP(columns, rows)
+    csp.add_constraint(QueensConstraint(columns))
+    return csp
+
+
+# 숨겨진 3-색칠을 심어둔(planted) 무작위 지도를 만든다.
+# 평균 차수가 4.5 근처일 때 순진한 백트래킹이 가장 어려워한다.
+def random_map_csp(regions: int, borders: int, seed: int = 0) -> CSP[str, str]:
+    random: Random = Random(seed)
+    colors: List[str] = ["빨강", "초록", "파랑"]
+    names: List[str] = [f"지역{i}" for i in range(regions)]
+    hidden: Dict[str, str] = {name: random.choice(colors) for name in names}
+    csp: CSP[str, str] = CSP(names, {name: colors for name in names})
+    added: set = set()
+    while len(added) < borders:
+        a, b = random.sample(names, 2)
+        if hidden[a] != hidden[b] and (a, b) not in added and (b, a) not in added:
+            added.add((a, b))
+            csp.add_constraint(MapColoringConstraint(a, b))
+    return csp
+
+
+def timed(solve: Callable[[], Optional[Dict]]) -> Tuple[float, bool]:
+    start: float = perf_counter()
+    solution: Optional[Dict] = solve()
+    return perf_counter() - start, solution is not None
+
+
+def timed_value(solve: Callable[[], Dict]) -> Tuple[float, Dict]:
+    start: float = perf_counter()
+    value: Dict = solve()
+    return perf_counter() - start, value
+
+
+def heuristics_benchmark() -> None:
+    strategies = [("첫 번째 변수", first_unassigned, domain_order),
+                  ("MRV+차수", mrv, domain_order),
+                  ("MRV+차수, LCV", mrv, lcv),
+                  ("dom/wdeg", dom_wdeg, domain_order)]
+    # 순진한 백트래킹은 큰 문제에서 끝나지 않으므로 휴리스틱끼리만 비교한다.
+    problems = [("16-퀸", lambda: queens_csp(16), strategies),
+                ("25-퀸", lambda: queens_csp(25), strategies),
+                # MRV만으로는 동점 변수가 많아 헤매므로 LCV와 함께 사용한다.
+                ("100-퀸", lambda: queens_csp(100), strategies[2:3]),
+                ("지도 색칠(지역 50, 경계 112)", lambda: random_map_csp(50, 112), strategies),
+                ("지도 색칠(지역 300, 경계 675)", lambda: random_map_csp(300, 675), strategies[1:3])]
+    for problem_name, build, compared in problems:
+        print(problem_name)
+        for name, select, order in compared:
+            csp = build()
+            seconds, found = timed(lambda: csp.backtracking_search(
+                select_variable=select, order_values=order))
+            print(f"  {name:16} {seconds:8.3f}초 {'답 있음' if found else '답 없음'}")
+
+
+# 재귀 한도를 훨씬 넘는 변수 수의 문제도 풀 수 있는지 확인한다.
+def deep_search_benchmark(regions: int = 50000) -> None:
+    names: List[str] = [f"지역{i}" for i in range(regions)]
+    csp: CSP[str, str] = CSP(names, {name: ["빨강", "초록", "파랑"] for name in names})
+    for a, b in zip(names, names[1:]):
+        csp.add_constraint(MapColoringConstraint(a, b))
+    seconds, found = timed(csp.backtracking_search)
+    print(f"지역 {regions}개의 사슬 지도 색칠: {seconds:.3f}초 {'답 있음' if found else '답 없음'}")
+
+
+# 충돌 지향 백점프와 nogood 기록이 정적 변수 순서에서 줄여주는 탐색량을 비교한다.
+def backjumping_benchmark() -> None:
+    print("지도 색칠(지역 50, 경계 112), 정적 변수 순서")
+    for name, backjumping, nogood_limit in [("연대순 백트래킹", False, 0),
+                                            ("백점프", True, 0),
+                                            ("백점프+nogood 1000개", True, 1000)]:
+        csp = random_map_csp(50, 112)
+        seconds, found = timed(lambda: csp.backtracking_search(
+            backjumping=backjumping, nogood_limit=nogood_limit))
+        stats = csp.statistics
+        print(f"  {name:20} {seconds:8.3f}초 노드 {stats.nodes:8} "
+              f"백점프 {stats.backjumps:6} nogood 적중 {stats.nogood_hits:6}")
+
+
+# 전용 그래프 색칠 엔진과 간선마다 제약 조건을 둔 일반 CSP를 무작위 그래프에서 비교한다.
+# 색 수는 DSATUR가 찾은 색 수로 정한다.
+def coloring_benchmark() -> None:
+    for n, m in [(200, 400), (1000, 2000)]:
+        graph: Dict[int, List[int]] = random_graph(n, m)
+        seconds, coloring = timed_value(lambda: dsatur(graph))
+        k: int = max(coloring.values()) + 1
+        print(f"무작위 그래프(정점 {n}, 간선 {m}), {k}색")
+        print(f"  {'DSATUR':16} {seconds:8.3f}초")
+        seconds, found = timed(lambda: color_graph(graph, k, timeout=60) or None)
+        print(f"  {'정확한 색칠 엔진':16} {seconds:8.3f}초 {'답 있음' if found else '답 없음'}")
+        csp: CSP[int, int] = CSP(list(graph), {v: list(range(k)) for v in graph})
+        for u, neighbors in graph.items():
+            for v in neighbors:
+                if u < v:  # 양쪽에 적힌 간선도 제약 조건은 하나만 둔다.
+                    csp.add_constraint(MapColoringConstraint(u, v))
+        seconds, found = timed(lambda: csp.backtracking_search(select_variable=mrv, timeout=60) or None)
+        print(f"  {'일반 CSP(MRV)':16} {seconds:8.3f}초 {'답 있음' if found else '답 없음'}")
+
+
+# 큰 격자의 단어 찾기: 100 x 100 격자에 길이 3~10의 단어 300개
+def word_search_benchmark() -> None:
+    random: Random = Random(0)
+    grid = generate_grid(100, 100)
+    letters: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    words: List[str] = list({"".join(random.sample(letters, random.randint(3, 10))) for _ in range(300)})
+    seconds, found = timed(lambda: solve_word_search(words, grid))
+    print(f"단어 찾기(100 x 100 격자, 단어 {len(words)}개): {seconds:.3f}초 {'답 있음' if found else '답 없음'}")
+
+
+if __name__ == "__main__":
+    heuristics_benchmark()
+    deep_search_benchmark()
+    backjumping_benchmark()
+    coloring_benchmark()
+    word_search_benchmark()
@@ -0,0 +1,190 @@
+# bitboard_queens.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Dict, List, Optional, Tuple, Set
+from random import Random
+from time import perf_counter
+
+# 결과 형식은 queens.py의 CSP와 같다: 열(1부터 n) -> 행(1부터 n)
+Placement = Dict[int, int]
+
+
+# 열 순서대로 퀸을 놓으면서 행, 두 대각선의 점유 상태를 정수 비트마스크로 관리한다.
+# 대각선 마스크는 다음 열로 넘어갈 때 한 칸씩 시프트된다.
+def _count(full: int, rows: int, diagonals: int, anti_diagonals: int) -> int:
+    if rows == full:
+        return 1
+    count: int = 0
+    free: int = full & ~(rows | diagonals | anti_diagonals)
+    while free:
+        bit: int = free & -free  # 가장 낮은 빈 행
+        free ^= bit
+        count += _count(full, rows | bit, ((diagonals | bit) << 1) & full,
+                        (anti_diagonals | bit) >> 1)
+    return count
+
+
+# N-퀸 문제의 답의 수를 센다.
+# 좌우 대칭을 이용해서 첫 번째 열의 위쪽 절반만 탐색하고 두 배로 센다.
+def count_queens(n: int) -> int:
+    if n < 1:
+        return 0
+    full: int = (1 << n) - 1
+    total: int = 0
+    for row in range(n // 2):
+        bit: int = 1 << row
+        total += _count(full, bit, (bit << 1) & full, bit >> 1)
+    total *= 2
+    if n % 2 == 1:  # 홀수면 가운데 행은 대칭 짝이 없다.
+        bit = 1 << (n // 2)
+        total += _count(full, bit, (bit << 1) & full, bit >> 1)
+    return total
+
+
+# 비트마스크 백트래킹으로 첫 번째 답을 찾는다. 명시적인 스택을 사용한다.
+def solve_queens(n: int) -> Optional[Placement]:
+    if n < 1:
+        return None
+    full: int = (1 << n) - 1
+    placed: List[int] = []  # 각 열에 놓은 퀸의 행 비트
+    # 스택 항목: (아직 시도하지 않은 행, 행 마스크, 대각선 마스크, 반대 대각선 마스크)
+    stack: List[Tuple[int, int, int, int]] = [(full, 0, 0, 0)]
+    while stack:
+        free, rows, diagonals, anti_diagonals = stack.pop()
+        if len(placed) > len(stack):  # 백트래킹으로 돌아왔다면 이 열의 퀸을 치운다.
+            placed.pop()
+        if not free:
+            continue
+        bit: int = free & -free
+        stack.append((free ^ bit, rows, diagonals, anti_diagonals))
+        placed.append(bit)
+        if len(placed) == n:
+            return {column + 1: row.bit_length() for column, row in enumerate(placed)}
+        rows |= bit
+        diagonals = ((diagonals | bit) << 1) & full
+        anti_diagonals = (anti_diagonals | bit) >> 1
+        stack.append((full & ~(rows | diagonals | anti_diagonals), rows, diagonals, anti_diagonals))
+    return None
+
+
+# 최소 충돌(min-conflicts) 지역 탐색으로 N-퀸 답을 찾는다(Sosič와 Gu의 QS4 방식).
+# 퀸의 행을 순열로 유지하므로 같은 행의 충돌은 생기지 않고, 대각선 충돌만 센다.
+# 1. 열마다 대각선 충돌이 없는 행을 무작위로 골라서 놓고, 마지막 몇 열만 무작위로 둔다.
+# 2. 충돌하는 퀸을 다른 퀸과 교환해서 충돌이 줄어들면 받아들인다.
+# 3. 오랫동안 나아지지 않으면(지역 최솟값) 처음부터 다시 시작한다.
+def min_conflicts_queens(n: int, max_swaps: Optional[int] = None,
+                         seed: Optional[int] = None) -> Optional[Placement]:
+    if n < 1 or n in (2, 3):
+        return None  # 답이 없다.
+    random: Random = Random(seed)
+    # 무작위로 두는 마지막 열의 수. n이 클수록 조금 늘린다.
+    tail: int = min(n, 8 if n < 100 else 30 if n < 10000 else 50)
+    stall_limit: int = min(max(100, 20 * n), 100000)
+    swaps: int = 0
+    while max_swaps is None or swaps < max_swaps:
+        budget: Optional[int] = None if max_swaps is None else max_swaps - swaps
+        rows, used = _repair(n, _initial_rows(n, tail, random), random, stall_limit, budget)
+        swaps += used
+        if rows is not None:
+            return {column + 1: row + 1 for column, row in enumerate(rows)}
+    return None
+
+
+def _initial_rows(n: int, tail: int, random: Random) -> List[int]:
+    rows: List[int] = list(range(n))
+    diagonals: List[int] = [0] * (2 * n)
+    anti_diagonals: List[int] = [0] * (2 * n)
+    for column in range(n):
+        for _ in range(4 * n if column < n - tail else 1):
+            swap: int = column + int(random.random() * (n - column))
+            row: int = rows[swap]
+            if diagonals[column + row] == 0 and anti_diagonals[column - row + n] == 0:
+                break  # 빈 대각선을 못 찾으면 그냥 마지막 후보를 둔다.
+        rows[column], rows[swap] = rows[swap], rows[column]
+        diagonals[column + row] += 1
+        anti_diagonals[column - row + n] += 1
+    return rows
+
+
+# 교환으로 충돌을 없앤다. stall_limit번 연속으로 나아지지 않으면 포기한다.
+def _repair(n: int, rows: List[int], random: Random, stall_limit: int,
+            budget: Optional[int]) -> Tuple[Optional[List[int]], int]:
+    diagonals: List[int] = [0] * (2 * n)  # 열 + 행
+    anti_diagonals: List[int] = [0] * (2 * n)  # 열 - 행 + n
+    for column, row in enumerate(rows):
+        diagonals[column + row] += 1
+        anti_diagonals[column - row + n] += 1
+
+    # 퀸이 놓인 대각선에 있는 다른 퀸의 수
+    def attacks(c: int) -> int:
+        return diagonals[c + rows[c]] + anti_diagonals[c - rows[c] + n] - 2
+
+    def move(c: int, delta: int) -> None:
+        diagonals[c + rows[c]] += delta
+        anti_diagonals[c - rows[c] + n] += delta
+
+    def exchange(i: int, j: int) -> None:
+        move(i, -1)
+        move(j, -1)
+        rows[i], rows[j] = rows[j], rows[i]
+        move(i, 1)
+        move(j, 1)
+
+    # 충돌하는 두 퀸 중 적어도 하나는 항상 이 집합에 들어있으므로,
+    # 집합의 퀸이 모두 충돌이 없으면 전체 배치에도 충돌이 없다.
+    conflicted: Set[int] = {c for c in range(n) if attacks(c) > 0}
+    swaps: int = 0
+    stalled: int = 0
+    while conflicted:
+        for i in list(conflicted):
+            if attacks(i) == 0:
+                conflicted.discard(i)  # 앞선 교환으로 이미 충돌이 없어졌다.
+                continue
+            j: int = int(random.random() * n)
+            before: int = attacks(i) + attacks(j)
+            exchange(i, j)
+            if i == j or attacks(i) + attacks(j) >= before:  # 나아지지 않으면 되돌린다.
+                exchange(i, j)
+                stalled += 1
+            else:
+                stalled = 0
+                if attacks(j) > 0:
+                    conflicted.add(j)
+            swaps += 1
+            if stalled >= stall_limit or (budget is not None and swaps >= budget):
+                return None, swaps
+    return rows, swaps
+
+
+# 답이 N-퀸 규칙을 만족하는지 확인한다.
+def is_valid(placement: Placement) -> bool:
+    n: int = len(placement)
+    if sorted(placement.values()) != list(range(1, n + 1)):
+        return False
+    diagonals = {column + row for column, row in placement.items()}
+    anti_diagonals = {column - row for column, row in placement.items()}
+    return len(diagonals) == n and len(anti_diagonals) == n
+
+
+if __name__ == "__main__":
+    for n in (8, 12):
+        print(f"{n}-퀸 답의 수: {count_queens(n)}")
+    print(f"8-퀸 첫 번째 답: {solve_queens(8)}")
+    for n in (1000, 1000000):
+        start: float = perf_counter()
+        solution: Optional[Placement] = min_conflicts_queens(n, seed=1)
+        seconds: float = perf_counter() - start
+        print(f"최소 충돌 {n}-퀸: {seconds:.2f}초, "
+              f"{'유효한 답' if solution is not None and is_valid(solution) else '답 없음'}")
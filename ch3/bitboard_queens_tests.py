@@ -0,0 +1,52 @@
+# bitboard_queens_tests.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import Optional
+from bitboard_queens import Placement, count_queens, solve_queens, min_conflicts_queens, is_valid
+
+
+class BitboardQueensTestCase(unittest.TestCase):
+    def assert_solution(self, placement: Optional[Placement], n: int) -> None:
+        self.assertIsNotNone(placement)
+        self.assertEqual(sorted(placement), list(range(1, n + 1)))
+        self.assertTrue(is_valid(placement))
+
+    def test_counts(self):
+        # OEIS A000170
+        self.assertEqual([count_queens(n) for n in range(1, 11)], [1, 0, 0, 2, 10, 4, 40, 92, 352, 724])
+        self.assertEqual(count_queens(0), 0)
+
+    def test_solve(self):
+        for n in list(range(4, 21)) + [1]:
+            self.assert_solution(solve_queens(n), n)
+        for n in (0, 2, 3):
+            self.assertIsNone(solve_queens(n))
+
+    def test_min_conflicts(self):
+        for n in list(range(4, 21)) + [1, 50, 500]:
+            for seed in range(3):
+                self.assert_solution(min_conflicts_queens(n, seed=seed), n)
+        for n in (0, 2, 3):
+            self.assertIsNone(min_conflicts_queens(n, seed=0))
+
+    def test_is_valid(self):
+        self.assertFalse(is_valid({1: 1, 2: 2, 3: 3, 4: 4}))  # 한 대각선
+        self.assertFalse(is_valid({1: 2, 2: 4, 3: 1, 4: 1}))  # 같은 행
+        self.assertTrue(is_valid({1: 2, 2: 4, 3: 1, 4: 3}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+# cnf.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar, Generic, Dict, List, Optional, Tuple, Union
+from itertools import product
+from time import perf_counter
+from csp import CSP, Constraint, SearchStatistics, TimeoutResult
+from global_constraints import AllDifferent, TableConstraint
+from model import tabulate, pairwise_tables
+from sat import SATSolver
+
+V = TypeVar('V')  # 변수(Variable) 타입
+D = TypeVar('D')  # 도메인(Domain) 타입
+
+
+# 유한 도메인 CSP를 CNF로 인코딩한다.
+# encoding="direct"(직접 인코딩): (변수 = 값)마다 불리언 변수를 두고, 변수마다
+#   적어도 하나(at-least-one)와 많아야 하나(at-most-one) 절을 추가한다.
+# encoding="order"(순서 인코딩): 정렬된 도메인 d_0 < d_1 < ...에 대해 (변수 <= d_i)를
+#   불리언 변수로 두고 (변수 <= d_i) -> (변수 <= d_i+1) 절을 추가한다. 도메인 값은 비교할 수
+#   있어야 한다. (변수 = d_i)는 (변수 <= d_i) 그리고 not (변수 <= d_i-1)로 정의한다.
+# AllDifferent는 값마다 많아야 하나 제약으로 인코딩하고, alldifferent로 쌍별(pairwise) 또는
+# 순차 카운터(sequential) 방식을 고른다. 다른 제약 조건은 허용되지 않는 값 조합마다
+# 그 조합을 금지하는 절을 추가한다. 조합이 max_tuples개보다 많은 테이블은 허용되는 조합마다
+# 보조 변수를 두고 그중 하나가 참이라는 절로 인코딩한다.
+# 조합이 너무 많아서 테이블로 바꿀 수 없는 제약 조건은 ValueError를 일으킨다. pairwise가 True이면
+# 대신 변수 쌍별 테이블로 나누는데, 이것은 원래 제약 조건보다 느슨할 수 있으므로
+# 찾은 모델이 답인지 따로 확인해야 한다(sat_solve가 확인한다).
+class CNFEncoding(Generic[V, D]):
+    def __init__(self, csp: CSP[V, D], encoding: str = "direct",
+                 alldifferent: str = "sequential", max_tuples: int = 200000,
+                 pairwise: bool = False) -> None:
+        if encoding not in ("direct", "order"):
+            raise ValueError(f"알 수 없는 인코딩입니다: {encoding}")
+        if alldifferent not in ("pairwise", "sequential"):
+            raise ValueError(f"알 수 없는 AllDifferent 인코딩입니다: {alldifferent}")
+        self.csp: CSP[V, D] = csp
+        self.solver: SATSolver = SATSolver()
+        self.alldifferent: str = alldifferent
+        self.max_tuples: int = max_tuples
+        self.pairwise: bool = pairwise
+        self.literals: Dict[V, Dict[D, int]] = {}  # 변수 -> 값 -> (변수 = 값) 리터럴
+        for variable in csp.variables:
+            if encoding == "direct":
+                self._encode_direct(variable)
+            else:
+                self._encode_order(variable)
+        for constraint in csp.weights:  # weights에는 추가된 모든 제약 조건이 있다.
+            self._encode_constraint(constraint)
+
+    def _encode_direct(self, variable: V) -> None:
+        literals: Dict[D, int] = {value: self.solver.new_variable()
+                                  for value in self.csp.domains[variable]}
+        self.literals[variable] = literals
+        self.solver.add_clause(literals.values())
+        self.at_most_one(list(literals.values()),
+                         "pairwise" if len(literals) <= 8 else "sequential")
+
+    def _encode_order(self, variable: V) -> None:
+        values: List[D] = sorted(self.csp.domains[variable])
+        # at_most[i]는 (변수 <= values[i]). 마지막 값은 항상 참이므로 변수를 두지 않는다.
+        at_most: List[int] = [self.solver.new_variable() for _ in values[:-1]]
+        for lower, upper in zip(at_most, at_most[1:]):
+            self.solver.add_clause([-lower, upper])
+        literals: Dict[D, int] = {}
+        for i, value in enumerate(values):
+            if len(values) == 1:
+                equal: int = self.solver.new_variable()
+                self.solver.add_clause([equal])
+            elif i == 0:
+                equal = at_most[0]
+            elif i == len(values) - 1:
+                equal = -at_most[-1]
+            else:
+                # equal <-> at_most[i] and not at_most[i - 1]
+                equal = self.solver.new_variable()
+                self.solver.add_clause([-equal, at_most[i]])
+                self.solver.add_clause([-equal, -at_most[i - 1]])
+                self.solver.add_clause([equal, -at_most[i], at_most[i - 1]])
+            literals[value] = equal
+        self.literals[variable] = literals
+
+    # 리터럴 중 많아야 하나만 참이다.
+    # pairwise: 모든 쌍에 (not a or not b). 절 O(n^2)개, 보조 변수 없음.
+    # sequential: 진너(Sinz)의 순차 카운터. s_i는 "처음 i+1개 중 하나가 참"이다. 절 O(n)개.
+    def at_most_one(self, literals: List[int], method: str) -> None:
+        if len(literals) < 2:
+            return
+        if method == "pairwise":
+            for i, first in enumerate(literals):
+                for second in literals[i + 1:]:
+                    self.solver.add_clause([-first, -second])
+            return
+        counters: List[int] = [self.solver.new_variable() for _ in literals[:-1]]
+        for i, literal in enumerate(literals):
+            if i < len(counters):
+                self.solver.add_clause([-literal, counters[i]])
+            if i > 0:
+                self.solver.add_clause([-literal, -counters[i - 1]])
+                if i < len(counters):
+                    self.solver.add_clause([-counters[i - 1], counters[i]])
+
+    def _encode_constraint(self, constraint: Constraint[V, D]) -> None:
+        if isinstance(constraint, AllDifferent):
+            by_value: Dict[D, List[int]] = {}
+            for variable in constraint.variables:
+                for value, literal in self.literals[variable].items():
+                    by_value.setdefault(value, []).append(literal)
+            for literals in by_value.values():
+                self.at_most_one(literals, self.alldifferent)
+            return
+        tables: List[TableConstraint[V, D]]
+        if isinstance(constraint, TableConstraint):
+            tables = [constraint]
+        else:
+            try:
+                tables = [tabulate(constraint, self.csp.domains, self.max_tuples)]
+            except ValueError as error:
+                if not self.pairwise:
+                    raise ValueError(f"{type(constraint).__name__}의 값 조합이 너무 많아서 CNF로 바꿀 수 "
+                                     f"없습니다. pairwise=True이면 변수 쌍별 테이블로 나눕니다.") from error
+                tables = pairwise_tables(constraint, self.csp.domains)
+        for table in tables:
+            self._encode_table(table)
+
+    def _encode_table(self, table: TableConstraint[V, D]) -> None:
+        domains: List[List[D]] = [self.csp.domains[v] for v in table.variables]
+        size: int = 1
+        for domain in domains:
+            size *= len(domain)
+        if size <= self.max_tuples:
+            # 허용되지 않는 값 조합 하나마다 그 조합을 금지하는 절
+            for combination in product(*domains):
+                if combination not in table.tuples:
+                    self.solver.add_clause(-self.literals[v][x]
+                                           for v, x in zip(table.variables, combination))
+            return
+        # 조합 전체를 나열하지 않는다. 허용되는 조합(도메인 밖의 값이 없는 것)마다 보조 변수 t를 두고
+        # t -> (변수 = 값)을 모든 위치에 추가한 뒤, t 중 하나는 참이어야 한다는 절을 추가한다.
+        chosen: List[int] = []
+        for combination in table.tuples:
+            if not all(x in self.literals[v] for v, x in zip(table.variables, combination)):
+                continue
+            selector: int = self.solver.new_variable()
+            for v, x in zip(table.variables, combination):
+                self.solver.add_clause([-selector, self.literals[v][x]])
+            chosen.append(selector)
+        self.solver.add_clause(chosen)
+
+    # 찾은 모델을 CSP의 assignment로 바꾼다.
+    def decode(self) -> Dict[V, D]:
+        solution: Dict[V, D] = {}
+        for variable, literals in self.literals.items():
+            for value, literal in literals.items():
+                if self.solver.value(literal):
+                    solution[variable] = value
+                    break
+        return solution
+
+
+# CSP를 CNF로 인코딩해서 CDCL SAT 솔버로 푼다. 답이 없으면 None을 반환하고,
+# max_conflicts나 timeout(초)을 넘기면 거짓으로 평가되는 TimeoutResult를 반환한다.
+# TimeoutResult의 통계에서 nodes는 결정 횟수, backtracks는 충돌 횟수다.
+# 찾은 모델은 원래 제약 조건으로 검사한다. pairwise=True로 느슨하게 인코딩한 제약 조건을
+# 어기면 그 값 조합을 금지하는 절을 추가하고 다시 푼다. 쌍별 테이블이 원래 제약 조건과 많이
+# 다르면(예: 여러 변수의 합) 다시 푸는 횟수가 조합의 수만큼 많아질 수 있다.
+def sat_solve(csp: CSP[V, D], encoding: str = "direct", alldifferent: str = "sequential",
+              max_conflicts: Optional[int] = None, timeout: Optional[float] = None,
+              max_tuples: int = 200000, pairwise: bool = False) -> Union[Dict[V, D], TimeoutResult, None]:
+    start: float = perf_counter()
+    cnf: CNFEncoding[V, D] = CNFEncoding(csp, encoding, alldifferent, max_tuples, pairwise)
+    while True:
+        remaining: Optional[float] = None if timeout is None else timeout - (perf_counter() - start)
+        # 다시 풀 때 solve()는 곧바로 모델을 찾으면 예산을 확인하지 않으므로 여기서 확인한다.
+        over: bool = (remaining is not None and remaining <= 0) or \
+            (max_conflicts is not None and cnf.solver.conflicts >= max_conflicts)
+        result: Optional[bool] = None if over else cnf.solver.solve(max_conflicts, remaining)
+        if result is None:
+            statistics: SearchStatistics = SearchStatistics(
+                nodes=cnf.solver.decisions, backtracks=cnf.solver.conflicts,
+                elapsed=perf_counter() - start)
+            reason: str = "nodes" if max_conflicts is not None and \
+                cnf.solver.conflicts >= max_conflicts else "timeout"
+            statistics.stopped = reason
+            return TimeoutResult(reason, statistics)
+        if not result:
+            return None
+        solution: Dict[V, D] = cnf.decode()
+        if all(csp.consistent(v, solution) for v in csp.variables):
+            return solution
+        for constraint in csp.weights:
+            if not constraint.satisfied(solution):
+                cnf.solver.add_clause(-cnf.literals[v][solution[v]] for v in constraint.variables)
+
+
+if __name__ == "__main__":
+    from benchmark import queens_csp, random_map_csp
+    from cryptarithm import cryptarithm_csp
+
+    # 퀸 제약 조건은 변수 쌍별 조건을 모은 것이므로 쌍별 테이블로 나누어도 같다.
+    problems: List[Tuple[str, CSP, bool]] = [
+        ("지도(지역 300, 경계 675)", random_map_csp(300, 675), False),
+        ("20-퀸", queens_csp(20), True),
+        ("SEND+MORE=MONEY", cryptarithm_csp("SEND+MORE=MONEY"), False)]
+    for name, problem, pairwise in problems:
+        for encoding in ("direct", "order"):
+            start: float = perf_counter()
+            solution = sat_solve(problem, encoding, pairwise=pairwise)
+            valid: bool = bool(solution) and problem.backtracking_search(solution) is not None
+            print(f"{name}, {encoding} 인코딩: {'답 있음' if valid else '답 없음'}, "
+                  f"{perf_counter() - start:.2f}초")
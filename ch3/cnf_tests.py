@@ -0,0 +1,92 @@
+# cnf_tests.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import Dict, List
+from itertools import product
+from random import Random
+from csp import CSP, Constraint
+from global_constraints import TableConstraint
+from send_more_money import SendMoreMoneyConstraint
+from cryptarithm import cryptarithm_csp
+from cnf import sat_solve
+
+SEND_MORE_MONEY: Dict[str, int] = {"S": 9, "E": 5, "N": 6, "D": 7, "M": 1, "O": 0, "R": 8, "Y": 2}
+
+
+def send_more_money_csp() -> CSP[str, int]:
+    letters: List[str] = ["S", "E", "N", "D", "M", "O", "R", "Y"]
+    digits: Dict[str, List[int]] = {letter: list(range(10)) for letter in letters}
+    digits["M"] = [1]
+    csp: CSP[str, int] = CSP(letters, digits)
+    csp.add_constraint(SendMoreMoneyConstraint(letters))
+    return csp
+
+
+# 세 변수의 합이 total이다. 쌍별 테이블로 나누면 아무것도 금지하지 않는다.
+class SumConstraint(Constraint[str, int]):
+    def __init__(self, variables: List[str], total: int) -> None:
+        super().__init__(variables)
+        self.total: int = total
+
+    def satisfied(self, assignment: Dict[str, int]) -> bool:
+        if any(v not in assignment for v in self.variables):
+            return True
+        return sum(assignment[v] for v in self.variables) == self.total
+
+
+class SATSolveTestCase(unittest.TestCase):
+    def test_send_more_money(self):
+        # 8개 변수의 제약 조건은 테이블로 바꿀 수 없으므로 쌍별 테이블로 몰래 느슨하게 풀면 안 된다.
+        with self.assertRaises(ValueError):
+            sat_solve(send_more_money_csp())
+        # 쌍별로 나누면 틀린 답을 돌려주지 않는다(예산 안에 못 찾으면 TimeoutResult).
+        csp: CSP[str, int] = send_more_money_csp()
+        result = sat_solve(csp, pairwise=True, max_conflicts=200)
+        self.assertTrue(not result or all(csp.consistent(v, result) for v in csp.variables))
+        # 전역 제약 조건으로 만든 같은 문제는 정확히 인코딩된다.
+        for encoding in ("direct", "order"):
+            solution = sat_solve(cryptarithm_csp("SEND+MORE=MONEY"), encoding)
+            self.assertEqual({k: v for k, v in solution.items() if not k.startswith("#")}, SEND_MORE_MONEY)
+
+    def test_pairwise_models_are_checked(self):
+        variables: List[str] = ["x", "y", "z"]
+        for total in range(11):
+            csp: CSP[str, int] = CSP(variables, {v: [0, 1, 2, 3] for v in variables})
+            csp.add_constraint(SumConstraint(variables, total))
+            solution = sat_solve(csp, max_tuples=10, pairwise=True)
+            if total <= 9:
+                self.assertEqual(sum(solution.values()), total)
+            else:
+                self.assertIsNone(solution)  # 모든 조합을 금지한 뒤에야 답이 없다는 것을 안다.
+
+    def test_large_table(self):
+        random: Random = Random(4)
+        variables: List[str] = ["a", "b", "c", "d"]
+        for _ in range(20):
+            domains: Dict[str, List[int]] = {v: list(range(6)) for v in variables}
+            tuples: List[tuple] = [t for t in product(range(7), repeat=4) if random.random() < 0.001]
+            csp: CSP[str, int] = CSP(variables, domains)
+            csp.add_constraint(TableConstraint(variables, tuples))
+            inside: List[tuple] = [t for t in tuples if max(t) < 6]
+            solution = sat_solve(csp, max_tuples=100)  # 6^4 > 100이므로 허용되는 조합으로 인코딩한다.
+            if inside:
+                self.assertIn(tuple(solution[v] for v in variables), inside)
+            else:
+                self.assertIsNone(solution)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# cryptarithm.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Dict, List, Optional, Tuple
+from time import perf_counter
+from csp import CSP, mrv
+from global_constraints import AllDifferent, LinearEquation
+
+
+# "SEND+MORE=MONEY" 같은 복면산을 더하는 단어 리스트와 결과 단어로 나눈다.
+def parse_cryptarithm(puzzle: str) -> Tuple[List[str], str]:
+    left, equals, right = puzzle.replace(" ", "").upper().partition("=")
+    addends: List[str] = left.split("+")
+    if not equals or not right or not all(addends) or \
+            not all(word.isalpha() and word.isascii() for word in addends + [right]):
+        raise ValueError(f"복면산 형식이 아닙니다: {puzzle}")
+    return addends, right
+
+
+# 복면산을 CSP로 만든다. 문자는 모두 다른 숫자(AllDifferent)이고, 자릿수마다
+# 받아올림(carry) 변수를 둔 등식을 세운다. 오른쪽에서 k번째 자리는 다음과 같다.
+#   (더하는 문자들의 합) + 받아올림[k] == 결과 문자 + 10 * 받아올림[k + 1]
+# 받아올림 변수의 이름은 "#1", "#2", ...이며 가장 큰 자리의 받아올림은 0이다.
+def cryptarithm_csp(puzzle: str) -> CSP[str, int]:
+    addends, result = parse_cryptarithm(puzzle)
+    letters: List[str] = []
+    for word in addends + [result]:
+        for letter in word:
+            if letter not in letters:
+                letters.append(letter)
+    if len(letters) > 10:
+        raise ValueError("서로 다른 문자가 10개보다 많습니다.")
+    width: int = max(len(word) for word in addends + [result])
+    if len(result) < max(len(word) for word in addends):
+        raise ValueError("결과 단어가 더하는 단어보다 짧습니다.")
+    domains: Dict[str, List[int]] = {}
+    for letter in letters:
+        leading: bool = any(word[0] == letter and len(word) > 1 for word in addends + [result])
+        domains[letter] = list(range(1 if leading else 0, 10))
+    carries: List[str] = [f"#{k}" for k in range(1, width)]
+    for carry in carries:
+        domains[carry] = list(range(len(addends)))
+    csp: CSP[str, int] = CSP(letters + carries, domains)
+    csp.add_constraint(AllDifferent(letters))
+    for k in range(width):
+        terms: Dict[str, int] = {}
+        for word in addends:
+            if k < len(word):
+                letter: str = word[-1 - k]
+                terms[letter] = terms.get(letter, 0) + 1
+        if k > 0:
+            terms[f"#{k}"] = terms.get(f"#{k}", 0) + 1
+        if k < len(result):
+            terms[result[-1 - k]] = terms.get(result[-1 - k], 0) - 1
+        if k + 1 < width:
+            terms[f"#{k + 1}"] = terms.get(f"#{k + 1}", 0) - 10
+        csp.add_constraint(LinearEquation(terms, 0))
+    return csp
+
+
+# 복면산을 풀어서 문자 -> 숫자를 반환한다(받아올림 변수는 뺀다).
+def solve_cryptarithm(puzzle: str) -> Optional[Dict[str, int]]:
+    solution: Optional[Dict[str, int]] = cryptarithm_csp(puzzle).backtracking_search(
+        select_variable=mrv)
+    if solution is None:
+        return None
+    return {letter: digit for letter, digit in solution.items() if not letter.startswith("#")}
+
+
+if __name__ == "__main__":
+    for puzzle in ["SEND+MORE=MONEY", "BASE+BALL=GAMES", "TO+GO=OUT",
+                   "CROSS+ROADS=DANGER", "SATURN+URANUS+NEPTUNE+PLUTO=PLANETS"]:
+        start: float = perf_counter()
+        solution: Optional[Dict[str, int]] = solve_cryptarithm(puzzle)
+        print(f"{puzzle}: {solution if solution is not None else '답을 찾을 수 없습니다!'} "
+              f"({perf_counter() - start:.3f}초)")
+    csp: CSP[str, int] = cryptarithm_csp("SEND+MORE=MONEY")
+    print(f"SEND+MORE=MONEY 답의 수: {csp.count_solutions()}")
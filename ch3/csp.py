@@ -13,8 +13,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Generic, TypeVar, Dict, List, Optional
+from __future__ import annotations
+from typing import Generic, TypeVar, Dict, List, Optional, Callable, Set, Iterator, Any, FrozenSet, Tuple, Union
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from time import perf_counter
 
 V = TypeVar('V')  # 변수(Variable) 타입
 D = TypeVar('D')  # 도메인(Domain) 타입
@@ -22,6 +26,9 @@ D = TypeVar('D')  # 도메인(Domain) 타입
 
 # 모든 제약 조건에 대한 베이스 클래스
 class Constraint(Generic[V, D], ABC):
+    incremental: bool = False  # 점진적 검사 지원 여부
+    propagates: bool = False  # 도메인 전파(propagate) 지원 여부
+
     # 제약 조건 변수
     def __init__(self, variables: List[V]) -> None:
         self.variables = variables
@@ -31,6 +38,51 @@ class Constraint(Generic[V, D], ABC):
     def satisfied(self, assignment: Dict[V, D]) -> bool:
         ...
 
+    # 위반 정도. 지역 탐색은 이 값의 합을 줄여나간다.
+    # 기본값은 위반 여부(0 또는 1)이며, 더 세밀하게 셀 수 있다면 오버라이드한다.
+    def conflicts(self, assignment: Dict[V, D]) -> int:
+        return 0 if self.satisfied(assignment) else 1
+
+    # variable과 관련된 위반 정도. 변수가 많은 제약 조건은 이 메서드를 오버라이드해야
+    # 지역 탐색이 실제로 충돌하는 변수를 고를 수 있다.
+    def variable_conflicts(self, variable: V, assignment: Dict[V, D]) -> int:
+        return self.conflicts(assignment)
+
+    # 도메인 전파. 현재 도메인에서 답이 될 수 없는 값을 지운 새 도메인 리스트를
+    # {변수: 줄어든 도메인} 형태로 반환하고, 답이 없다는 것을 알면 None을 반환한다.
+    # 전달된 도메인 리스트를 직접 변경하면 안 된다. 오버라이드하면 propagates를 True로 둔다.
+    def propagate(self, domains: Dict[V, List[D]], assignment: Dict[V, D]) -> Optional[Dict[V, List[D]]]:
+        return {}
+
+
+# 점진적(incremental) 검사를 지원하는 제약 조건의 베이스 클래스
+# 탐색 엔진은 값을 할당하고 되돌릴 때마다 제약 조건에 알려주고, 제약 조건은
+# 누적된 상태만으로 위반 여부를 판단하므로 전체 assignment를 다시 검사하지 않는다.
+# on_assign()과 on_unassign()은 항상 후입선출(LIFO) 순서로 짝지어 호출되며,
+# 위반 상태에서 다른 변수가 추가로 할당되는 일은 없다.
+class IncrementalConstraint(Constraint[V, D]):
+    incremental: bool = True
+
+    @abstractmethod
+    def on_assign(self, variable: V, value: D) -> None:
+        ...
+
+    @abstractmethod
+    def on_unassign(self, variable: V) -> None:
+        ...
+
+    @abstractmethod
+    def is_violated(self) -> bool:
+        ...
+
+
+# 변수 선택 휴리스틱: 할당되지 않은 변수 리스트에서 다음에 할당할 변수를 고른다.
+VariableSelector = Callable[['CSP[V, D]', List[V], Dict[V, D]], V]
+# 값 정렬 휴리스틱: 변수의 도메인 값을 시도할 순서대로 반환한다.
+ValueOrderer = Callable[['CSP[V, D]', V, Dict[V, D]], List[D]]
+# 진행 상황 콜백: 진행 중인 탐색의 통계를 받는다. False를 반환하면 탐색을 중단한다.
+ProgressCallback = Callable[['SearchStatistics'], Optional[bool]]
+
 
 # 제약 만족 문제는 타입 V의 (변수)와 범위를 나타내는 타입 D의 (도메인),
 # 특정 변수의 도메인이 유효한지 확인하는 (제약 조건)으로 구성된다.
@@ -39,8 +91,22 @@ class CSP(Generic[V, D]):
         self.variables: List[V] = variables  # 제약 조건을 확인할 변수
         self.domains: Dict[V, List[D]] = domains  # 각 변수의 도메인
         self.constraints: Dict[V, List[Constraint[V, D]]] = {}
+        self.neighbors: Dict[V, Set[V]] = {}  # 제약 조건을 공유하는 변수
+        self.weights: Dict[Constraint[V, D], int] = {}  # dom/wdeg 제약 조건 가중치
+        self._incremental: Dict[V, List[IncrementalConstraint[V, D]]] = {}
+        self._propagators: Dict[V, List[Constraint[V, D]]] = {}
+        # 진행 중인 탐색의 assignment (점진적 제약 조건의 상태가 이것을 따라간다)
+        self._assignment: Optional[Dict[V, D]] = None
+        self.statistics: SearchStatistics = SearchStatistics()  # 마지막 탐색의 통계
+        # 도메인 전파로 줄인 도메인을 되돌리기 위한 (변수, 이전 도메인, 이전 원인) 기록
+        self._trail: List[Tuple[V, List[D], FrozenSet[V]]] = []
+        # 변수 -> 현재 도메인에서 값을 지우게 만든 할당된 변수들(백점프의 충돌 집합에 들어간다)
+        self._reasons: Dict[V, FrozenSet[V]] = {}
         for variable in self.variables:
             self.constraints[variable] = []
+            self._incremental[variable] = []
+            self._propagators[variable] = []
+            self.neighbors[variable] = set()
             if variable not in self.domains:
                 raise LookupError(
                     "모든 변수에 도메인이 할당되어야 합니다.")
@@ -51,33 +117,568 @@ class CSP(Generic[V, D]):
                 raise LookupError("제약 조건 변수가 아닙니다.")
             else:
                 self.constraints[variable].append(constraint)
+                if constraint.incremental:
+                    self._incremental[variable].append(constraint)
+                if constraint.propagates:
+                    self._propagators[variable].append(constraint)
+                self.neighbors[variable].update(
+                    v for v in constraint.variables if v != variable)
+        self.weights[constraint] = 1
 
     # 주어진 변수의 모든 제약 조건을 검사하여 assignment 값이 일관적인지 확인한다.
     def consistent(self, variable: V, assignment: Dict[V, D]) -> bool:
+        return self._violated(variable, assignment) is None
+
+    # assignment를 위반하는 첫 번째 제약 조건을 반환한다(없으면 None).
+    # 탐색 중인 assignment라면 점진적 제약 조건의 누적 상태를 사용한다.
+    def _violated(self, variable: V, assignment: Dict[V, D]) -> Optional[Constraint[V, D]]:
+        tracked: bool = assignment is self._assignment
         for constraint in self.constraints[variable]:
-            if not constraint.satisfied(assignment):
+            if tracked and constraint.incremental:
+                if constraint.is_violated():
+                    return constraint
+            elif not constraint.satisfied(assignment):
+                return constraint
+        return None
+
+    # 변수에 값을 할당한다. 탐색 중인 assignment라면 점진적 제약 조건에 알린다.
+    def assign(self, variable: V, value: D, assignment: Dict[V, D]) -> None:
+        assignment[variable] = value
+        if assignment is self._assignment:
+            for constraint in self._incremental[variable]:
+                constraint.on_assign(variable, value)
+
+    # 변수의 할당을 되돌린다. assign()과 후입선출 순서로 짝지어 호출해야 한다.
+    def unassign(self, variable: V, assignment: Dict[V, D]) -> None:
+        del assignment[variable]
+        if assignment is self._assignment:
+            for constraint in reversed(self._incremental[variable]):
+                constraint.on_unassign(variable)
+
+    # 현재 assignment와 일관적인 변수의 도메인 값을 반환한다.
+    # 복사 비용을 피하기 위해 assignment를 잠시 변경했다가 되돌린다.
+    def legal_values(self, variable: V, assignment: Dict[V, D]) -> List[D]:
+        legal: List[D] = []
+        for value in self.domains[variable]:
+            self.assign(variable, value, assignment)
+            if self._violated(variable, assignment) is None:
+                legal.append(value)
+            self.unassign(variable, assignment)
+        return legal
+
+    # 아직 할당되지 않은 이웃 변수의 수(차수)
+    def degree(self, variable: V, assignment: Dict[V, D]) -> int:
+        return sum(1 for n in self.neighbors[variable] if n not in assignment)
+
+    # 첫 번째 답을 반환하고, 답이 없으면 None을 반환한다.
+    # timeout(초)이나 max_nodes(시도할 할당의 수)를 넘기거나 progress 콜백이 탐색을 중단하면
+    # 거짓으로 평가되는 TimeoutResult를 반환한다.
+    def backtracking_search(self, assignment: Optional[Dict[V, D]] = None,
+                            select_variable: Optional[VariableSelector] = None,
+                            order_values: Optional[ValueOrderer] = None,
+                            backjumping: bool = False,
+                            nogood_limit: int = 0,
+                            timeout: Optional[float] = None,
+                            max_nodes: Optional[int] = None,
+                            progress: Optional[ProgressCallback] = None,
+                            progress_interval: float = 1.0,
+                            forward_checking: Optional[bool] = None
+                            ) -> Union[Dict[V, D], TimeoutResult, None]:
+        solutions: Iterator[Dict[V, D]] = self.iter_solutions(
+            assignment, select_variable, order_values, timeout=timeout,
+            backjumping=backjumping, nogood_limit=nogood_limit, max_nodes=max_nodes,
+            progress=progress, progress_interval=progress_interval,
+            forward_checking=forward_checking)
+        try:
+            solution: Optional[Dict[V, D]] = next(solutions, None)
+        finally:
+            solutions.close()  # 탐색 상태를 즉시 정리한다.
+        if solution is None and self.statistics.stopped is not None:
+            return TimeoutResult(self.statistics.stopped, self.statistics)
+        return solution
+
+    # 모든 답을 하나씩 지연(lazy) 생성한다. 다음 답을 요청할 때 멈춘 곳에서 탐색을 재개한다.
+    # limit개의 답을 찾거나 timeout(초)이 지나거나 max_nodes개의 할당을 시도하면 멈춘다.
+    # 예산 때문에 멈췄는지는 statistics.stopped로 알 수 있다.
+    # progress 콜백은 대략 progress_interval초마다 탐색 통계를 받고, False를 반환하면 탐색을 중단한다.
+    # backjumping이면 충돌 지향 백점프(conflict-directed backjumping)를 사용하고,
+    # nogood_limit > 0이면 실패한 부분 할당(nogood)을 최대 그 개수만큼 기억해서 가지치기한다.
+    # nogood을 기억하려면 도메인 값이 해시 가능해야 한다.
+    # forward_checking이면 값을 할당할 때마다 이웃 변수의 도메인에서 일관적이지 않은 값을 지운다.
+    # None이면 도메인 크기를 보는 휴리스틱(mrv, dom_wdeg, lcv)을 쓸 때만 켠다.
+    def iter_solutions(self, assignment: Optional[Dict[V, D]] = None,
+                       select_variable: Optional[VariableSelector] = None,
+                       order_values: Optional[ValueOrderer] = None,
+                       limit: Optional[int] = None,
+                       timeout: Optional[float] = None,
+                       backjumping: bool = False,
+                       nogood_limit: int = 0,
+                       max_nodes: Optional[int] = None,
+                       progress: Optional[ProgressCallback] = None,
+                       progress_interval: float = 1.0,
+                       forward_checking: Optional[bool] = None) -> Iterator[Dict[V, D]]:
+        if nogood_limit > 0 and not backjumping:
+            raise ValueError("nogood은 백점프의 충돌 집합으로 만들어지므로 backjumping이 필요합니다.")
+        deadline: Optional[float] = None if timeout is None else perf_counter() + timeout
+        nogoods: Optional[NogoodStore[V, D]] = NogoodStore(nogood_limit) if nogood_limit > 0 else None
+        if forward_checking is None:
+            forward_checking = select_variable in (mrv, dom_wdeg) or order_values is lcv
+        found: int = 0
+        for solution in self._search(assignment, select_variable or first_unassigned,
+                                     order_values or domain_order, deadline,
+                                     backjumping, nogoods, max_nodes, progress, progress_interval,
+                                     forward_checking):
+            yield solution
+            found += 1
+            if limit is not None and found >= limit:
+                return
+
+    # 답의 개수를 센다. 제약 그래프의 연결 요소(connected component)는 서로 독립이므로
+    # 요소별로 센 답의 수를 곱한다. limit 또는 timeout으로 멈추면 하한값을 반환한다.
+    def count_solutions(self, limit: Optional[int] = None, timeout: Optional[float] = None) -> int:
+        deadline: Optional[float] = None if timeout is None else perf_counter() + timeout
+        total: int = 1
+        for component in self.connected_components():
+            subproblem: CSP[V, D] = self.subproblem(component)
+            if not any(subproblem.constraints.values()):
+                # 제약 조건이 없으면 도메인 크기의 곱이 답의 수다.
+                count: int = 1
+                for variable in component:
+                    count *= len(self.domains[variable])
+            else:
+                count = 0
+                for _ in subproblem._search(None, first_unassigned, domain_order, deadline,
+                                            False, None):
+                    count += 1
+                    if limit is not None and count >= limit:
+                        break
+            total *= count
+            if total == 0:
+                return 0
+        return total if limit is None else min(total, limit)
+
+    # 제약 조건을 공유하는 변수끼리 묶은 연결 요소를 변수 순서대로 반환한다.
+    def connected_components(self) -> List[List[V]]:
+        order: Dict[V, int] = {v: i for i, v in enumerate(self.variables)}
+        component_of: Dict[V, int] = {}
+        components: List[List[V]] = []
+        for variable in self.variables:
+            if variable in component_of:
+                continue
+            component: List[V] = [variable]
+            component_of[variable] = len(components)
+            for current in component:  # 너비 우선 탐색(리스트가 탐색 중에 늘어난다)
+                for neighbor in self.neighbors[current]:
+                    if neighbor not in component_of:
+                        component_of[neighbor] = len(components)
+                        component.append(neighbor)
+            components.append(sorted(component, key=order.__getitem__))
+        return components
+
+    # 주어진 변수와 그 변수들 사이의 제약 조건만으로 이루어진 CSP를 만든다.
+    def subproblem(self, variables: List[V]) -> CSP[V, D]:
+        csp: CSP[V, D] = CSP(variables, {v: self.domains[v] for v in variables})
+        members: Set[V] = set(variables)
+        added: Set[int] = set()
+        for variable in variables:
+            for constraint in self.constraints[variable]:
+                if id(constraint) not in added and all(v in members for v in constraint.variables):
+                    added.add(id(constraint))
+                    csp.add_constraint(constraint)
+        return csp
+
+    # 백트래킹 탐색 엔진. 답을 찾을 때마다 assignment의 복사본을 생성한다.
+    def _search(self, assignment: Optional[Dict[V, D]], select: VariableSelector,
+                order: ValueOrderer, deadline: Optional[float], backjumping: bool,
+                nogoods: Optional[NogoodStore[V, D]], max_nodes: Optional[int] = None,
+                progress: Optional[ProgressCallback] = None,
+                progress_interval: float = 1.0, forward: bool = False) -> Iterator[Dict[V, D]]:
+        statistics: SearchStatistics = SearchStatistics()
+        self.statistics = statistics
+        started: float = perf_counter()
+        # 예산이나 콜백이 있을 때만 주기적으로 시계를 보고 가장 깊은 부분 할당을 기록한다.
+        checking: bool = deadline is not None or max_nodes is not None or progress is not None
+        next_report: float = started + progress_interval
+        # 재귀와 assignment 복사 대신, 하나의 assignment를 변경하고 되돌린다.
+        # 호출자가 넘긴 assignment는 변경하지 않는다.
+        assignment = {} if assignment is None else dict(assignment)
+        # 할당되지 않은 변수는 한 번만 계산하고, 이후에는 점진적으로 갱신한다.
+        # 리스트의 끝에서 변수를 꺼내므로 변수 순서를 뒤집어서 저장한다.
+        unassigned: List[V] = [
+            v for v in reversed(self.variables) if v not in assignment]
+        # assignment는 모든 변수가 할당될 때 완료된다(기저 조건)
+        if not unassigned:
+            if all(self.consistent(v, assignment) for v in assignment):
+                yield assignment
+            return
+
+        self._begin(assignment)
+        try:
+            # 미리 할당된 값으로 도메인을 전파한다. 여기서 실패하면 답이 없다.
+            if not self._propagate([c for c in self.weights if c.propagates], assignment):
+                return
+            if forward:
+                # 처음에 한 번 모든 도메인을 합법적인 값으로 줄여 둔다. 이후에는 할당한 변수의
+                # 이웃만 다시 검사하면 된다.
+                for v in unassigned:
+                    self.domains[v] = self.legal_values(v, assignment)
+                    if not self.domains[v]:
+                        return
+            # 명시적인 스택으로 탐색하므로 파이썬 재귀 한도에 걸리지 않는다.
+            stack: List[_Frame] = [self._push(unassigned, assignment, select, order)]
+            depth: Dict[V, int] = {stack[0].variable: 0}  # 스택에 있는 변수의 깊이
+            stack[0].mark = len(self._trail)
+            iterations: int = 0
+            while stack:
+                iterations += 1
+                if checking and (iterations % 256 == 0 or (max_nodes is not None
+                                                           and statistics.nodes >= max_nodes)):
+                    now: float = perf_counter()
+                    statistics.depth = len(stack)
+                    statistics.elapsed = now - started
+                    if len(assignment) > len(statistics.best):
+                        statistics.best = dict(assignment)
+                    if max_nodes is not None and statistics.nodes >= max_nodes:
+                        statistics.stopped = "nodes"
+                        return
+                    if deadline is not None and now > deadline:
+                        statistics.stopped = "timeout"
+                        return
+                    if progress is not None and now >= next_report:
+                        next_report = now + progress_interval
+                        if progress(statistics) is False:
+                            statistics.stopped = "cancelled"
+                            return
+                frame: _Frame = stack[-1]
+                variable: V = frame.variable
+                if variable in assignment:  # 백트래킹으로 돌아왔다면 이전 값을 되돌린다.
+                    self._retract(frame, assignment)
+                # 현재 변수의 다음 후보 값 중 일관적인 값을 찾는다.
+                for value in frame.values:
+                    statistics.nodes += 1
+                    self.assign(variable, value, assignment)
+                    culprits: Optional[List[V]] = None  # 이 값을 실패하게 만든 변수
+                    if nogoods is not None:
+                        nogood: Optional[Nogood] = nogoods.match(variable, value, assignment)
+                        if nogood is not None:
+                            statistics.nogood_hits += 1
+                            culprits = [v for v, _ in nogood]
+                    if culprits is None:
+                        violated: Optional[Constraint[V, D]] = self._violated(
+                            variable, assignment)
+                        if violated is None:
+                            wiped_out: Optional[FrozenSet[V]] = \
+                                self._forward_check(variable, assignment) if forward else None
+                            if wiped_out is not None:
+                                culprits = list(wiped_out)
+                            elif self._propagate(self._propagators[variable], assignment, variable):
+                                break
+                            else:
+                                # 전파가 실패한 원인은 할당된 변수 전체로 본다(보수적인 충돌 집합).
+                                culprits = list(assignment)
+                        else:
+                            self.weights[violated] += 1  # 실패한 제약 조건의 가중치를 올린다.
+                            culprits = violated.variables
+                    if backjumping:
+                        frame.conflicts.update(v for v in culprits
+                                               if v != variable and v in assignment)
+                    self._retract(frame, assignment)
+                else:
+                    # 남은 값이 없으면 백트래킹한다.
+                    statistics.backtracks += 1
+                    stack.pop()
+                    self._pop(unassigned, frame)
+                    del depth[variable]
+                    if backjumping and not frame.solved:
+                        self._backjump(frame, stack, depth, unassigned, assignment,
+                                       nogoods, statistics)
+                    continue
+                if not unassigned:
+                    if backjumping:
+                        # 이 답 아래의 변수들은 실패해서 소진된 것이 아니므로
+                        # 충돌 집합으로 백점프하거나 nogood을 기록하면 안 된다.
+                        for solved in stack:
+                            solved.solved = True
+                    # 답을 내보낸 뒤, 다음 요청에서 마지막 변수의 다음 값부터 이어서 탐색한다.
+                    yield dict(assignment)
+                    continue
+                stack.append(self._push(unassigned, assignment, select, order))
+                depth[stack[-1].variable] = len(stack) - 1
+                stack[-1].mark = len(self._trail)
+        finally:
+            statistics.elapsed = perf_counter() - started
+            self._end(assignment)
+
+    # 충돌 지향 백점프: 소진된 변수의 충돌 집합에서 가장 깊은 변수로 되돌아간다.
+    # 그 사이의 변수는 실패 원인과 무관하므로 나머지 값을 시도하지 않는다.
+    # 충돌 집합의 현재 값들은 함께 답이 될 수 없으므로 nogood으로 기억한다.
+    def _backjump(self, exhausted: _Frame, stack: List[_Frame], depth: Dict[V, int],
+                  unassigned: List[V], assignment: Dict[V, D],
+                  nogoods: Optional[NogoodStore[V, D]], statistics: SearchStatistics) -> None:
+        conflicts: Set[V] = exhausted.conflicts
+        if nogoods is not None and conflicts:
+            nogoods.add(frozenset((v, assignment[v]) for v in conflicts))
+            statistics.nogoods_recorded += 1
+        # 미리 할당된 변수만 충돌 집합에 있으면 더 이상 답이 없다(스택을 모두 비운다).
+        target: int = max((depth[v] for v in conflicts if v in depth), default=-1)
+        while len(stack) > target + 1:
+            skipped: _Frame = stack.pop()
+            self._retract(skipped, assignment)
+            self._pop(unassigned, skipped)
+            del depth[skipped.variable]
+            statistics.backjumps += 1
+        if stack:
+            stack[-1].conflicts.update(v for v in conflicts if v != stack[-1].variable)
+
+    # 탐색을 시작한다. 점진적 제약 조건에 미리 할당된 값을 알린다.
+    def _begin(self, assignment: Dict[V, D]) -> None:
+        if self._assignment is not None:
+            raise RuntimeError("이 CSP는 이미 탐색 중입니다.")
+        self._assignment = assignment
+        for variable, value in assignment.items():
+            for constraint in self._incremental.get(variable, []):
+                constraint.on_assign(variable, value)
+        # 탐색 중에는 self.domains가 전파로 줄어든 현재 도메인을 가리키므로
+        # 휴리스틱도 줄어든 도메인을 본다. 원래 도메인 리스트는 변경하지 않는다.
+        self._original_domains: Dict[V, List[D]] = self.domains
+        self.domains = dict(self.domains)
+        self._trail = []
+        self._reasons = {variable: frozenset() for variable in self.variables}
+
+    # 탐색을 끝낸다. 할당의 역순으로 되돌려서 점진적 제약 조건을 초기 상태로 만든다.
+    def _end(self, assignment: Dict[V, D]) -> None:
+        for variable in reversed(list(assignment)):
+            self.unassign(variable, assignment)
+        self.domains = self._original_domains
+        self._trail = []
+        self._reasons = {}
+        self._assignment = None
+
+    # 프레임의 변수 할당과 그 뒤의 도메인 전파를 함께 되돌린다.
+    def _retract(self, frame: _Frame, assignment: Dict[V, D]) -> None:
+        self.unassign(frame.variable, assignment)
+        while len(self._trail) > frame.mark:
+            variable, values, reasons = self._trail.pop()
+            self.domains[variable] = values
+            self._reasons[variable] = reasons
+
+    # 큐의 제약 조건이 더 이상 도메인을 줄이지 못할 때까지 전파한다.
+    # 방금 할당한 변수가 있으면 그 도메인을 할당한 값 하나로 줄이고 시작한다.
+    # 제약 조건이 지운 값의 원인은 그 제약 조건의 할당된 변수와, 할당되지 않은 변수의
+    # 도메인을 이미 줄여 놓은 원인이다(전파는 줄어든 도메인을 보고 값을 지우기 때문이다).
+    def _propagate(self, queue: List[Constraint[V, D]], assignment: Dict[V, D],
+                   assigned: Optional[V] = None) -> bool:
+        if not queue:
+            return True
+        if assigned is not None:
+            self._trail.append((assigned, self.domains[assigned], self._reasons[assigned]))
+            self.domains[assigned] = [assignment[assigned]]
+        else:
+            for variable, value in assignment.items():
+                self.domains[variable] = [value]
+        queue = list(queue)
+        queued: Set[Constraint[V, D]] = set(queue)
+        while queue:
+            constraint: Constraint[V, D] = queue.pop()
+            queued.discard(constraint)
+            changes: Optional[Dict[V, List[D]]] = constraint.propagate(self.domains, assignment)
+            if changes is None:
                 return False
+            reason: Optional[FrozenSet[V]] = None
+            for variable, values in changes.items():
+                if len(values) == len(self.domains[variable]):
+                    continue
+                if not values:
+                    return False
+                if reason is None:
+                    reason = frozenset().union(*(
+                        (v,) if v in assignment else self._reasons[v] for v in constraint.variables))
+                self._trail.append((variable, self.domains[variable], self._reasons[variable]))
+                self.domains[variable] = values
+                self._reasons[variable] = self._reasons[variable] | reason
+                for other in self._propagators[variable]:
+                    if other is not constraint and other not in queued:
+                        queue.append(other)
+                        queued.add(other)
         return True
 
-    def backtracking_search(self, assignment: Dict[V, D] = {}) -> Optional[Dict[V, D]]:
-        # assignment는 모든 변수가 할당될 때 완료된다(기저 조건)
-        if len(assignment) == len(self.variables):
-            return assignment
+    # 전방 검사(forward checking): 방금 할당한 변수의 할당되지 않은 이웃에서 지금의 할당과
+    # 일관적이지 않은 값을 지운다. 다른 변수의 합법적인 값은 바뀌지 않으므로, 탐색 중에는
+    # 할당되지 않은 변수의 현재 도메인이 곧 합법적인 값이다. 도메인이 빈 이웃이 생기면
+    # 그 값들을 지운 원인(충돌 집합)을 반환하고, 아니면 None을 반환한다.
+    def _forward_check(self, variable: V, assignment: Dict[V, D]) -> Optional[FrozenSet[V]]:
+        for neighbor in self.neighbors[variable]:
+            if neighbor in assignment:
+                continue
+            kept: List[D] = []
+            violated: Set[Constraint[V, D]] = set()
+            for value in self.domains[neighbor]:
+                self.assign(neighbor, value, assignment)
+                constraint: Optional[Constraint[V, D]] = self._violated(neighbor, assignment)
+                self.unassign(neighbor, assignment)
+                if constraint is None:
+                    kept.append(value)
+                else:
+                    violated.add(constraint)
+            if not violated:
+                continue
+            self._trail.append((neighbor, self.domains[neighbor], self._reasons[neighbor]))
+            self.domains[neighbor] = kept
+            self._reasons[neighbor] = self._reasons[neighbor].union(
+                *([v for v in c.variables if v in assignment] for c in violated))
+            if not kept:
+                for constraint in violated:
+                    self.weights[constraint] += 1  # 도메인을 비운 제약 조건의 가중치를 올린다.
+                return self._reasons[neighbor]
+        return None
 
-        # 할당되지 않은 모든 변수를 가져온다.
-        unassigned: List[V] = [
-            v for v in self.variables if v not in assignment]
-
-        # 할당되지 않은 첫 번째 변수의 가능한 모든 도메인 값을 가져온다.
-        first: V = unassigned[0]
-        for value in self.domains[first]:
-            local_assignment = assignment.copy()
-            local_assignment[first] = value
-            # local_assignment 값이 일관적이면, 재귀 호출한다.
-            if self.consistent(first, local_assignment):
-                result: Optional[Dict[V, D]] = self.backtracking_search(
-                    local_assignment)
-                # 결과를 못찾았을 때, 백트래킹을 종료한다.
-                if result is not None:
-                    return result
+    # 휴리스틱으로 다음 변수를 고르고, 리스트의 끝과 교환하여 O(1)에 제거한다.
+    def _push(self, unassigned: List[V], assignment: Dict[V, D],
+              select: VariableSelector, order: ValueOrderer) -> _Frame:
+        variable: V = select(self, unassigned, assignment)
+        index: int = len(unassigned) - 1
+        if unassigned[index] != variable:
+            index = unassigned.index(variable)
+            unassigned[index], unassigned[-1] = unassigned[-1], unassigned[index]
+        unassigned.pop()
+        frame: _Frame = _Frame(variable, iter(order(self, variable, assignment)), index)
+        # 전파로 지워진 값은 시도하지 않으므로, 지운 원인을 처음부터 충돌 집합에 넣는다.
+        frame.conflicts.update(self._reasons[variable])
+        return frame
+
+    # 변수를 원래 위치로 되돌려서 상위 프레임의 리스트 순서를 유지한다.
+    @staticmethod
+    def _pop(unassigned: List[V], frame: _Frame) -> None:
+        unassigned.append(frame.variable)
+        unassigned[frame.index], unassigned[-1] = unassigned[-1], unassigned[frame.index]
+
+
+# 탐색 스택의 한 단계: 할당 중인 변수, 남은 후보 값, 할당되지 않은 리스트에서의 위치,
+# 백점프를 위한 충돌 집합(값을 실패하게 만든 이전 변수들), 이 단계 아래에서 답을 찾았는지 여부,
+# 되돌릴 도메인 전파 기록의 위치
+class _Frame:
+    __slots__ = ("variable", "values", "index", "conflicts", "solved", "mark")
+
+    def __init__(self, variable: Any, values: Iterator[Any], index: int) -> None:
+        self.variable = variable
+        self.values = values
+        self.index = index
+        self.conflicts: Set[Any] = set()
+        self.solved: bool = False
+        self.mark: int = 0  # 이 변수를 할당하기 전의 도메인 전파 기록 길이
+
+
+@dataclass
+class SearchStatistics:
+    nodes: int = 0  # 시도한 할당의 수
+    backtracks: int = 0  # 도메인이 소진된 횟수
+    backjumps: int = 0  # 백점프로 건너뛴 단계의 수
+    nogoods_recorded: int = 0
+    nogood_hits: int = 0  # nogood으로 가지치기한 횟수
+    elapsed: float = 0.0  # 걸린 시간(초)
+    # 아래 값은 timeout, max_nodes, progress를 줬을 때만 주기적으로 갱신된다.
+    depth: int = 0  # 마지막 점검 때의 탐색 깊이
+    best: Dict[Any, Any] = field(default_factory=dict)  # 점검 때 본 가장 깊은 부분 할당
+    stopped: Optional[str] = None  # 예산 때문에 멈춘 이유: "timeout", "nodes", "cancelled"
+
+
+# 예산 안에 답을 찾지 못했다는 결과. 답이 아니므로 거짓으로 평가된다.
+@dataclass
+class TimeoutResult:
+    reason: str  # "timeout", "nodes", "cancelled"
+    statistics: SearchStatistics
+
+    @property
+    def best(self) -> Dict[Any, Any]:
+        return self.statistics.best
+
+    def __bool__(self) -> bool:
+        return False
+
+
+Nogood = FrozenSet[Tuple[Any, Any]]  # 함께 답이 될 수 없는 (변수, 값) 쌍의 집합
+
+
+# 크기가 제한된 nogood 저장소. 가득 차면 가장 오랫동안 쓰이지 않은(LRU) nogood을 버린다.
+# 변수에 값을 할당할 때 그 (변수, 값)을 포함한 nogood만 확인하도록 색인을 유지한다.
+class NogoodStore(Generic[V, D]):
+    def __init__(self, limit: int) -> None:
+        self.limit: int = limit
+        self._nogoods: OrderedDict[Nogood, None] = OrderedDict()
+        self._index: Dict[Tuple[V, D], Set[Nogood]] = {}
+
+    def __len__(self) -> int:
+        return len(self._nogoods)
+
+    def add(self, nogood: Nogood) -> None:
+        if nogood in self._nogoods:
+            self._nogoods.move_to_end(nogood)
+            return
+        self._nogoods[nogood] = None
+        for pair in nogood:
+            self._index.setdefault(pair, set()).add(nogood)
+        if len(self._nogoods) > self.limit:
+            evicted, _ = self._nogoods.popitem(last=False)
+            for pair in evicted:
+                self._index[pair].discard(evicted)
+
+    # variable = value 할당으로 완성되는 nogood을 찾는다.
+    def match(self, variable: V, value: D, assignment: Dict[V, D]) -> Optional[Nogood]:
+        for nogood in self._index.get((variable, value), ()):
+            if all(v in assignment and assignment[v] == d for v, d in nogood):
+                self._nogoods.move_to_end(nogood)
+                return nogood
         return None
+
+
+# 기본 변수 선택: 변수 리스트 순서에서 할당되지 않은 첫 번째 변수
+def first_unassigned(csp: CSP[V, D], unassigned: List[V], assignment: Dict[V, D]) -> V:
+    return unassigned[-1]
+
+
+# MRV(Minimum Remaining Values): 남은 합법적인 값이 가장 적은 변수를 고른다.
+# 동점이면 할당되지 않은 이웃이 가장 많은 변수(차수 휴리스틱)를 고른다.
+# 남은 값은 전방 검사와 전파가 줄여 놓은 현재 도메인의 크기이므로 다시 검사하지 않는다.
+def mrv(csp: CSP[V, D], unassigned: List[V], assignment: Dict[V, D]) -> V:
+    smallest: int = min(len(csp.domains[variable]) for variable in unassigned)
+    candidates: List[V] = [variable for variable in unassigned if len(csp.domains[variable]) == smallest]
+    if len(candidates) == 1:
+        return candidates[0]
+    return max(candidates, key=lambda variable: csp.degree(variable, assignment))
+
+
+# dom/wdeg: 남은 값의 수(현재 도메인의 크기)를 실패한 제약 조건 가중치의 합으로 나눈 값이
+# 가장 작은 변수를 고른다.
+def dom_wdeg(csp: CSP[V, D], unassigned: List[V], assignment: Dict[V, D]) -> V:
+    best: V = unassigned[-1]
+    best_score: float = float("inf")
+    for variable in unassigned:
+        remaining: int = len(csp.domains[variable])
+        # 다른 할당되지 않은 변수가 있는 제약 조건의 가중치만 합산한다.
+        wdeg: int = sum(csp.weights[c] for c in csp.constraints[variable]
+                        if any(v != variable and v not in assignment for v in c.variables))
+        score: float = remaining / max(wdeg, 1)
+        if score < best_score:
+            best, best_score = variable, score
+    return best
+
+
+# 기본 값 순서: 도메인 순서
+def domain_order(csp: CSP[V, D], variable: V, assignment: Dict[V, D]) -> List[D]:
+    return csp.domains[variable]
+
+
+# LCV(Least Constraining Value): 이웃 변수의 선택지를 가장 적게 제거하는 값부터 시도한다.
+# 전방 검사가 줄여 놓은 현재 도메인만 본다. 변수의 도메인은 이미 합법적인 값이고,
+# 이웃은 현재 도메인에서 이 값이 지우는 값만 센다.
+def lcv(csp: CSP[V, D], variable: V, assignment: Dict[V, D]) -> List[D]:
+    neighbors: List[V] = [n for n in csp.neighbors[variable]
+                          if n not in assignment]
+    values: List[D] = csp.domains[variable]
+    ruled_out: List[int] = []
+    for value in values:
+        csp.assign(variable, value, assignment)
+        ruled_out.append(sum(len(csp.domains[n]) - len(csp.legal_values(n, assignment))
+                             for n in neighbors))
+        csp.unassign(variable, assignment)
+    return [values[i] for i in sorted(range(len(values)), key=ruled_out.__getitem__)]
@@ -0,0 +1,164 @@
+# csp_tests.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import Dict, List, Set, Tuple, Union
+from itertools import product
+from random import Random
+from csp import CSP, Constraint, SearchStatistics, TimeoutResult, mrv, dom_wdeg, lcv
+from global_constraints import AllDifferent, LinearEquation, TableConstraint
+from local_search_tests import clique_coloring
+
+
+# 두 변수가 forbidden에 있는 값 쌍을 가지면 안 된다. 전파하지 않는 보통의 제약 조건이다.
+class ForbiddenPairs(Constraint[int, int]):
+    def __init__(self, first: int, second: int, forbidden: Set[Tuple[int, int]]) -> None:
+        super().__init__([first, second])
+        self.forbidden: Set[Tuple[int, int]] = forbidden
+
+    def satisfied(self, assignment: Dict[int, int]) -> bool:
+        first, second = self.variables
+        if first not in assignment or second not in assignment:
+            return True
+        return (assignment[first], assignment[second]) not in self.forbidden
+
+
+# 이항 제약 조건과 전파하는 전역 제약 조건을 섞은 무작위 CSP
+def random_csp(random: Random) -> CSP[int, int]:
+    n: int = random.randint(3, 7)
+    k: int = random.randint(2, 3)
+    csp: CSP[int, int] = CSP(list(range(n)), {v: list(range(k)) for v in range(n)})
+    for _ in range(random.randint(1, 6)):
+        first, second = random.sample(range(n), 2)
+        csp.add_constraint(ForbiddenPairs(first, second, {
+            (x, y) for x in range(k) for y in range(k) if random.random() < 0.3}))
+    for _ in range(random.randint(0, 2)):
+        scope: List[int] = random.sample(range(n), random.randint(2, min(3, n)))
+        kind: int = random.randrange(3)
+        if kind == 0:
+            csp.add_constraint(AllDifferent(scope))
+        elif kind == 1:
+            csp.add_constraint(TableConstraint(scope, [t for t in product(range(k), repeat=len(scope))
+                                                       if random.random() < 0.5] or [(0,) * len(scope)]))
+        else:
+            csp.add_constraint(LinearEquation({v: random.choice([-2, -1, 1, 2]) for v in scope},
+                                              random.randint(-2, 3)))
+    return csp
+
+
+class BackjumpingTestCase(unittest.TestCase):
+    def test_propagated_values_enter_conflict_set(self):
+        # AllDifferent가 6의 도메인에서 지운 값의 원인(5)을 모르면 0까지 잘못 백점프해서 답을 놓친다.
+        csp: CSP[int, int] = CSP(list(range(7)), {v: [0, 1] for v in range(7)})
+        csp.add_constraint(ForbiddenPairs(4, 0, {(0, 1)}))
+        csp.add_constraint(ForbiddenPairs(2, 1, {(0, 1), (1, 0)}))
+        csp.add_constraint(ForbiddenPairs(6, 0, {(0, 1), (1, 0), (1, 1)}))
+        csp.add_constraint(AllDifferent([5, 6]))
+        self.assertIsNotNone(csp.backtracking_search())
+        solution = csp.backtracking_search(backjumping=True)
+        self.assertIsNotNone(solution)
+        self.assertTrue(all(csp.consistent(v, solution) for v in csp.variables))
+
+    def test_solution_counts_match(self):
+        random: Random = Random(7)
+        for _ in range(200):
+            csp: CSP[int, int] = random_csp(random)
+            expected: int = sum(1 for _ in csp.iter_solutions())
+            for select, order in [(None, None), (mrv, None), (dom_wdeg, lcv)]:
+                for options in [{"backjumping": True}, {"backjumping": True, "nogood_limit": 20}]:
+                    found: int = sum(1 for _ in csp.iter_solutions(select_variable=select,
+                                                                   order_values=order, **options))
+                    self.assertEqual(found, expected)
+
+
+class ForwardCheckingTestCase(unittest.TestCase):
+    # 전방 검사를 하면 할당되지 않은 변수의 현재 도메인이 곧 합법적인 값이어야 한다(mrv가 이것에 기댄다).
+    def test_domains_are_legal_values(self):
+        random: Random = Random(11)
+        for _ in range(100):
+            csp: CSP[int, int] = random_csp(random)
+
+            original: Dict[int, List[int]] = dict(csp.domains)
+
+            def checked_mrv(csp: CSP[int, int], unassigned: List[int], assignment: Dict[int, int]) -> int:
+                for v in unassigned:
+                    legal: List[int] = [x for x in original[v] if csp.consistent(v, {**assignment, v: x})]
+                    if any(c.propagates for c in csp.constraints[v]):
+                        self.assertTrue(set(csp.domains[v]) <= set(legal))  # 전파가 더 줄였을 수 있다.
+                    else:
+                        self.assertEqual(csp.domains[v], legal)
+                return mrv(csp, unassigned, assignment)
+
+            expected: int = sum(1 for _ in csp.iter_solutions())
+            found: int = sum(1 for _ in csp.iter_solutions(select_variable=checked_mrv, forward_checking=True))
+            self.assertEqual(found, expected)
+
+    def test_original_domains_restored(self):
+        csp: CSP[int, int] = random_csp(Random(5))
+        domains: Dict[int, List[int]] = {v: list(values) for v, values in csp.domains.items()}
+        list(csp.iter_solutions(select_variable=mrv, order_values=lcv))
+        self.assertEqual(csp.domains, domains)
+        self.assertEqual(sum(1 for _ in csp.iter_solutions(forward_checking=True)),
+                         sum(1 for _ in csp.iter_solutions()))
+
+
+class BudgetTestCase(unittest.TestCase):
+    # 8개 정점의 완전 그래프는 7색으로 칠할 수 없고, 순진한 백트래킹은 이것을 알아내는 데 아주 오래 걸린다.
+    def test_node_budget(self):
+        csp: CSP[int, int] = clique_coloring(8, 7)
+        result: Union[Dict[int, int], TimeoutResult, None] = csp.backtracking_search(max_nodes=1000)
+        self.assertIsInstance(result, TimeoutResult)
+        self.assertFalse(result)
+        self.assertEqual(result.reason, "nodes")
+        self.assertEqual(csp.statistics.stopped, "nodes")
+        self.assertGreaterEqual(csp.statistics.nodes, 1000)
+        self.assertLess(csp.statistics.nodes, 1000 + 7)  # 값 하나를 시도할 때마다 예산을 확인한다.
+        # 가장 깊었던 부분 할당은 제약 조건을 어기지 않는다.
+        self.assertTrue(result.best)
+        self.assertTrue(all(csp.consistent(v, result.best) for v in result.best))
+
+    def test_budget_not_reached(self):
+        csp: CSP[int, int] = clique_coloring(4, 3)
+        self.assertIsNone(csp.backtracking_search(max_nodes=10 ** 6))  # 예산 안에 답이 없다는 것을 알았다.
+        self.assertIsNone(csp.statistics.stopped)
+        self.assertIsInstance(clique_coloring(3, 3).backtracking_search(max_nodes=10 ** 6), dict)
+
+    def test_timeout(self):
+        result = clique_coloring(8, 7).backtracking_search(timeout=0)
+        self.assertIsInstance(result, TimeoutResult)
+        self.assertEqual(result.reason, "timeout")
+
+    def test_progress(self):
+        csp: CSP[int, int] = clique_coloring(8, 7)
+        reports: List[int] = []
+
+        def progress(statistics: SearchStatistics) -> None:
+            self.assertIs(statistics, csp.statistics)
+            reports.append(statistics.nodes)
+
+        result = csp.backtracking_search(max_nodes=5000, progress=progress, progress_interval=0)
+        self.assertEqual(result.reason, "nodes")
+        self.assertTrue(reports)
+        self.assertEqual(reports, sorted(reports))
+        # 콜백이 False를 반환하면 그 자리에서 멈춘다.
+        reports.clear()
+        result = csp.backtracking_search(progress=lambda statistics: reports.append(statistics.nodes) or False,
+                                         progress_interval=0)
+        self.assertEqual(result.reason, "cancelled")
+        self.assertEqual(len(reports), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+# decomposition.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar, Dict, List, Optional, Set, Tuple
+from multiprocessing import Pool
+from time import perf_counter
+from csp import CSP, VariableSelector, ValueOrderer
+
+V = TypeVar('V')  # 변수(Variable) 타입
+D = TypeVar('D')  # 도메인(Domain) 타입
+
+
+# 이항(binary) 제약 조건만 가진 변수 중 남은 이웃이 하나뿐인 변수(잎)를 반복해서 떼어낸다.
+# (잎, 부모) 쌍을 떼어낸 순서대로 반환한다. 트리 모양의 요소는 정점 하나만 남는다.
+def peel_tree_fringe(csp: CSP[V, D]) -> List[Tuple[V, V]]:
+    remaining: Dict[V, Set[V]] = {v: set(csp.neighbors[v]) for v in csp.variables}
+    peelable: Set[V] = {v for v in csp.variables
+                        if all(len(c.variables) <= 2 for c in csp.constraints[v])}
+    leaves: List[V] = [v for v in csp.variables if v in peelable and len(remaining[v]) == 1]
+    fringe: List[Tuple[V, V]] = []
+    while leaves:
+        leaf: V = leaves.pop()
+        if len(remaining[leaf]) != 1:
+            continue  # 이미 떼어냈거나 부모가 먼저 떼어져서 고립된 정점(요소의 뿌리)
+        parent: V = remaining[leaf].pop()
+        del remaining[leaf]
+        remaining[parent].discard(leaf)
+        fringe.append((leaf, parent))
+        if parent in peelable and len(remaining[parent]) == 1:
+            leaves.append(parent)
+    return fringe
+
+
+# 잎에서 부모 방향으로 방향성 호 일관성(directional arc consistency)을 적용한다.
+# 잎의 어떤 값과도 함께 만족될 수 없는 부모의 값을 지운다. 도메인이 비면 답이 없다.
+def _supported(csp: CSP[V, D], leaf: V, parent: V, leaf_value: D, parent_value: D) -> bool:
+    pair: Dict[V, D] = {leaf: leaf_value, parent: parent_value}
+    return all(c.satisfied(pair) for c in csp.constraints[leaf]
+               if all(v in pair for v in c.variables))
+
+
+def _solve_with_fringe(csp: CSP[V, D], select_variable: Optional[VariableSelector],
+                       order_values: Optional[ValueOrderer]) -> Optional[Dict[V, D]]:
+    fringe: List[Tuple[V, V]] = peel_tree_fringe(csp)
+    domains: Dict[V, List[D]] = {v: list(values) for v, values in csp.domains.items()}
+    for leaf, parent in fringe:
+        domains[parent] = [p for p in domains[parent]
+                           if any(_supported(csp, leaf, parent, l, p) for l in domains[leaf])]
+        if not domains[parent]:
+            return None
+    # 떼어내고 남은 중심부(core)만 백트래킹으로 푼다.
+    peeled: Set[V] = {leaf for leaf, _ in fringe}
+    core: CSP[V, D] = csp.subproblem([v for v in csp.variables if v not in peeled])
+    core.domains = {v: domains[v] for v in core.variables}
+    solution: Optional[Dict[V, D]] = core.backtracking_search(
+        select_variable=select_variable, order_values=order_values)
+    if solution is None:
+        return None
+    # 떼어낸 역순으로 잎에 값을 할당한다. 호 일관성 덕분에 백트래킹이 필요 없다.
+    for leaf, parent in reversed(fringe):
+        solution[leaf] = next(l for l in domains[leaf]
+                              if _supported(csp, leaf, parent, l, solution[parent]))
+    return solution
+
+
+def _solve_component(args: Tuple[CSP, Optional[VariableSelector], Optional[ValueOrderer]]) -> Optional[Dict]:
+    return _solve_with_fringe(*args)
+
+
+# 제약 그래프를 연결 요소로 나누어 각각 따로 풀고 결과를 합친다.
+# 각 요소의 트리 모양 가장자리는 호 일관성으로 미리 정리한 뒤 백트래킹 없이 할당한다.
+# parallel이면 요소를 여러 프로세스에서 푼다(제약 조건이 피클 가능해야 한다).
+def solve_by_components(csp: CSP[V, D], parallel: bool = False, processes: Optional[int] = None,
+                        select_variable: Optional[VariableSelector] = None,
+                        order_values: Optional[ValueOrderer] = None) -> Optional[Dict[V, D]]:
+    jobs = [(csp.subproblem(component), select_variable, order_values)
+            for component in csp.connected_components()]
+    solution: Dict[V, D] = {}
+    if parallel and len(jobs) > 1:
+        with Pool(processes) as pool:
+            for partial in pool.imap_unordered(_solve_component, jobs):
+                if partial is None:
+                    return None  # with 블록을 벗어나면서 남은 작업자를 종료한다.
+                solution.update(partial)
+    else:
+        for job in jobs:
+            partial = _solve_component(job)
+            if partial is None:
+                return None
+            solution.update(partial)
+    return {v: solution[v] for v in csp.variables}
+
+
+if __name__ == "__main__":
+    from benchmark import random_map_csp
+    from csp import mrv
+    # 경계가 적은 지도는 여러 연결 요소와 트리 모양 가장자리로 나뉜다.
+    problem: CSP[str, str] = random_map_csp(600, 660)
+    print(f"연결 요소 {len(problem.connected_components())}개, "
+          f"트리 가장자리 변수 {len(peel_tree_fringe(problem))}개")
+    start: float = perf_counter()
+    solution: Optional[Dict[str, str]] = solve_by_components(problem, select_variable=mrv)
+    print(f"요소 분해: {perf_counter() - start:.3f}초, "
+          f"{'답 있음' if solution is not None else '답 없음'}")
+    start = perf_counter()
+    solution = problem.backtracking_search(select_variable=mrv)
+    print(f"MRV 백트래킹: {perf_counter() - start:.3f}초, "
+          f"{'답 있음' if solution is not None else '답 없음'}")
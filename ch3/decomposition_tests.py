@@ -0,0 +1,91 @@
+# decomposition_tests.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import Dict, List, Optional, Set, Tuple
+from random import Random
+from csp import CSP
+from global_constraints import AllDifferent
+from csp_tests import ForbiddenPairs
+from decomposition import peel_tree_fringe, solve_by_components
+
+
+# variables의 앞쪽 cycle개가 사이클을 이루고 나머지 변수가 앞의 변수 하나에 매달리도록 제약 조건을 더한다.
+# cycle이 3보다 작으면 사이클 없이 트리 모양이다. 간선마다 금지된 값 쌍을 무작위로 둔다.
+def add_fringed_cycle(csp: CSP[int, int], random: Random, variables: List[int], cycle: int) -> None:
+    edges: List[Tuple[int, int]] = [(i, (i + 1) % cycle) for i in range(cycle)] if cycle >= 3 else []
+    edges += [(i, random.randrange(i)) for i in range(max(cycle, 1), len(variables))]
+    for first, second in edges:
+        k: int = len(csp.domains[variables[first]])
+        csp.add_constraint(ForbiddenPairs(variables[first], variables[second], {
+            (x, y) for x in range(k) for y in range(k) if random.random() < 0.4}))
+
+
+def fringed_cycle_csp(random: Random, cycle: int, fringe: int, k: int) -> CSP[int, int]:
+    n: int = max(cycle, 1) + fringe
+    csp: CSP[int, int] = CSP(list(range(n)), {v: list(range(k)) for v in range(n)})
+    add_fringed_cycle(csp, random, list(range(n)), cycle)
+    return csp
+
+
+class DecompositionTestCase(unittest.TestCase):
+    # 요소 분해가 찾은 답이 모든 제약 조건을 만족하고, 답이 있는지가 보통의 백트래킹과 같은지 확인한다.
+    def assert_solves(self, csp: CSP[int, int], parallel: bool = False) -> None:
+        solution: Optional[Dict[int, int]] = solve_by_components(csp, parallel=parallel, processes=2)
+        if csp.backtracking_search() is None:
+            self.assertIsNone(solution)
+        else:
+            self.assertIsNotNone(solution)
+            self.assertEqual(set(solution), set(csp.variables))
+            self.assertTrue(all(csp.consistent(v, solution) for v in csp.variables))
+
+    def test_tree(self):
+        random: Random = Random(1)
+        for _ in range(100):
+            csp: CSP[int, int] = fringed_cycle_csp(random, 0, random.randint(0, 12), random.randint(2, 3))
+            # 트리는 뿌리 하나만 남기고 모두 떼어낸다.
+            self.assertEqual(len(peel_tree_fringe(csp)), len(csp.variables) - 1)
+            self.assert_solves(csp)
+
+    def test_cycle_with_fringe(self):
+        random: Random = Random(2)
+        for _ in range(100):
+            cycle: int = random.randint(3, 6)
+            csp: CSP[int, int] = fringed_cycle_csp(random, cycle, random.randint(1, 10), random.randint(2, 3))
+            peeled: Set[int] = {leaf for leaf, _ in peel_tree_fringe(csp)}
+            self.assertEqual(peeled, set(range(cycle, len(csp.variables))))  # 사이클만 중심부로 남는다.
+            self.assert_solves(csp)
+        # 2색으로 칠하는 홀수 사이클은 가장자리와 상관없이 답이 없다.
+        odd: CSP[int, int] = CSP(list(range(5)), {v: [0, 1] for v in range(5)})
+        for first, second in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4)]:
+            odd.add_constraint(ForbiddenPairs(first, second, {(0, 0), (1, 1)}))
+        self.assertIsNone(solve_by_components(odd))
+
+    def test_components_and_global_constraints(self):
+        random: Random = Random(3)
+        for _ in range(20):
+            # 두 연결 요소 중 하나에 3개 변수의 AllDifferent를 더한다.
+            csp: CSP[int, int] = CSP(list(range(16)), {v: list(range(3)) for v in range(16)})
+            add_fringed_cycle(csp, random, list(range(8)), 4)
+            add_fringed_cycle(csp, random, list(range(8, 16)), 4)
+            csp.add_constraint(AllDifferent([8, 12, 15]))
+            # AllDifferent에 걸린 변수는 이항 제약 조건만 가진 것이 아니므로 떼어내지 않는다.
+            peeled: Set[int] = {leaf for leaf, _ in peel_tree_fringe(csp)}
+            self.assertFalse(peeled & {12, 15})
+            self.assert_solves(csp, parallel=random.random() < 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
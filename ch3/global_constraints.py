@@ -0,0 +1,238 @@
+# global_constraints.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar, Dict, List, Optional, Set, Tuple, Iterable, Sequence
+from csp import Constraint
+
+V = TypeVar('V')  # 변수(Variable) 타입
+D = TypeVar('D')  # 도메인(Domain) 타입
+
+
+# 모든 변수가 서로 다른 값을 가져야 하는 전역 제약 조건
+# 전파는 Régin의 방법을 따른다. 변수-값 이분 그래프의 최대 매칭을 찾고,
+# 어떤 최대 매칭에도 들어갈 수 없는 (변수, 값) 간선을 도메인에서 지운다.
+class AllDifferent(Constraint[V, D]):
+    propagates: bool = True
+
+    def __init__(self, variables: List[V]) -> None:
+        super().__init__(variables)
+
+    def satisfied(self, assignment: Dict[V, D]) -> bool:
+        values: List[D] = [assignment[v] for v in self.variables if v in assignment]
+        return len(set(values)) == len(values)
+
+    def propagate(self, domains: Dict[V, List[D]], assignment: Dict[V, D]) -> Optional[Dict[V, List[D]]]:
+        match: Optional[Dict[V, D]] = _maximum_matching(self.variables, domains)
+        if match is None:
+            return None  # 모든 변수에 서로 다른 값을 줄 수 없다.
+        # 매칭 간선은 변수 -> 값, 매칭이 아닌 간선은 값 -> 변수 방향인 그래프를 만든다.
+        # 매칭되지 않은 값에서 도달할 수 있거나(짝수 길이 교대 경로),
+        # 같은 강연결 요소에 속한(교대 사이클) 간선만 어떤 최대 매칭에 들어갈 수 있다.
+        matched_values: Set[D] = set(match.values())
+        graph: Dict[Tuple[int, object], List[Tuple[int, object]]] = {}
+        for variable in self.variables:
+            graph.setdefault((0, variable), []).append((1, match[variable]))
+            for value in domains[variable]:
+                if value != match[variable]:
+                    graph.setdefault((1, value), []).append((0, variable))
+        free: List[Tuple[int, object]] = [(1, value) for variable in self.variables
+                                          for value in domains[variable] if value not in matched_values]
+        reachable: Set[Tuple[int, object]] = set(free)
+        frontier: List[Tuple[int, object]] = list(reachable)
+        while frontier:
+            for node in graph.get(frontier.pop(), []):
+                if node not in reachable:
+                    reachable.add(node)
+                    frontier.append(node)
+        component: Dict[Tuple[int, object], int] = _strongly_connected_components(graph)
+        changes: Dict[V, List[D]] = {}
+        for variable in self.variables:
+            kept: List[D] = [value for value in domains[variable]
+                             if value == match[variable] or (1, value) in reachable
+                             or component.get((1, value)) == component[(0, variable)]]
+            if len(kept) < len(domains[variable]):
+                changes[variable] = kept
+        return changes
+
+
+# 증가 경로(augmenting path)로 변수-값 최대 매칭을 찾는다. 모든 변수를 매칭할 수 없으면 None
+def _maximum_matching(variables: List[V], domains: Dict[V, List[D]]) -> Optional[Dict[V, D]]:
+    owner: Dict[D, V] = {}  # 값 -> 그 값과 매칭된 변수
+    for root in variables:
+        # 명시적인 스택으로 root에서 시작하는 증가 경로를 찾는다.
+        parent: Dict[D, Optional[D]] = {}  # 경로에서 값 -> 그 값에 도달하기 전의 값
+        stack: List[Tuple[V, Optional[D]]] = [(root, None)]
+        end: Optional[D] = None
+        while stack and end is None:
+            variable, came_from = stack.pop()
+            for value in domains[variable]:
+                if value in parent:
+                    continue
+                parent[value] = came_from
+                if value not in owner:
+                    end = value
+                    break
+                stack.append((owner[value], value))
+        if end is None:
+            return None
+        # 경로를 거꾸로 따라가며 매칭을 뒤집는다.
+        value: Optional[D] = end
+        variable = root
+        path: List[D] = []
+        while value is not None:
+            path.append(value)
+            value = parent[value]
+        for value in reversed(path):
+            previous: Optional[V] = owner.get(value)
+            owner[value] = variable
+            if previous is None:
+                break
+            variable = previous
+    return {variable: value for value, variable in owner.items()}
+
+
+# 반복문으로 구현한 타잔(Tarjan)의 강연결 요소 알고리즘. 정점 -> 요소 번호를 반환한다.
+def _strongly_connected_components(graph: Dict) -> Dict:
+    index: Dict = {}
+    low: Dict = {}
+    on_stack: Set = set()
+    stack: List = []
+    component: Dict = {}
+    counter: int = 0
+    for start in graph:
+        if start in index:
+            continue
+        work: List[Tuple[object, int]] = [(start, 0)]
+        while work:
+            node, child = work.pop()
+            if child == 0:
+                index[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack.add(node)
+            successors: List = graph.get(node, [])
+            if child > 0:  # 방금 돌아온 자식의 low 값을 반영한다.
+                low[node] = min(low[node], low[successors[child - 1]])
+            while child < len(successors):
+                successor = successors[child]
+                if successor not in index:
+                    break
+                if successor in on_stack:
+                    low[node] = min(low[node], index[successor])
+                child += 1
+            if child < len(successors):
+                work.append((node, child + 1))
+                work.append((successors[child], 0))
+                continue
+            if low[node] == index[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component[member] = index[node]
+                    if member == node:
+                        break
+    return component
+
+
+# 선형 등식 sum(계수 * 변수) == constant
+# 전파는 경계(bounds) 추론이다. 다른 변수들이 낼 수 있는 최솟값과 최댓값으로
+# 각 변수가 가질 수 있는 값의 범위를 계산해서 범위 밖의 값을 지운다.
+class LinearEquation(Constraint[V, int]):
+    propagates: bool = True
+
+    def __init__(self, terms: Dict[V, int], constant: int = 0) -> None:
+        self.terms: Dict[V, int] = {v: c for v, c in terms.items() if c != 0}
+        self.constant: int = constant
+        super().__init__(list(self.terms))
+
+    def satisfied(self, assignment: Dict[V, int]) -> bool:
+        if any(v not in assignment for v in self.variables):
+            return True  # 모든 변수가 할당되어야 확인할 수 있다.
+        return sum(c * assignment[v] for v, c in self.terms.items()) == self.constant
+
+    def propagate(self, domains: Dict[V, List[int]], assignment: Dict[V, int]) -> Optional[Dict[V, List[int]]]:
+        current: Dict[V, List[int]] = {v: domains[v] for v in self.variables}
+        changes: Dict[V, List[int]] = {}
+        changed: bool = True
+        while changed:  # 한 변수를 줄이면 다른 변수의 범위도 줄어들 수 있다.
+            changed = False
+            bounds: Dict[V, Tuple[int, int]] = {}
+            for v, c in self.terms.items():
+                low, high = c * min(current[v]), c * max(current[v])
+                bounds[v] = (low, high) if low <= high else (high, low)
+            total_low: int = sum(low for low, _ in bounds.values())
+            total_high: int = sum(high for _, high in bounds.values())
+            if not total_low <= self.constant <= total_high:
+                return None
+            for v, c in self.terms.items():
+                low, high = bounds[v]
+                # c * v는 constant - (다른 변수 합의 범위) 안에 있어야 한다.
+                allowed_low: int = self.constant - (total_high - high)
+                allowed_high: int = self.constant - (total_low - low)
+                kept: List[int] = [x for x in current[v] if allowed_low <= c * x <= allowed_high]
+                if len(kept) < len(current[v]):
+                    if not kept:
+                        return None
+                    current[v] = changes[v] = kept
+                    changed = True
+                    break  # 범위를 다시 계산한다.
+        return changes
+
+
+# 허용되는 값 조합(tuple)을 나열한 테이블 제약 조건. 어떤 제약 조건이든 테이블로 바꿀 수 있다.
+# 전파는 일반화 호 일관성(GAC)이다. 현재 도메인 안에 있는 조합에 나타나지 않는 값을 지운다.
+class TableConstraint(Constraint[V, D]):
+    propagates: bool = True
+
+    def __init__(self, variables: List[V], tuples: Iterable[Sequence[D]]) -> None:
+        super().__init__(variables)
+        self.tuples: Set[Tuple[D, ...]] = {tuple(t) for t in tuples}
+        if any(len(t) != len(variables) for t in self.tuples):
+            raise ValueError("조합의 길이가 변수의 수와 다릅니다.")
+        # 위치별 값 -> 그 값을 포함한 조합 (부분 할당 검사와 전파에서 후보를 줄인다)
+        self._supports: List[Dict[D, List[Tuple[D, ...]]]] = [{} for _ in variables]
+        for t in self.tuples:
+            for position, value in enumerate(t):
+                self._supports[position].setdefault(value, []).append(t)
+
+    # 할당된 값과 맞는 조합이 하나라도 있는지 확인한다.
+    def satisfied(self, assignment: Dict[V, D]) -> bool:
+        fixed: List[Tuple[int, D]] = [(i, assignment[v]) for i, v in enumerate(self.variables)
+                                      if v in assignment]
+        if not fixed:
+            return True
+        if len(fixed) == len(self.variables):
+            return tuple(value for _, value in fixed) in self.tuples
+        candidates: List[Tuple[D, ...]] = min(
+            (self._supports[i].get(value, []) for i, value in fixed), key=len)
+        return any(all(t[i] == value for i, value in fixed) for t in candidates)
+
+    def propagate(self, domains: Dict[V, List[D]], assignment: Dict[V, D]) -> Optional[Dict[V, List[D]]]:
+        allowed: List[Set[D]] = [set(domains[v]) for v in self.variables]
+        # 도메인이 가장 작은 위치의 값을 포함한 조합만 보면 된다.
+        smallest: int = min(range(len(self.variables)), key=lambda i: len(allowed[i]))
+        supported: List[Set[D]] = [set() for _ in self.variables]
+        for value in allowed[smallest]:
+            for t in self._supports[smallest].get(value, []):
+                if all(x in allowed[i] for i, x in enumerate(t)):
+                    for i, x in enumerate(t):
+                        supported[i].add(x)
+        if not supported[smallest]:
+            return None
+        changes: Dict[V, List[D]] = {}
+        for i, variable in enumerate(self.variables):
+            if len(supported[i]) < len(allowed[i]):
+                changes[variable] = [x for x in domains[variable] if x in supported[i]]
+        return changes
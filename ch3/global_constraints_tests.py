@@ -0,0 +1,107 @@
+# global_constraints_tests.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import Dict, List, Optional, Set
+from itertools import product
+from random import Random
+from csp import Constraint
+from global_constraints import AllDifferent, LinearEquation, TableConstraint
+from cryptarithm import cryptarithm_csp, solve_cryptarithm
+
+
+# 현재 도메인의 모든 조합을 나열해서, 제약 조건을 만족하는 조합에 나타나는 값만 변수마다 모은다.
+def supported_values(constraint: Constraint[int, int], domains: Dict[int, List[int]]) -> Dict[int, Set[int]]:
+    supported: Dict[int, Set[int]] = {v: set() for v in constraint.variables}
+    for values in product(*(domains[v] for v in constraint.variables)):
+        if constraint.satisfied(dict(zip(constraint.variables, values))):
+            for v, value in zip(constraint.variables, values):
+                supported[v].add(value)
+    return supported
+
+
+def random_domains(variables: List[int], random: Random) -> Dict[int, List[int]]:
+    return {v: sorted(random.sample(range(5), random.randint(1, 4))) for v in variables}
+
+
+# 전파 결과를 적용한 도메인. 전파가 실패하면 None
+def propagated(constraint: Constraint[int, int], domains: Dict[int, List[int]]) -> Optional[Dict[int, List[int]]]:
+    changes: Optional[Dict[int, List[int]]] = constraint.propagate(domains, {})
+    if changes is None:
+        return None
+    result: Dict[int, List[int]] = dict(domains)
+    result.update(changes)
+    return result
+
+
+class GlobalConstraintTestCase(unittest.TestCase):
+    # 호 일관성(GAC) 전파는 답에 나타나는 값만 정확히 남겨야 한다.
+    def assert_arc_consistent(self, constraint: Constraint[int, int], domains: Dict[int, List[int]]) -> None:
+        supported: Dict[int, Set[int]] = supported_values(constraint, domains)
+        result: Optional[Dict[int, List[int]]] = propagated(constraint, domains)
+        if not all(supported.values()):
+            self.assertIsNone(result)
+            return
+        self.assertIsNotNone(result)
+        for v in constraint.variables:
+            self.assertEqual(set(result[v]), supported[v])
+
+    def test_all_different(self):
+        random: Random = Random(1)
+        for _ in range(300):
+            variables: List[int] = list(range(random.randint(2, 5)))
+            self.assert_arc_consistent(AllDifferent(variables), random_domains(variables, random))
+
+    def test_table(self):
+        random: Random = Random(2)
+        for _ in range(300):
+            variables: List[int] = list(range(random.randint(2, 4)))
+            tuples: List[List[int]] = [[random.randrange(5) for _ in variables]
+                                       for _ in range(random.randint(1, 12))]
+            self.assert_arc_consistent(TableConstraint(variables, tuples), random_domains(variables, random))
+
+    # 경계 추론은 답에 나타나는 값을 지우면 안 되지만, 나타나지 않는 값을 모두 지우지는 못한다.
+    # 다른 변수가 모두 값 하나로 정해졌다면 남은 변수의 값도 정확히 정해진다.
+    def test_linear_equation(self):
+        random: Random = Random(3)
+        for _ in range(500):
+            variables: List[int] = list(range(random.randint(2, 4)))
+            constraint: LinearEquation[int] = LinearEquation(
+                {v: random.choice([-3, -2, -1, 1, 2, 3]) for v in variables}, random.randint(-5, 10))
+            domains: Dict[int, List[int]] = random_domains(variables, random)
+            supported: Dict[int, Set[int]] = supported_values(constraint, domains)
+            result: Optional[Dict[int, List[int]]] = propagated(constraint, domains)
+            if result is None:
+                self.assertFalse(any(supported.values()))
+                continue
+            for v in variables:
+                self.assertTrue(supported[v] <= set(result[v]))
+                if all(len(domains[other]) == 1 for other in variables if other != v):
+                    self.assertEqual(set(result[v]), supported[v])
+
+
+class CryptarithmTestCase(unittest.TestCase):
+    def test_send_more_money(self):
+        self.assertEqual(solve_cryptarithm("SEND+MORE=MONEY"),
+                         {"S": 9, "E": 5, "N": 6, "D": 7, "M": 1, "O": 0, "R": 8, "Y": 2})
+        self.assertEqual(cryptarithm_csp("SEND+MORE=MONEY").count_solutions(), 1)
+
+    def test_no_solution(self):
+        # AA + BB = AB이면 A + 10 * B = 0인데, 첫 자리는 0일 수 없다.
+        self.assertIsNone(solve_cryptarithm("AA+BB=AB"))
+
+
+if __name__ == "__main__":
+    unittest.main()
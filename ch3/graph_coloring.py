@@ -0,0 +1,264 @@
+# graph_coloring.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar, Dict, List, Optional, Iterable, Mapping, NamedTuple, Tuple, Union, Set
+from heapq import heapify, heappush, heappop
+from random import Random
+from time import perf_counter
+from csp import SearchStatistics, TimeoutResult
+
+V = TypeVar('V')  # 정점 타입
+
+# 인접 구조: 정점 -> 이웃 정점들. 한쪽 방향만 적어도 되고, CSP.neighbors도 그대로 쓸 수 있다.
+Adjacency = Mapping[V, Iterable[V]]
+
+
+# 그래프 색칠 전용 엔진. 정점마다 제약 조건 객체를 두는 일반 CSP 대신
+# 정점을 0..n-1 정수로 바꾸고, 이웃이 쓴 색을 정수 비트셋으로 관리한다.
+class _Graph:
+    def __init__(self, adjacency: Adjacency) -> None:
+        self.vertices: List = list(adjacency)
+        index: Dict = {v: i for i, v in enumerate(self.vertices)}
+        for neighbors in list(adjacency.values()):
+            for u in neighbors:
+                if u not in index:
+                    index[u] = len(self.vertices)
+                    self.vertices.append(u)
+        sets: List[Set[int]] = [set() for _ in self.vertices]
+        for v, neighbors in adjacency.items():
+            i: int = index[v]
+            for u in neighbors:
+                j: int = index[u]
+                if i == j:
+                    raise ValueError(f"자기 자신과 이웃한 정점은 색칠할 수 없습니다: {v!r}")
+                sets[i].add(j)
+                sets[j].add(i)
+        self.neighbors: List[List[int]] = [list(s) for s in sets]
+        self.degree: List[int] = [len(s) for s in sets]
+
+    def decode(self, colors: List[int]) -> Dict:
+        return {v: colors[i] for i, v in enumerate(self.vertices)}
+
+
+def adjacency_from_edges(edges: Iterable[Tuple[V, V]]) -> Dict[V, List[V]]:
+    adjacency: Dict[V, List[V]] = {}
+    for u, v in edges:
+        adjacency.setdefault(u, []).append(v)
+        adjacency.setdefault(v, [])
+    return adjacency
+
+
+# 정점 n개, 간선 m개의 무작위 그래프(G(n, m))
+def random_graph(n: int, m: int, seed: int = 0) -> Dict[int, List[int]]:
+    random: Random = Random(seed)
+    edges: Set[Tuple[int, int]] = set()
+    while len(edges) < m:
+        u, v = random.randrange(n), random.randrange(n)
+        if u != v:
+            edges.add((min(u, v), max(u, v)))
+    adjacency: Dict[int, List[int]] = {v: [] for v in range(n)}
+    for u, v in edges:
+        adjacency[u].append(v)
+    return adjacency
+
+
+# DSATUR 탐욕 색칠: 이웃이 쓴 서로 다른 색의 수(포화도)가 가장 큰 정점부터,
+# 같으면 차수가 큰 정점부터, 쓸 수 있는 가장 작은 색을 칠한다. 색은 0부터 센다.
+# 힙을 쓰므로 O((V + E) log V)이고 정점 10^5개 그래프도 몇 초 안에 칠한다.
+def dsatur(adjacency: Adjacency) -> Dict[V, int]:
+    graph: _Graph = _Graph(adjacency)
+    return graph.decode(_dsatur(graph))
+
+
+def _dsatur(graph: _Graph) -> List[int]:
+    n: int = len(graph.vertices)
+    colors: List[int] = [-1] * n
+    used: List[int] = [0] * n  # 이웃이 쓴 색의 비트셋
+    saturation: List[int] = [0] * n
+    heap: List[Tuple[int, int, int]] = [(0, -graph.degree[v], v) for v in range(n)]
+    heapify(heap)
+    while heap:
+        negative, _, v = heappop(heap)
+        if colors[v] >= 0 or -negative != saturation[v]:
+            continue  # 이미 칠했거나 오래된 항목
+        mask: int = used[v]
+        color: int = (~mask & (mask + 1)).bit_length() - 1  # 비어 있는 가장 작은 색
+        colors[v] = color
+        bit: int = 1 << color
+        for u in graph.neighbors[v]:
+            if colors[u] < 0 and not used[u] & bit:
+                used[u] |= bit
+                saturation[u] += 1
+                heappush(heap, (-saturation[u], -graph.degree[u], u))
+    return colors
+
+
+# 정확히 k가지 색으로 칠하는 백트래킹. DSATUR 순서로 정점을 고르고, 이웃의 색 사용 횟수로
+# 비트셋을 유지해서 되돌릴 수 있게 한다. 아직 쓰지 않은 색은 하나만 시도한다(색 대칭 제거).
+# 답이 없으면 None, 예산을 넘기면 TimeoutResult를 반환한다.
+def color_graph(adjacency: Adjacency, k: int, timeout: Optional[float] = None,
+                max_nodes: Optional[int] = None) -> Union[Dict[V, int], TimeoutResult, None]:
+    graph: _Graph = _Graph(adjacency)
+    deadline: Optional[float] = None if timeout is None else perf_counter() + timeout
+    result: Union[List[int], TimeoutResult, None] = _exact(graph, k, deadline, max_nodes)
+    return graph.decode(result) if isinstance(result, list) else result
+
+
+def _exact(graph: _Graph, k: int, deadline: Optional[float],
+           max_nodes: Optional[int]) -> Union[List[int], TimeoutResult, None]:
+    n: int = len(graph.vertices)
+    statistics: SearchStatistics = SearchStatistics()
+    started: float = perf_counter()
+    if n == 0:
+        return []
+    if k <= 0:
+        return None
+    neighbors: List[List[int]] = graph.neighbors
+    degree: List[int] = graph.degree
+    colors: List[int] = [-1] * n
+    counts: List[List[int]] = [[0] * k for _ in range(n)]  # 정점 -> 색 -> 그 색인 이웃 수
+    used: List[int] = [0] * n
+    saturation: List[int] = [0] * n
+    heap: List[Tuple[int, int, int]] = [(0, -degree[v], v) for v in range(n)]
+    heapify(heap)
+
+    def select() -> int:
+        while True:
+            negative, _, v = heappop(heap)
+            if colors[v] < 0 and -negative == saturation[v]:
+                return v
+
+    def paint(v: int, color: int) -> None:
+        colors[v] = color
+        bit: int = 1 << color
+        for u in neighbors[v]:
+            counts[u][color] += 1
+            if counts[u][color] == 1:
+                used[u] |= bit
+                saturation[u] += 1
+                if colors[u] < 0:
+                    heappush(heap, (-saturation[u], -degree[u], u))
+
+    def erase(v: int) -> None:
+        color: int = colors[v]
+        colors[v] = -1
+        bit: int = 1 << color
+        for u in neighbors[v]:
+            counts[u][color] -= 1
+            if counts[u][color] == 0:
+                used[u] &= ~bit
+                saturation[u] -= 1
+                if colors[u] < 0:
+                    heappush(heap, (-saturation[u], -degree[u], u))
+        heappush(heap, (-saturation[v], -degree[v], v))
+
+    def candidates(v: int, highest: int) -> List[int]:
+        return [c for c in range(min(k, highest + 2)) if not used[v] >> c & 1]
+
+    # 프레임: [정점, 후보 색, 다음 후보 위치, 이 정점을 칠하기 전까지 쓴 가장 큰 색]
+    first: int = select()
+    stack: List[list] = [[first, candidates(first, -1), 0, -1]]
+    painted: int = 0
+    while stack:
+        frame: list = stack[-1]
+        v: int = frame[0]
+        if colors[v] >= 0:
+            erase(v)
+            painted -= 1
+        if frame[2] == len(frame[1]):
+            stack.pop()
+            heappush(heap, (-saturation[v], -degree[v], v))  # 다시 고를 수 있게 한다.
+            statistics.backtracks += 1
+            continue
+        color: int = frame[1][frame[2]]
+        frame[2] += 1
+        statistics.nodes += 1
+        if max_nodes is not None and statistics.nodes > max_nodes:
+            statistics.stopped = "nodes"
+        elif deadline is not None and statistics.nodes % 1024 == 0 and perf_counter() > deadline:
+            statistics.stopped = "timeout"
+        if statistics.stopped is not None:
+            statistics.elapsed = perf_counter() - started
+            return TimeoutResult(statistics.stopped, statistics)
+        paint(v, color)
+        painted += 1
+        if painted == n:
+            return colors
+        highest: int = max(frame[3], color)
+        w: int = select()
+        stack.append([w, candidates(w, highest), 0, highest])
+    return None
+
+
+# 탐욕적으로 찾은 클릭(clique)의 크기. 클릭의 정점은 모두 다른 색이어야 하므로 색 수의 하한이다.
+def _clique_bound(graph: _Graph, tries: int = 20) -> int:
+    sets: List[Set[int]] = [set(neighbors) for neighbors in graph.neighbors]
+    best: int = 1 if graph.vertices else 0
+    starts: List[int] = sorted(range(len(graph.vertices)), key=lambda v: -graph.degree[v])[:tries]
+    for start in starts:
+        clique: int = 1
+        candidates: Set[int] = set(sets[start])
+        while candidates:
+            v: int = max(candidates, key=lambda u: len(sets[u] & candidates))
+            clique += 1
+            candidates &= sets[v]
+        best = max(best, clique)
+    return best
+
+
+class ColoringResult(NamedTuple):
+    coloring: Dict  # 정점 -> 색(0부터)
+    colors: int  # 사용한 색의 수
+    lower_bound: int  # 증명된 색 수의 하한
+    optimal: bool  # colors == lower_bound인지(최소 색 수를 증명했는지)
+
+
+# 최소 색 수를 찾는다. DSATUR로 상한을, 탐욕 클릭으로 하한을 구한 뒤, 하한부터 k를 하나씩
+# 늘리며 정확한 탐색으로 k색 색칠을 찾는다. 첫 번째로 성공한 k가 최소 색 수다.
+# timeout을 넘기면 그때까지의 가장 좋은 색칠과 증명된 하한을 반환한다.
+def minimum_coloring(adjacency: Adjacency, timeout: Optional[float] = None,
+                     max_nodes: Optional[int] = None) -> ColoringResult:
+    graph: _Graph = _Graph(adjacency)
+    deadline: Optional[float] = None if timeout is None else perf_counter() + timeout
+    best: List[int] = _dsatur(graph)
+    upper: int = max(best, default=-1) + 1
+    lower: int = _clique_bound(graph)
+    for k in range(lower, upper):
+        result: Union[List[int], TimeoutResult, None] = _exact(graph, k, deadline, max_nodes)
+        if isinstance(result, TimeoutResult):
+            return ColoringResult(graph.decode(best), upper, lower, False)
+        if result is not None:
+            return ColoringResult(graph.decode(result), k, k, True)
+        lower = k + 1  # k색으로는 칠할 수 없다.
+    return ColoringResult(graph.decode(best), upper, upper, True)
+
+
+def is_proper(adjacency: Adjacency, coloring: Dict[V, int]) -> bool:
+    return all(coloring[v] != coloring[u] for v, neighbors in adjacency.items() for u in neighbors)
+
+
+if __name__ == "__main__":
+    for n, m in [(1000, 2500), (100000, 250000)]:
+        graph: Dict[int, List[int]] = random_graph(n, m)
+        start: float = perf_counter()
+        coloring: Dict[int, int] = dsatur(graph)
+        print(f"DSATUR(정점 {n}, 간선 {m}): 색 {max(coloring.values()) + 1}개, "
+              f"{perf_counter() - start:.2f}초, {'올바름' if is_proper(graph, coloring) else '틀림'}")
+    for n, m in [(100, 250), (100, 450), (1000, 2500)]:
+        start = perf_counter()
+        result: ColoringResult = minimum_coloring(random_graph(n, m), timeout=5)
+        print(f"최소 색칠(정점 {n}, 간선 {m}): 색 {result.colors}개 "
+              f"({'최소' if result.optimal else f'하한 {result.lower_bound}'}), "
+              f"{perf_counter() - start:.2f}초")
@@ -0,0 +1,70 @@
+# graph_coloring_tests.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import Dict, List
+from itertools import product
+from random import Random
+from graph_coloring import (random_graph, adjacency_from_edges, dsatur, color_graph, minimum_coloring,
+                            is_proper, ColoringResult)
+
+
+# 색의 수를 0부터 늘리며 모든 색칠을 나열해서 최소 색 수(chromatic number)를 구한다.
+def chromatic_number(adjacency: Dict[int, List[int]]) -> int:
+    vertices: List[int] = list(adjacency)
+    k: int = 0
+    while not any(is_proper(adjacency, dict(zip(vertices, colors)))
+                  for colors in product(range(k), repeat=len(vertices))):
+        k += 1
+    return k
+
+
+class GraphColoringTestCase(unittest.TestCase):
+    def assert_coloring(self, adjacency: Dict[int, List[int]], coloring: Dict[int, int], k: int) -> None:
+        self.assertEqual(set(coloring), set(adjacency))
+        self.assertTrue(is_proper(adjacency, coloring))
+        self.assertTrue(all(0 <= color < k for color in coloring.values()))
+
+    def test_matches_brute_force(self):
+        random: Random = Random(4)
+        for seed in range(150):
+            n: int = random.randint(1, 7)
+            adjacency: Dict[int, List[int]] = random_graph(n, random.randint(0, n * (n - 1) // 2), seed)
+            chi: int = chromatic_number(adjacency)
+            result: ColoringResult = minimum_coloring(adjacency)
+            self.assertEqual((result.colors, result.lower_bound, result.optimal), (chi, chi, True))
+            self.assert_coloring(adjacency, result.coloring, chi)
+            self.assert_coloring(adjacency, color_graph(adjacency, chi), chi)
+            self.assertIsNone(color_graph(adjacency, chi - 1))  # 최소 색 수보다 적은 색으로는 칠할 수 없다.
+            greedy: Dict[int, int] = dsatur(adjacency)
+            self.assert_coloring(adjacency, greedy, max(greedy.values()) + 1)
+            self.assertGreaterEqual(max(greedy.values()) + 1, chi)
+
+    def test_known_graphs(self):
+        # 홀수 사이클은 3색, 페테르센 그래프도 3색이다.
+        cycle: Dict[int, List[int]] = adjacency_from_edges((i, (i + 1) % 5) for i in range(5))
+        petersen: Dict[int, List[int]] = adjacency_from_edges(
+            [(i, (i + 1) % 5) for i in range(5)] + [(i, i + 5) for i in range(5)] +
+            [(5 + i, 5 + (i + 2) % 5) for i in range(5)])
+        for graph in (cycle, petersen):
+            self.assertEqual(minimum_coloring(graph).colors, 3)
+            self.assertIsNone(color_graph(graph, 2))
+        self.assertEqual(minimum_coloring({}).colors, 0)
+        with self.assertRaises(ValueError):
+            dsatur({0: [0]})  # 자기 루프
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+# local_search.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar, Generic, Dict, List, Optional, Tuple, NamedTuple
+from random import Random
+from time import perf_counter
+from csp import CSP, Constraint
+
+V = TypeVar('V')  # 변수(Variable) 타입
+D = TypeVar('D')  # 도메인(Domain) 타입
+
+
+class LocalSearchResult(NamedTuple):
+    assignment: Dict  # 찾은 것 중 가장 좋은(위반이 가장 적은) 완전 할당
+    conflicts: int  # 0이면 답이다.
+    steps: int
+    restarts: int
+
+
+# 완전 할당 하나를 고쳐나가는 지역 탐색의 상태
+# 제약 조건마다 위반 정도를 저장해두고, 변수가 바뀌면 그 변수의 제약 조건만 다시 센다.
+class _State(Generic[V, D]):
+    def __init__(self, csp: CSP[V, D], assignment: Dict[V, D]) -> None:
+        self.csp: CSP[V, D] = csp
+        self.assignment: Dict[V, D] = assignment
+        self.constraint_conflicts: Dict[Constraint[V, D], int] = {}
+        self.variable_conflicts: Dict[V, int] = {v: 0 for v in csp.variables}
+        self.total: int = 0
+        for constraint in csp.weights:  # 모든 제약 조건 (추가된 순서)
+            count: int = constraint.conflicts(assignment)
+            self.constraint_conflicts[constraint] = count
+            self.total += count
+            for variable in constraint.variables:
+                self.variable_conflicts[variable] += count
+        # 충돌하는 변수를 O(1)에 무작위로 고를 수 있도록 리스트와 위치를 함께 관리한다.
+        self.conflicted: List[V] = []
+        self.position: Dict[V, int] = {}
+        for variable, count in self.variable_conflicts.items():
+            if count > 0:
+                self._add(variable)
+
+    def _add(self, variable: V) -> None:
+        if variable not in self.position:
+            self.position[variable] = len(self.conflicted)
+            self.conflicted.append(variable)
+
+    def _discard(self, variable: V) -> None:
+        index: Optional[int] = self.position.pop(variable, None)
+        if index is not None:
+            last: V = self.conflicted.pop()
+            if index < len(self.conflicted):
+                self.conflicted[index] = last
+                self.position[last] = index
+
+    # 충돌하는 변수를 무작위로 고른다. 여러 변수에 걸친 제약 조건은 변수 단위로
+    # 다시 확인해서 실제로 충돌하는 변수를 고른다(몇 번 시도한 뒤에는 그대로 받아들인다).
+    def pick(self, random: Random) -> V:
+        variable: V = random.choice(self.conflicted)
+        for _ in range(len(self.conflicted)):
+            if any(c.variable_conflicts(variable, self.assignment) > 0
+                   for c in self.csp.constraints[variable]):
+                break
+            variable = random.choice(self.conflicted)
+        return variable
+
+    # 변수에 value를 할당했을 때 그 변수의 제약 조건 위반 합
+    def score(self, variable: V, value: D) -> int:
+        previous: D = self.assignment[variable]
+        self.assignment[variable] = value
+        total: int = sum(c.conflicts(self.assignment) for c in self.csp.constraints[variable])
+        self.assignment[variable] = previous
+        return total
+
+    def change(self, variable: V, value: D) -> None:
+        self.assignment[variable] = value
+        for constraint in self.csp.constraints[variable]:
+            count: int = constraint.conflicts(self.assignment)
+            delta: int = count - self.constraint_conflicts[constraint]
+            if delta == 0:
+                continue
+            self.constraint_conflicts[constraint] = count
+            self.total += delta
+            for other in constraint.variables:
+                self.variable_conflicts[other] += delta
+                if self.variable_conflicts[other] > 0:
+                    self._add(other)
+                else:
+                    self._discard(other)
+
+
+# 최소 충돌(min-conflicts) 지역 탐색에 금지(tabu) 목록을 더한 솔버
+# 충돌하는 변수를 무작위로 골라서 위반이 가장 적어지는 값으로 바꾼다. 최근에 바꾼
+# (변수, 값)은 tabu_tenure 단계 동안 다시 고르지 않지만, 지금까지의 최선보다 나아진다면 허용한다.
+# max_steps 단계 동안 답을 찾지 못하면 무작위 할당으로 다시 시작하고, time_budget(초)이
+# 지나거나 max_restarts번 다시 시작해도 답이 없으면 지금까지 찾은 가장 좋은 할당을 반환한다.
+# 답이 없는 CSP에서도 끝나도록 max_restarts의 기본값은 유한하다. None이면 time_budget이 필요하다.
+def min_conflicts(csp: CSP[V, D], max_steps: int = 10000, tabu_tenure: int = 10,
+                  time_budget: Optional[float] = None, max_restarts: Optional[int] = 100,
+                  seed: Optional[int] = None) -> LocalSearchResult:
+    if max_steps < 1:
+        raise ValueError("max_steps는 1 이상이어야 합니다.")
+    if max_restarts is None and time_budget is None:
+        raise ValueError("답이 없으면 끝나지 않으므로 max_restarts나 time_budget이 필요합니다.")
+    random: Random = Random(seed)
+    deadline: Optional[float] = None if time_budget is None else perf_counter() + time_budget
+    best: Optional[Dict[V, D]] = None
+    best_conflicts: int = -1
+    steps: int = 0
+    restarts: int = 0
+    while True:
+        state: _State[V, D] = _State(csp, {v: random.choice(csp.domains[v]) for v in csp.variables})
+        tabu: Dict[Tuple[V, D], int] = {}  # (변수, 값) -> 다시 고를 수 있는 단계
+        for step in range(max_steps):
+            if best is None or state.total < best_conflicts:
+                best, best_conflicts = dict(state.assignment), state.total
+            if state.total == 0 or (deadline is not None and perf_counter() > deadline):
+                return LocalSearchResult(best, best_conflicts, steps, restarts)
+            steps += 1
+            variable: V = state.pick(random)
+            current: int = state.variable_conflicts[variable]
+            candidates: List[D] = []
+            candidate_score: Optional[int] = None
+            for value in csp.domains[variable]:
+                if value == state.assignment[variable]:
+                    continue
+                score: int = state.score(variable, value)
+                aspiration: bool = state.total - current + score < best_conflicts
+                if tabu.get((variable, value), 0) > step and not aspiration:
+                    continue
+                if candidate_score is None or score < candidate_score:
+                    candidates, candidate_score = [value], score
+                elif score == candidate_score:
+                    candidates.append(value)
+            if not candidates:
+                continue
+            tabu[(variable, state.assignment[variable])] = step + tabu_tenure
+            state.change(variable, random.choice(candidates))
+        # 마지막 단계에서 바꾼 할당은 반복문 안에서 비교하지 못했다.
+        if best is None or state.total < best_conflicts:
+            best, best_conflicts = dict(state.assignment), state.total
+        if best_conflicts == 0 or (deadline is not None and perf_counter() > deadline):
+            break
+        if max_restarts is not None and restarts >= max_restarts:
+            break
+        restarts += 1
+    assert best is not None
+    return LocalSearchResult(best, best_conflicts, steps, restarts)
+
+
+if __name__ == "__main__":
+    from benchmark import random_map_csp
+    from queens import QueensConstraint
+    start: float = perf_counter()
+    result: LocalSearchResult = min_conflicts(random_map_csp(2000, 3000), max_steps=200000,
+                                              time_budget=60, seed=1)
+    print(f"지도 색칠(지역 2000, 경계 3000): 위반 {result.conflicts}, 단계 {result.steps}, "
+          f"재시작 {result.restarts}, {perf_counter() - start:.2f}초")
+    columns: List[int] = list(range(1, 21))
+    queens: CSP[int, int] = CSP(columns, {column: list(range(1, 21)) for column in columns})
+    queens.add_constraint(QueensConstraint(columns))
+    result = min_conflicts(queens, time_budget=10, seed=1)
+    print(f"20-퀸: 위반 {result.conflicts}, {result.assignment}")
@@ -0,0 +1,56 @@
+# local_search_tests.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import List
+from csp import CSP
+from map_coloring import MapColoringConstraint
+from local_search import min_conflicts, LocalSearchResult
+
+
+# 정점 n개의 완전 그래프를 k색으로 칠하는 CSP. n > k이면 답이 없다.
+def clique_coloring(n: int, k: int) -> CSP[int, int]:
+    vertices: List[int] = list(range(n))
+    csp: CSP[int, int] = CSP(vertices, {v: list(range(k)) for v in vertices})
+    for a in vertices:
+        for b in vertices[a + 1:]:
+            csp.add_constraint(MapColoringConstraint(a, b))
+    return csp
+
+
+class MinConflictsTestCase(unittest.TestCase):
+    def test_unsatisfiable_terminates(self):
+        result: LocalSearchResult = min_conflicts(clique_coloring(4, 3), max_steps=20, seed=0)
+        self.assertEqual(result.conflicts, 1)  # 가장 좋은 할당도 한 쌍은 같은 색이다.
+        self.assertEqual(result.restarts, 100)  # 처음 실행과 다시 시작한 100번
+        self.assertEqual(result.steps, 101 * 20)
+        result = min_conflicts(clique_coloring(4, 3), max_steps=20, max_restarts=0, seed=0)
+        self.assertEqual((result.restarts, result.steps), (0, 20))
+
+    def test_solution_found_on_last_step(self):
+        for seed in range(20):
+            result: LocalSearchResult = min_conflicts(clique_coloring(2, 2), max_steps=1, seed=seed)
+            self.assertEqual(result.conflicts, 0)
+            self.assertEqual(result.restarts, 0)
+
+    def test_invalid_budget(self):
+        with self.assertRaises(ValueError):
+            min_conflicts(clique_coloring(2, 2), max_steps=0)
+        with self.assertRaises(ValueError):
+            min_conflicts(clique_coloring(2, 2), max_restarts=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from csp import Constraint, CSP
+from graph_coloring import minimum_coloring
 from typing import Dict, List, Optional
 
 
@@ -58,3 +59,6 @@ if __name__ == "__main__":
         print("답이 없습니다!")
     else:
         print(solution)
+    print(f"가능한 색칠 방법의 수: {csp.count_solutions()}")
+    # 큰 그래프는 전용 그래프 색칠 엔진을 쓴다. CSP의 이웃 정보를 인접 구조로 넘길 수 있다.
+    print(f"필요한 최소 색 수: {minimum_coloring(csp.neighbors).colors}")
@@ -0,0 +1,405 @@
+# model.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import TypeVar, Dict, List, Optional, Any, Tuple, Set, Union
+from itertools import product, combinations
+from time import perf_counter
+import json
+from csp import CSP, Constraint, IncrementalConstraint
+from global_constraints import AllDifferent, LinearEquation, TableConstraint
+
+V = TypeVar('V')  # 변수(Variable) 타입
+D = TypeVar('D')  # 도메인(Domain) 타입
+
+# 모델 형식(JSON으로 저장할 수 있는 dict)
+#   {"format": "csp-model", "version": 1,
+#    "variables": [변수, ...], "domains": [[값, ...], ...],
+#    "constraints": [{"type": "table", "scope": [변수 번호, ...], "tuples": [[값 번호, ...], ...]},
+#                    {"type": "alldifferent", "scope": [...]},
+#                    {"type": "linear", "scope": [...], "coefficients": [...], "constant": 정수}],
+#    "relaxed": 불리언}
+# 변수와 값은 JSON 스칼라(문자열, 수, 불리언, None)여야 한다. 테이블의 값 번호는
+# 그 변수의 도메인 리스트에서의 위치다. relaxed는 제약 조건을 변수 쌍별 테이블로 나누어서
+# 모델이 원래 CSP보다 느슨해졌다는 뜻이다(없으면 false). 이런 모델의 답은 원래 CSP로 다시 검사해야 한다.
+MODEL_FORMAT: str = "csp-model"
+COMPILED_FORMAT: str = "csp-compiled"
+VERSION: int = 1
+
+
+def _check_scalar(item: Any) -> None:
+    if item is not None and not isinstance(item, (str, int, float, bool)):
+        raise ValueError(f"JSON 스칼라가 아닌 변수나 값은 저장할 수 없습니다: {item!r}")
+
+
+# 값 -> 번호 표의 키. True == 1 == 1.0이고 해시도 같으므로 값만으로는 서로 다른 값이 같은 번호가 된다.
+def _key(value: Any) -> Tuple[type, Any]:
+    return type(value), value
+
+
+# 제약 조건을 변수 도메인의 모든 조합 중 만족하는 것만 모은 테이블로 바꾼다.
+def tabulate(constraint: Constraint[V, D], domains: Dict[V, List[D]],
+             max_tuples: int = 100000) -> TableConstraint[V, D]:
+    size: int = 1
+    for variable in constraint.variables:
+        size *= len(domains[variable])
+    if size > max_tuples:
+        raise ValueError(f"조합이 너무 많아서({size}개) 테이블로 바꿀 수 없습니다.")
+    tuples: List[Tuple[D, ...]] = [
+        combination for combination in product(*(domains[v] for v in constraint.variables))
+        if constraint.satisfied(dict(zip(constraint.variables, combination)))]
+    return TableConstraint(constraint.variables, tuples)
+
+
+# 제약 조건을 변수 쌍마다의 이진 테이블로 나눈다. 퀸 제약 조건처럼 변수 쌍에 대한
+# 조건을 모두 모은(AND) 제약 조건에서만 원래 제약 조건과 같다.
+def pairwise_tables(constraint: Constraint[V, D],
+                    domains: Dict[V, List[D]]) -> List[TableConstraint[V, D]]:
+    tables: List[TableConstraint[V, D]] = []
+    for first, second in combinations(constraint.variables, 2):
+        tables.append(tabulate(_Restricted(constraint, [first, second]), domains))
+    return tables
+
+
+# 제약 조건을 일부 변수에 대한 제약 조건처럼 보이게 한다(tabulate에 쓴다).
+class _Restricted(Constraint[V, D]):
+    def __init__(self, constraint: Constraint[V, D], variables: List[V]) -> None:
+        super().__init__(variables)
+        self.constraint: Constraint[V, D] = constraint
+
+    def satisfied(self, assignment: Dict[V, D]) -> bool:
+        return self.constraint.satisfied(assignment)
+
+
+# CSP를 모델 형식으로 내보낸다. 테이블, AllDifferent, LinearEquation은 그대로 저장하고
+# 다른 제약 조건은 tabulate로 테이블로 바꾼다. 조합이 너무 많은 제약 조건은
+# pairwise가 True이면 이진 테이블로 나누고, 아니면 ValueError를 일으킨다. 이진 테이블로 나누면
+# 변수 쌍에 대한 조건을 모두 모은 제약 조건이 아닌 한 원래 제약 조건보다 느슨해지므로 모델에 relaxed를 표시한다.
+def export_model(csp: CSP[V, D], pairwise: bool = False,
+                 max_tuples: int = 100000) -> Dict[str, Any]:
+    for variable in csp.variables:
+        _check_scalar(variable)
+        for value in csp.domains[variable]:
+            _check_scalar(value)
+    index: Dict[V, int] = {v: i for i, v in enumerate(csp.variables)}
+    constraints: List[Dict[str, Any]] = []
+    relaxed: bool = False
+
+    def add_table(table: TableConstraint[V, D]) -> None:
+        positions: List[Dict[Tuple[type, D], int]] = [{_key(value): i for i, value in enumerate(csp.domains[v])}
+                                                      for v in table.variables]
+        constraints.append({
+            "type": "table",
+            "scope": [index[v] for v in table.variables],
+            "tuples": sorted([positions[i][_key(x)] for i, x in enumerate(t)] for t in table.tuples
+                             if all(_key(x) in positions[i] for i, x in enumerate(t)))})
+
+    for constraint in csp.weights:  # weights에는 추가된 모든 제약 조건이 있다.
+        if isinstance(constraint, TableConstraint):
+            add_table(constraint)
+        elif isinstance(constraint, AllDifferent):
+            constraints.append({"type": "alldifferent",
+                                "scope": [index[v] for v in constraint.variables]})
+        elif isinstance(constraint, LinearEquation):
+            constraints.append({"type": "linear",
+                                "scope": [index[v] for v in constraint.variables],
+                                "coefficients": [constraint.terms[v] for v in constraint.variables],
+                                "constant": constraint.constant})
+        else:
+            try:
+                add_table(tabulate(constraint, csp.domains, max_tuples))
+            except ValueError:
+                if not pairwise:
+                    raise
+                for table in pairwise_tables(constraint, csp.domains):
+                    add_table(table)
+                relaxed = True
+    return {"format": MODEL_FORMAT, "version": VERSION,
+            "variables": list(csp.variables),
+            "domains": [list(csp.domains[v]) for v in csp.variables],
+            "constraints": constraints,
+            "relaxed": relaxed}
+
+
+def _check_format(model: Dict[str, Any], expected: str) -> None:
+    if model.get("format") != expected or model.get("version") != VERSION:
+        raise ValueError(f"{expected} 버전 {VERSION} 형식이 아닙니다.")
+
+
+# 모델 형식의 제약 조건 하나를 만든다. variables와 values는 변수 번호와 값 번호를 풀 때 쓴다.
+def _build_constraint(entry: Dict[str, Any], variables: List[Any],
+                      values: List[List[Any]]) -> Constraint[Any, Any]:
+    scope: List[Any] = [variables[i] for i in entry["scope"]]
+    kind: str = entry["type"]
+    if kind == "table":
+        return TableConstraint(scope, [[values[v][x] for v, x in zip(entry["scope"], t)]
+                                       for t in entry["tuples"]])
+    if kind == "alldifferent":
+        return AllDifferent(scope)
+    if kind == "linear":
+        return LinearEquation(dict(zip(scope, entry["coefficients"])), entry["constant"])
+    raise ValueError(f"알 수 없는 제약 조건 종류입니다: {kind}")
+
+
+# 모델 형식에서 CSP를 만든다. relaxed 모델이면 원래 CSP보다 느슨한 CSP가 된다.
+def import_model(model: Dict[str, Any]) -> CSP[Any, Any]:
+    _check_format(model, MODEL_FORMAT)
+    variables: List[Any] = model["variables"]
+    values: List[List[Any]] = model["domains"]
+    csp: CSP[Any, Any] = CSP(variables, dict(zip(variables, values)))
+    for entry in model["constraints"]:
+        csp.add_constraint(_build_constraint(entry, variables, values))
+    return csp
+
+
+def dump_model(model: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(model, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_model(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# 컴파일된 모델. 변수는 0..n-1, 값은 모델 전체에서 0..m-1의 조밀한 정수 번호로 바꾸고,
+# 이진 테이블은 비트셋으로 저장한다. supports[(i, j)][a]는 변수 i가 값 a일 때
+# 변수 j가 가질 수 있는 값 번호의 비트셋이다(같은 변수 쌍의 테이블은 AND로 합친다).
+# 이진이 아닌 제약 조건은 모델 형식으로 두되, 테이블의 값은 모델 전체의 값 번호로 적는다.
+# relaxed는 모델 형식의 relaxed를 그대로 가져온다.
+class CompiledModel:
+    def __init__(self, variables: List[Any], values: List[Any], domains: List[List[int]],
+                 supports: Dict[Tuple[int, int], Dict[int, int]],
+                 constraints: List[Dict[str, Any]], relaxed: bool = False) -> None:
+        self.variables: List[Any] = variables
+        self.values: List[Any] = values
+        self.domains: List[List[int]] = domains
+        self.supports: Dict[Tuple[int, int], Dict[int, int]] = supports
+        self.constraints: List[Dict[str, Any]] = constraints
+        self.relaxed: bool = relaxed
+
+    # 변수 번호와 값 번호로 이루어진 CSP. 이진 제약 조건은 하나의 BitsetConstraint가 맡는다.
+    def to_csp(self) -> Tuple[CSP[int, int], BitsetConstraint]:
+        variables: List[int] = list(range(len(self.variables)))
+        csp: CSP[int, int] = CSP(variables, dict(zip(variables, self.domains)))
+        bitsets: BitsetConstraint = BitsetConstraint(variables, self.domains, self.supports)
+        csp.add_constraint(bitsets)
+        # 이진이 아닌 제약 조건은 원래 값으로 정의되어 있으므로 번역해서 쓴다.
+        # 이 제약 조건들의 테이블은 모델 전체의 값 번호를 쓴다.
+        for entry in self.constraints:
+            csp.add_constraint(_Decoded(
+                _build_constraint(entry, variables, [self.values] * len(variables)), self.values))
+        return csp, bitsets
+
+    # 번호로 된 답을 원래 변수와 값으로 바꾼다.
+    def decode(self, solution: Dict[int, int]) -> Dict[Any, Any]:
+        return {self.variables[v]: self.values[x] for v, x in solution.items()}
+
+    # relaxed 모델의 답은 원래 CSP를 만족하지 않을 수 있다. source로 원래 CSP를 주면
+    # 원래 CSP의 제약 조건도 만족하는 첫 답을 찾는다(sat_solve처럼 답을 검사한다).
+    def solve(self, source: Optional[CSP[Any, Any]] = None) -> Optional[Dict[Any, Any]]:
+        csp, bitsets = self.to_csp()
+        for solution in csp.iter_solutions(select_variable=bitsets.select_variable,
+                                           order_values=bitsets.order_values):
+            decoded: Dict[Any, Any] = self.decode(solution)
+            if source is None or all(source.consistent(v, decoded) for v in source.variables):
+                return decoded
+        return None
+
+    # 비트셋은 16진수 문자열로 저장한다.
+    def to_dict(self) -> Dict[str, Any]:
+        return {"format": COMPILED_FORMAT, "version": VERSION,
+                "variables": self.variables, "values": self.values, "domains": self.domains,
+                "supports": [[i, j, {str(a): format(mask, "x") for a, mask in table.items()}]
+                             for (i, j), table in self.supports.items()],
+                "constraints": self.constraints, "relaxed": self.relaxed}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> CompiledModel:
+        _check_format(data, COMPILED_FORMAT)
+        supports: Dict[Tuple[int, int], Dict[int, int]] = {
+            (i, j): {int(a): int(mask, 16) for a, mask in table.items()}
+            for i, j, table in data["supports"]}
+        return cls(data["variables"], data["values"], data["domains"], supports,
+                   data["constraints"], data.get("relaxed", False))
+
+
+# 모델 형식을 컴파일한다. 단항 테이블은 도메인을 줄이는 데 쓰고 이진 테이블은 비트셋으로 바꾼다.
+def compile_model(model: Dict[str, Any]) -> CompiledModel:
+    _check_format(model, MODEL_FORMAT)
+    values: List[Any] = []
+    ids: Dict[Tuple[type, Any], int] = {}
+    for domain in model["domains"]:
+        for value in domain:
+            if _key(value) not in ids:
+                ids[_key(value)] = len(values)
+                values.append(value)
+    # 변수의 도메인 위치 -> 값 번호
+    local: List[List[int]] = [[ids[_key(value)] for value in domain] for domain in model["domains"]]
+    domains: List[Set[int]] = [set(domain) for domain in local]
+    supports: Dict[Tuple[int, int], Dict[int, int]] = {}
+    others: List[Dict[str, Any]] = []
+    for entry in model["constraints"]:
+        scope: List[int] = entry["scope"]
+        if entry["type"] == "table":  # 값 번호를 모델 전체의 번호로 바꾼다.
+            entry = dict(entry, tuples=[[local[v][x] for v, x in zip(scope, t)]
+                                        for t in entry["tuples"]])
+        if entry["type"] != "table" or len(scope) > 2 or len(set(scope)) != len(scope):
+            others.append(entry)
+            continue
+        tuples: List[List[int]] = entry["tuples"]
+        if len(scope) == 1:
+            domains[scope[0]] &= {t[0] for t in tuples}
+            continue
+        i, j = scope
+        forward: Dict[int, int] = {}
+        backward: Dict[int, int] = {}
+        for a, b in tuples:
+            forward[a] = forward.get(a, 0) | 1 << b
+            backward[b] = backward.get(b, 0) | 1 << a
+        for key, table in (((i, j), forward), ((j, i), backward)):
+            if key in supports:  # 같은 변수 쌍의 제약 조건은 모두 만족해야 한다.
+                old: Dict[int, int] = supports[key]
+                table = {a: old[a] & mask for a, mask in table.items() if a in old}
+            supports[key] = table
+    return CompiledModel(model["variables"], values,
+                         [[x for x in domain if x in domains[v]] for v, domain in enumerate(local)],
+                         supports, others, model.get("relaxed", False))
+
+
+# 값 번호로 된 assignment를 원래 값으로 번역해서 안쪽 제약 조건에 넘긴다.
+class _Decoded(Constraint[int, int]):
+    def __init__(self, constraint: Constraint[int, Any], values: List[Any]) -> None:
+        super().__init__(constraint.variables)
+        self.constraint: Constraint[int, Any] = constraint
+        self.values: List[Any] = values
+        self.ids: Dict[Tuple[type, Any], int] = {_key(value): i for i, value in enumerate(values)}
+        self.propagates = constraint.propagates
+
+    def satisfied(self, assignment: Dict[int, int]) -> bool:
+        return self.constraint.satisfied(
+            {v: self.values[assignment[v]] for v in self.variables if v in assignment})
+
+    def propagate(self, domains: Dict[int, List[int]],
+                  assignment: Dict[int, int]) -> Optional[Dict[int, List[int]]]:
+        changes: Optional[Dict[int, List[Any]]] = self.constraint.propagate(
+            {v: [self.values[x] for x in domains[v]] for v in self.variables},
+            {v: self.values[assignment[v]] for v in self.variables if v in assignment})
+        if changes is None:
+            return None
+        return {v: [self.ids[_key(value)] for value in values] for v, values in changes.items()}
+
+
+# 컴파일된 이진 제약 조건 전체를 맡는 점진적 제약 조건.
+# 변수마다 아직 허용되는 값 번호의 비트셋을 유지한다. 값을 할당하면 이웃 변수의 비트셋을
+# 지지 비트셋과 AND하고(전방 검사), 할당되지 않은 이웃의 비트셋이 비면 위반으로 본다.
+class BitsetConstraint(IncrementalConstraint[int, int]):
+    def __init__(self, variables: List[int], domains: List[List[int]],
+                 supports: Dict[Tuple[int, int], Dict[int, int]]) -> None:
+        super().__init__(variables)
+        self.neighbors: Dict[int, List[Tuple[int, Dict[int, int]]]] = {v: [] for v in variables}
+        for (i, j), table in supports.items():
+            self.neighbors[i].append((j, table))
+        # 점진적 검사 상태
+        self._allowed: Dict[int, int] = {}
+        for v in variables:
+            mask: int = 0
+            for x in domains[v]:
+                mask |= 1 << x
+            self._allowed[v] = mask
+        self._values: Dict[int, int] = {}
+        # 할당마다 (위반 여부, 바꾼 (변수, 이전 비트셋) 리스트)를 쌓는다.
+        self._history: List[Tuple[bool, List[Tuple[int, int]]]] = []
+        self._violations: int = 0
+
+    def satisfied(self, assignment: Dict[int, int]) -> bool:
+        for i, a in assignment.items():
+            for j, table in self.neighbors.get(i, []):
+                if j in assignment and not table.get(a, 0) >> assignment[j] & 1:
+                    return False
+        return True
+
+    def on_assign(self, variable: int, value: int) -> None:
+        self._values[variable] = value
+        if not self._allowed[variable] >> value & 1:
+            self._history.append((True, []))
+            self._violations += 1
+            return
+        changed: List[Tuple[int, int]] = []
+        wiped_out: bool = False
+        for j, table in self.neighbors[variable]:
+            if j in self._values:
+                continue
+            old: int = self._allowed[j]
+            new: int = old & table.get(value, 0)
+            if new != old:
+                changed.append((j, old))
+                self._allowed[j] = new
+                if not new:
+                    wiped_out = True
+        self._history.append((wiped_out, changed))
+        if wiped_out:
+            self._violations += 1
+
+    def on_unassign(self, variable: int) -> None:
+        del self._values[variable]
+        violated, changed = self._history.pop()
+        if violated:
+            self._violations -= 1
+        for j, old in reversed(changed):
+            self._allowed[j] = old
+
+    def is_violated(self) -> bool:
+        return self._violations > 0
+
+    # 허용되는 값이 가장 적은 변수(MRV). 비트셋의 1의 개수로 센다.
+    def select_variable(self, csp: CSP[int, int], unassigned: List[int],
+                        assignment: Dict[int, int]) -> int:
+        return min(reversed(unassigned), key=lambda v: bin(self._allowed[v]).count("1"))
+
+    # 도메인 값 중 비트셋에서 허용되는 값만 순서대로 반환한다.
+    def order_values(self, csp: CSP[int, int], variable: int,
+                     assignment: Dict[int, int]) -> List[int]:
+        allowed: int = self._allowed[variable]
+        return [x for x in csp.domains[variable] if allowed >> x & 1]
+
+
+if __name__ == "__main__":
+    from benchmark import queens_csp
+    from cryptarithm import cryptarithm_csp
+    from map_coloring import MapColoringConstraint
+    from tempfile import TemporaryDirectory
+    import os
+
+    states: List[str] = ["웨스턴 오스트레일리아 주", "노던 준주", "사우스 오스트레일리아 주",
+                         "퀸즐랜드 주", "뉴사우스웨일스 주", "빅토리아 주", "태즈메이니아 주"]
+    australia: CSP[str, str] = CSP(states, {s: ["빨강", "초록", "파랑"] for s in states})
+    for first, second in [(0, 1), (0, 2), (2, 1), (3, 1), (3, 2), (3, 4), (4, 2), (5, 2), (5, 4), (5, 6)]:
+        australia.add_constraint(MapColoringConstraint(states[first], states[second]))
+    problems: List[Tuple[str, CSP[Any, Any]]] = [
+        ("오스트레일리아 지도", australia), ("30-퀸", queens_csp(30)),
+        ("SEND+MORE=MONEY", cryptarithm_csp("SEND+MORE=MONEY"))]
+    with TemporaryDirectory() as directory:
+        for name, problem in problems:
+            path: str = os.path.join(directory, "model.json")
+            dump_model(compile_model(export_model(problem, pairwise=True)).to_dict(), path)
+            start: float = perf_counter()
+            compiled: CompiledModel = CompiledModel.from_dict(load_model(path))
+            loaded: float = perf_counter() - start
+            # 퀸 제약 조건은 변수 쌍으로 나뉘어 relaxed가 되므로 원래 CSP로 답을 검사한다.
+            solution: Union[Dict[Any, Any], None] = compiled.solve(problem if compiled.relaxed else None)
+            print(f"{name}: 불러오기 {loaded * 1000:.1f}ms, 풀기 {perf_counter() - start - loaded:.3f}초, "
+                  f"{'답 있음' if solution is not None and problem.backtracking_search(solution) else '답 없음'}"
+                  f"{'(relaxed)' if compiled.relaxed else ''}")
@@ -0,0 +1,112 @@
+# model_tests.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+import os
+import json
+import tempfile
+from typing import Any, Dict, List, Optional
+from random import Random
+from csp import CSP, Constraint
+from model import export_model, import_model, compile_model, dump_model, load_model, CompiledModel
+from csp_tests import random_csp
+
+
+# 모든 변수의 합이 짝수여야 한다. 변수 쌍만 보아서는 알 수 없으므로 변수 쌍별 테이블로 나누면 느슨해진다.
+class EvenSum(Constraint[int, int]):
+    def satisfied(self, assignment: Dict[int, int]) -> bool:
+        if any(v not in assignment for v in self.variables):
+            return True
+        return sum(assignment[v] for v in self.variables) % 2 == 0
+
+
+def even_sum_csp(domain: List[int]) -> CSP[int, int]:
+    csp: CSP[int, int] = CSP([0, 1, 2], {v: domain for v in range(3)})
+    csp.add_constraint(EvenSum([0, 1, 2]))
+    return csp
+
+
+# 모델을 JSON 파일에 썼다가 다시 읽는다.
+def through_file(model: Dict[str, Any]) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "model.json")
+        dump_model(model, path)
+        return load_model(path)
+
+
+class ModelTestCase(unittest.TestCase):
+    # True == 1 == 1.0이지만 서로 다른 값이므로 다른 번호를 받고 원래 타입으로 풀려야 한다.
+    def test_equal_values_of_different_types(self):
+        csp: CSP[str, Any] = CSP(["a", "b"], {"a": [True, False], "b": [1, 0]})
+        solution: Dict[str, Any] = compile_model(export_model(csp)).solve()
+        self.assertEqual([type(solution["a"]), type(solution["b"])], [bool, int])
+        domains: List[Any] = [True, 1, 1.0, False, 0, 0.0]
+        compiled: CompiledModel = compile_model(export_model(CSP(["x"], {"x": domains})))
+        self.assertEqual([(type(value), value) for value in compiled.values],
+                         [(type(value), value) for value in domains])
+
+
+    # 무작위 CSP(테이블로 바꾸는 이항 제약 조건, AllDifferent, LinearEquation, TableConstraint)를
+    # 내보내고 파일을 거쳐 다시 만들어도 답이 같아야 하고, 컴파일한 모델도 같은 답의 유무를 알아야 한다.
+    def test_round_trip(self):
+        random: Random = Random(3)
+        for _ in range(100):
+            csp: CSP[int, int] = random_csp(random)
+            model: Dict[str, Any] = through_file(export_model(csp))
+            self.assertFalse(model["relaxed"])
+            expected: List[Dict[int, int]] = list(csp.iter_solutions())
+            imported: CSP[Any, Any] = import_model(model)
+            # JSON에서 정수 변수는 그대로 정수로 돌아온다.
+            self.assertCountEqual(list(imported.iter_solutions()), expected)
+            compiled: CompiledModel = CompiledModel.from_dict(json.loads(json.dumps(compile_model(model).to_dict())))
+            solution: Optional[Dict[Any, Any]] = compiled.solve()
+            if expected:
+                self.assertIn(solution, expected)
+            else:
+                self.assertIsNone(solution)
+
+    def test_relaxed_model(self):
+        csp: CSP[int, int] = even_sum_csp([1, 0])
+        with self.assertRaises(ValueError):
+            export_model(csp, max_tuples=4)
+        model: Dict[str, Any] = through_file(export_model(csp, pairwise=True, max_tuples=4))
+        self.assertTrue(model["relaxed"])
+        # 나뉜 테이블은 모든 조합을 허용하므로 느슨한 CSP의 답은 원래 CSP보다 많다.
+        self.assertEqual(import_model(model).count_solutions(), 8)
+        compiled: CompiledModel = CompiledModel.from_dict(compile_model(model).to_dict())
+        self.assertTrue(compiled.relaxed)
+        self.assertEqual(compiled.solve(), {0: 1, 1: 1, 2: 1})  # 원래 CSP를 만족하지 않는다.
+        solution: Dict[Any, Any] = compiled.solve(csp)
+        self.assertTrue(all(csp.consistent(v, solution) for v in csp.variables))
+        # 원래 CSP에 답이 없으면 느슨한 모델의 답을 모두 거른 뒤 None을 반환한다.
+        impossible: CSP[int, int] = even_sum_csp([1])
+        self.assertIsNone(compile_model(export_model(impossible, pairwise=True, max_tuples=0)).solve(impossible))
+
+    def test_not_a_pairwise_relaxation(self):
+        model: Dict[str, Any] = export_model(even_sum_csp([1, 0]))
+        self.assertFalse(model["relaxed"])
+        self.assertEqual(import_model(model).count_solutions(), 4)
+
+    def test_invalid_models(self):
+        with self.assertRaises(ValueError):
+            export_model(CSP([(0, 1)], {(0, 1): [0]}))  # 튜플 변수는 JSON 스칼라가 아니다.
+        with self.assertRaises(ValueError):
+            import_model({"format": "csp-model", "version": 2})
+        with self.assertRaises(ValueError):
+            CompiledModel.from_dict(export_model(even_sum_csp([0])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+# parallel_search.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar, Dict, List, Optional, Callable, Union, Tuple, Any
+from multiprocessing import Pool, cpu_count
+from queue import Queue
+from time import perf_counter
+import pickle
+from csp import CSP, VariableSelector, ValueOrderer
+
+V = TypeVar('V')  # 변수(Variable) 타입
+D = TypeVar('D')  # 도메인(Domain) 타입
+
+# 프로세스에 넘길 문제: 피클(pickle) 가능한 CSP 또는 CSP를 만드는 모듈 수준 함수
+Problem = Union[CSP[V, D], Callable[[], CSP[V, D]]]
+
+_csp: Optional[CSP] = None  # 작업자 프로세스마다 한 번 만드는 CSP
+
+
+def _init_worker(problem: Problem) -> None:
+    global _csp
+    _csp = problem if isinstance(problem, CSP) else problem()
+
+
+# 작업 단위(탐색 트리 윗부분의 부분 할당) 하나를 time_slice초 동안 탐색한다.
+# 시간 안에 끝내지 못하면 지금까지의 결과를 버리고, 다음 변수까지 할당한 더 작은
+# 작업 단위로 나누어 돌려준다. 한가한 작업자가 이 단위들을 가져가므로
+# 불균형한 서브트리도 여러 프로세스에 나뉜다.
+def _run_unit(prefix: Dict[Any, Any], count: bool, time_slice: float,
+              select: Optional[VariableSelector], order: Optional[ValueOrderer]) -> Tuple[str, Any]:
+    assert _csp is not None
+    found: int = 0
+    for solution in _csp.iter_solutions(prefix, select, order, timeout=time_slice):
+        if not count:
+            return "solution", solution
+        found += 1
+    if _csp.statistics.stopped is None or len(prefix) == len(_csp.variables):
+        return "done", found
+    return "split", _extend(_csp, prefix)
+
+
+# 다음 할당되지 않은 변수(변수 순서 기준)의 일관적인 값으로 부분 할당을 확장한다.
+def _extend(csp: CSP[V, D], prefix: Dict[V, D]) -> List[Dict[V, D]]:
+    variable: V = next(v for v in csp.variables if v not in prefix)
+    units: List[Dict[V, D]] = []
+    for value in csp.domains[variable]:
+        unit: Dict[V, D] = dict(prefix)
+        unit[variable] = value
+        if csp.consistent(variable, unit):
+            units.append(unit)
+    return units
+
+
+# 프로세스 수보다 충분히 많은 작업 단위가 생길 때까지 탐색 트리의 윗부분을 나눈다.
+def split_search_space(csp: CSP[V, D], min_units: int) -> List[Dict[V, D]]:
+    units: List[Dict[V, D]] = [{}]
+    while 0 < len(units) < min_units and len(units[0]) < len(csp.variables):
+        units = [unit for prefix in units for unit in _extend(csp, prefix)]
+    return units
+
+
+def _parallel(problem: Problem, count: bool, processes: Optional[int], time_slice: float,
+              select: Optional[VariableSelector], order: Optional[ValueOrderer]) -> Union[int, Optional[Dict]]:
+    try:
+        pickle.dumps(problem)
+    except (pickle.PicklingError, TypeError, AttributeError) as error:
+        raise TypeError("병렬 탐색을 하려면 CSP가 피클 가능하거나, "
+                        "CSP를 만드는 모듈 수준 함수를 넘겨야 합니다.") from error
+    csp: CSP = problem if isinstance(problem, CSP) else problem()
+    processes = processes or cpu_count()
+    results: Queue = Queue()  # 작업 결과는 콜백을 통해 메인 스레드의 큐로 모인다.
+    total: int = 0
+    pool = Pool(processes, initializer=_init_worker, initargs=(problem,))
+    try:
+        def submit(unit: Dict) -> None:
+            pool.apply_async(_run_unit, (unit, count, time_slice, select, order),
+                             callback=results.put, error_callback=results.put)
+
+        pending: int = 0
+        for unit in split_search_space(csp, processes * 4):
+            submit(unit)
+            pending += 1
+        while pending > 0:
+            result = results.get()
+            pending -= 1
+            if isinstance(result, BaseException):
+                raise result
+            kind, payload = result
+            if kind == "solution":
+                return payload  # 답을 찾으면 finally에서 모든 작업자를 종료한다.
+            elif kind == "done":
+                total += payload
+            else:
+                for unit in payload:
+                    submit(unit)
+                    pending += 1
+    finally:
+        pool.terminate()
+        pool.join()
+    return total if count else None
+
+
+# 탐색 트리의 윗부분을 작업 단위로 나누어 여러 프로세스에서 첫 번째 답을 찾는다.
+def parallel_backtracking_search(problem: Problem, processes: Optional[int] = None,
+                                 select_variable: Optional[VariableSelector] = None,
+                                 order_values: Optional[ValueOrderer] = None,
+                                 time_slice: float = 0.5) -> Optional[Dict[V, D]]:
+    return _parallel(problem, False, processes, time_slice, select_variable, order_values)
+
+
+# 여러 프로세스에서 답의 수를 센다. 작업 단위는 탐색 공간을 겹치지 않게 나누므로 더하면 된다.
+def parallel_count_solutions(problem: Problem, processes: Optional[int] = None,
+                             select_variable: Optional[VariableSelector] = None,
+                             order_values: Optional[ValueOrderer] = None,
+                             time_slice: float = 0.5) -> int:
+    return _parallel(problem, True, processes, time_slice, select_variable, order_values)
+
+
+def ten_queens() -> CSP[int, int]:
+    from benchmark import queens_csp
+    return queens_csp(10)
+
+
+if __name__ == "__main__":
+    start: float = perf_counter()
+    print(f"10-퀸 답의 수(순차): {ten_queens().count_solutions()}, {perf_counter() - start:.2f}초")
+    start = perf_counter()
+    print(f"10-퀸 답의 수(병렬): {parallel_count_solutions(ten_queens)}, {perf_counter() - start:.2f}초")
+    print(parallel_backtracking_search(ten_queens))
@@ -0,0 +1,63 @@
+# parallel_search_tests.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import Dict, List, Optional
+from random import Random
+from csp import CSP, mrv
+from benchmark import queens_csp
+from csp_tests import random_csp
+from local_search_tests import clique_coloring
+from parallel_search import parallel_backtracking_search, parallel_count_solutions, split_search_space
+
+
+def six_queens() -> CSP[int, int]:
+    return queens_csp(6)
+
+
+class ParallelSearchTestCase(unittest.TestCase):
+    def test_counts_match_serial(self):
+        random: Random = Random(3)
+        for _ in range(10):
+            csp: CSP[int, int] = random_csp(random)
+            expected: int = csp.count_solutions()
+            # time_slice=0이면 작업 단위가 끝까지 계속 나뉜다.
+            for time_slice in (0, 0.5):
+                self.assertEqual(parallel_count_solutions(csp, processes=2, time_slice=time_slice), expected)
+        self.assertEqual(parallel_count_solutions(six_queens, processes=2, time_slice=0), 4)
+        self.assertEqual(parallel_count_solutions(six_queens, processes=2, select_variable=mrv), 4)
+
+    def test_first_solution(self):
+        csp: CSP[int, int] = six_queens()
+        solution: Optional[Dict[int, int]] = parallel_backtracking_search(six_queens, processes=2, time_slice=0)
+        self.assertIsNotNone(solution)
+        self.assertEqual(set(solution), set(csp.variables))
+        self.assertTrue(all(csp.consistent(v, solution) for v in csp.variables))
+        self.assertIsNone(parallel_backtracking_search(clique_coloring(4, 3), processes=2, time_slice=0))
+
+    def test_split_search_space(self):
+        csp: CSP[int, int] = six_queens()
+        units: List[Dict[int, int]] = split_search_space(csp, 20)
+        self.assertGreaterEqual(len(units), 20)
+        # 작업 단위는 탐색 공간을 겹치지 않고 빠짐없이 나눈다.
+        self.assertEqual(sum(1 for unit in units for _ in csp.iter_solutions(unit)), 4)
+
+    def test_not_picklable(self):
+        with self.assertRaises(TypeError):
+            parallel_count_solutions(lambda: queens_csp(4), processes=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,14 +13,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from csp import Constraint, CSP
-from typing import Dict, List, Optional
+from csp import IncrementalConstraint, CSP
+from typing import Dict, List, Optional, Set
 
 
-class QueensConstraint(Constraint[int, int]):
+class QueensConstraint(IncrementalConstraint[int, int]):
     def __init__(self, columns: List[int]) -> None:
         super().__init__(columns)
         self.columns: List[int] = columns
+        # 점진적 검사 상태: 퀸이 놓인 행과 두 방향 대각선의 비트셋
+        self._rows: int = 0
+        self._diagonals: int = 0  # 행 + 열이 같은 대각선
+        self._anti_diagonals: int = 0  # 행 - 열이 같은 대각선
+        self._offset: int = len(columns)  # 행 - 열이 음수가 되지 않도록 더한다.
+        self._placed: Dict[int, int] = {}  # 비트를 설정한 퀸: 열 -> 행
+        self._conflicting: Set[int] = set()  # 충돌해서 비트를 설정하지 않은 퀸
 
     def satisfied(self, assignment: Dict[int, int]) -> bool:
         # q1c = 퀸1 열, q1r = 퀸1 행
@@ -35,6 +42,48 @@ class QueensConstraint(Constraint[int, int]):
                         return False
         return True  # 충돌 X
 
+    # 서로 공격하는 퀸 쌍의 수
+    def conflicts(self, assignment: Dict[int, int]) -> int:
+        rows: Dict[int, int] = {}
+        diagonals: Dict[int, int] = {}
+        anti_diagonals: Dict[int, int] = {}
+        for column, row in assignment.items():
+            rows[row] = rows.get(row, 0) + 1
+            diagonals[row + column] = diagonals.get(row + column, 0) + 1
+            anti_diagonals[row - column] = anti_diagonals.get(row - column, 0) + 1
+        return sum(k * (k - 1) // 2 for counts in (rows, diagonals, anti_diagonals)
+                   for k in counts.values())
+
+    # 퀸 variable을 공격하는 퀸의 수
+    def variable_conflicts(self, variable: int, assignment: Dict[int, int]) -> int:
+        row: int = assignment[variable]
+        return sum(1 for column, other in assignment.items() if column != variable and
+                   (other == row or abs(other - row) == abs(column - variable)))
+
+    def on_assign(self, variable: int, value: int) -> None:
+        row: int = 1 << value
+        diagonal: int = 1 << (value + variable)
+        anti_diagonal: int = 1 << (value - variable + self._offset)
+        if self._rows & row or self._diagonals & diagonal or self._anti_diagonals & anti_diagonal:
+            self._conflicting.add(variable)
+            return
+        self._rows |= row
+        self._diagonals |= diagonal
+        self._anti_diagonals |= anti_diagonal
+        self._placed[variable] = value
+
+    def on_unassign(self, variable: int) -> None:
+        if variable in self._conflicting:
+            self._conflicting.remove(variable)
+            return
+        value: int = self._placed.pop(variable)
+        self._rows &= ~(1 << value)
+        self._diagonals &= ~(1 << (value + variable))
+        self._anti_diagonals &= ~(1 << (value - variable + self._offset))
+
+    def is_violated(self) -> bool:
+        return len(self._conflicting) > 0
+
 
 if __name__ == "__main__":
     columns: List[int] = [1, 2, 3, 4, 5, 6, 7, 8]
@@ -48,3 +97,4 @@ if __name__ == "__main__":
         print("답을 찾을 수 없습니다!")
     else:
         print(solution)
+    print(f"8-퀸 문제의 답의 수: {csp.count_solutions()}")
@@ -0,0 +1,330 @@
+# sat.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Dict, List, Optional, Iterable
+from heapq import heappush, heappop
+from time import perf_counter
+
+
+# 루비(Luby) 수열의 i번째 값(1, 1, 2, 1, 1, 2, 4, ...). 재시작 간격에 쓴다.
+def luby(i: int) -> int:
+    size: int = 1
+    exponent: int = 0
+    while size < i + 1:
+        exponent += 1
+        size = 2 * size + 1
+    while size - 1 != i:
+        size = (size - 1) // 2
+        exponent -= 1
+        i %= size
+    return 2 ** exponent
+
+
+# 충돌 기반 절 학습(CDCL) SAT 솔버.
+# 리터럴은 DIMACS처럼 0이 아닌 정수다(변수 x는 x, 그 부정은 -x).
+# 내부에서는 리터럴을 2 * x(양) 또는 2 * x + 1(음)로 바꿔서 리스트 색인으로 쓴다.
+# 감시 리터럴(watched literal) 두 개로 단위 전파를 하고, 첫 번째 UIP에서 절을 배우며,
+# VSIDS로 변수를 고르고, 루비 수열 간격으로 재시작하고, 배운 절을 LBD 기준으로 정리한다.
+class SATSolver:
+    def __init__(self) -> None:
+        self.num_variables: int = 0
+        self._values: List[int] = [-1, -1]  # 내부 리터럴 -> 1(참), 0(거짓), -1(미정)
+        self._levels: List[int] = [0]  # 변수 -> 결정 수준
+        self._reasons: List[Optional[List[int]]] = [None]  # 변수 -> 값을 정한 절
+        self._watches: List[List[List[int]]] = [[], []]  # 내부 리터럴 -> 그 리터럴을 감시하는 절
+        self._activity: List[float] = [0.0]
+        self._phase: List[int] = [0]  # 변수 -> 마지막 값(phase saving)
+        self._heap: List[tuple] = []  # (-활동도, 변수), 오래된 항목은 꺼낼 때 건너뛴다.
+        self._trail: List[int] = []
+        self._trail_limits: List[int] = []  # 결정 수준마다 시작하는 trail 위치
+        self._queue_head: int = 0
+        self._learnts: List[List[int]] = []
+        self._lbd: Dict[int, int] = {}  # id(배운 절) -> LBD(서로 다른 결정 수준의 수)
+        self._increment: float = 1.0
+        self._unsatisfiable: bool = False
+        self.conflicts: int = 0
+        self.decisions: int = 0
+        self.propagations: int = 0
+
+    def new_variable(self) -> int:
+        self.num_variables += 1
+        self._values += [-1, -1]
+        self._levels.append(0)
+        self._reasons.append(None)
+        self._watches += [[], []]
+        self._activity.append(0.0)
+        self._phase.append(0)
+        heappush(self._heap, (0.0, self.num_variables))
+        return self.num_variables
+
+    # 절을 추가한다. 이미 모순이 된 것을 알면 False를 반환한다.
+    def add_clause(self, literals: Iterable[int]) -> bool:
+        if self._unsatisfiable:
+            return False
+        if self._trail_limits:
+            self._backtrack(0)
+        clause: List[int] = []
+        for literal in literals:
+            if literal == 0 or abs(literal) > self.num_variables:
+                raise ValueError(f"잘못된 리터럴입니다: {literal}")
+            code: int = 2 * literal if literal > 0 else -2 * literal + 1
+            if code ^ 1 in clause or self._values[code] == 1:
+                return True  # 항상 참인 절
+            if code not in clause and self._values[code] != 0:
+                clause.append(code)
+        if not clause:
+            self._unsatisfiable = True
+            return False
+        if len(clause) == 1:
+            self._enqueue(clause[0], None)
+            if self._propagate() is not None:
+                self._unsatisfiable = True
+                return False
+            return True
+        self._watches[clause[0]].append(clause)
+        self._watches[clause[1]].append(clause)
+        return True
+
+    # 참이면 True, 거짓이면 False, 미정이면 None
+    def value(self, literal: int) -> Optional[bool]:
+        code: int = 2 * literal if literal > 0 else -2 * literal + 1
+        value: int = self._values[code]
+        return None if value == -1 else value == 1
+
+    # 모든 절을 만족하는 할당을 찾으면 True, 없으면 False를 반환한다.
+    # max_conflicts나 timeout(초)을 넘기면 None을 반환한다.
+    # 답을 찾은 뒤에는 value()나 model()로 값을 읽는다.
+    def solve(self, max_conflicts: Optional[int] = None,
+              timeout: Optional[float] = None) -> Optional[bool]:
+        if self._unsatisfiable:
+            return False
+        self._backtrack(0)
+        if self._propagate() is not None:
+            self._unsatisfiable = True
+            return False
+        deadline: Optional[float] = None if timeout is None else perf_counter() + timeout
+        restarts: int = 0
+        reduce_at: int = self.conflicts + 2000
+        while True:
+            budget: int = 100 * luby(restarts)
+            result: Optional[bool] = self._search(budget)
+            if result is not None:
+                return result
+            restarts += 1
+            if max_conflicts is not None and self.conflicts >= max_conflicts:
+                return None
+            if deadline is not None and perf_counter() > deadline:
+                return None
+            if self.conflicts >= reduce_at:
+                self._reduce_learnts()
+                reduce_at = self.conflicts + 2000 + 300 * restarts
+
+    # 변수 -> 값. 답을 찾은 직후에만 의미가 있다.
+    def model(self) -> Dict[int, bool]:
+        return {x: self._values[2 * x] == 1 for x in range(1, self.num_variables + 1)}
+
+    # budget번 충돌할 때까지 탐색한다. 재시작이 필요하면 None을 반환한다.
+    def _search(self, budget: int) -> Optional[bool]:
+        conflicts: int = 0
+        while True:
+            conflict: Optional[List[int]] = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                conflicts += 1
+                if not self._trail_limits:
+                    self._unsatisfiable = True
+                    return False
+                learnt, level, lbd = self._analyze(conflict)
+                self._backtrack(level)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    self._watches[learnt[0]].append(learnt)
+                    self._watches[learnt[1]].append(learnt)
+                    self._learnts.append(learnt)
+                    self._lbd[id(learnt)] = lbd
+                    self._enqueue(learnt[0], learnt)
+                self._increment /= 0.95  # 활동도 감쇠 대신 증가량을 키운다.
+                continue
+            if conflicts >= budget:
+                self._backtrack(0)
+                return None
+            variable: int = self._pick_branch()
+            if variable == 0:
+                return True  # 모든 변수가 할당되었다.
+            self.decisions += 1
+            self._trail_limits.append(len(self._trail))
+            self._enqueue(2 * variable + (1 - self._phase[variable]), None)
+
+    def _enqueue(self, code: int, reason: Optional[List[int]]) -> None:
+        variable: int = code >> 1
+        self._values[code] = 1
+        self._values[code ^ 1] = 0
+        self._levels[variable] = len(self._trail_limits)
+        self._reasons[variable] = reason
+        self._trail.append(code)
+
+    # 단위 전파. 충돌한 절을 반환하고, 충돌이 없으면 None을 반환한다.
+    def _propagate(self) -> Optional[List[int]]:
+        values: List[int] = self._values
+        watches: List[List[List[int]]] = self._watches
+        trail: List[int] = self._trail
+        while self._queue_head < len(trail):
+            false_code: int = trail[self._queue_head] ^ 1
+            self._queue_head += 1
+            self.propagations += 1
+            watching: List[List[int]] = watches[false_code]
+            kept: List[List[int]] = []
+            i: int = 0
+            count: int = len(watching)
+            while i < count:
+                clause: List[int] = watching[i]
+                i += 1
+                if not clause:
+                    continue  # 정리된 배운 절
+                # 거짓이 된 리터럴을 clause[1]에 둔다.
+                if clause[0] == false_code:
+                    clause[0], clause[1] = clause[1], false_code
+                first: int = clause[0]
+                if values[first] == 1:
+                    kept.append(clause)
+                    continue
+                # 거짓이 아닌 다른 감시 리터럴을 찾는다.
+                for k in range(2, len(clause)):
+                    if values[clause[k]] != 0:
+                        clause[1], clause[k] = clause[k], false_code
+                        watches[clause[1]].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if values[first] == 0:
+                        # 충돌: 남은 감시 절을 그대로 두고 끝낸다.
+                        kept.extend(watching[i:count])
+                        watches[false_code] = kept
+                        self._queue_head = len(trail)
+                        return clause
+                    self._enqueue(first, clause)
+            watches[false_code] = kept
+        return None
+
+    # 첫 번째 UIP까지 해소(resolution)해서 배운 절, 되돌아갈 수준, LBD를 반환한다.
+    # 배운 절의 첫 리터럴은 UIP의 부정이고 두 번째 리터럴은 그다음으로 깊은 수준의 리터럴이다.
+    def _analyze(self, conflict: List[int]) -> tuple:
+        levels: List[int] = self._levels
+        current: int = len(self._trail_limits)
+        seen: set = set()
+        learnt: List[int] = [0]
+        pending: int = 0  # 현재 수준에서 아직 해소하지 않은 리터럴 수
+        index: int = len(self._trail) - 1
+        clause: List[int] = conflict
+        code: int = -1
+        while True:
+            for literal in (clause if code == -1 else clause[1:]):
+                variable: int = literal >> 1
+                if variable in seen or levels[variable] == 0:
+                    continue
+                seen.add(variable)
+                self._bump(variable)
+                if levels[variable] == current:
+                    pending += 1
+                else:
+                    learnt.append(literal)
+            # trail을 거꾸로 보며 다음에 해소할 현재 수준의 리터럴을 찾는다.
+            while (self._trail[index] >> 1) not in seen:
+                index -= 1
+            code = self._trail[index]
+            index -= 1
+            pending -= 1
+            if pending == 0:
+                break
+            reason: Optional[List[int]] = self._reasons[code >> 1]
+            assert reason is not None
+            # 이유 절의 첫 리터럴이 code가 되도록 맞춘다(감시 불변식 때문에 항상 그렇다).
+            if reason[0] != code:
+                position: int = reason.index(code)
+                reason[0], reason[position] = reason[position], reason[0]
+            clause = reason
+        learnt[0] = code ^ 1
+        learnt = self._minimize(learnt, seen)
+        level: int = 0
+        if len(learnt) > 1:
+            deepest: int = max(range(1, len(learnt)), key=lambda j: levels[learnt[j] >> 1])
+            learnt[1], learnt[deepest] = learnt[deepest], learnt[1]
+            level = levels[learnt[1] >> 1]
+        lbd: int = len({levels[literal >> 1] for literal in learnt})
+        return learnt, level, lbd
+
+    # 이유 절의 다른 리터럴이 모두 배운 절에 이미 포함된 리터럴은 지운다(지역 최소화).
+    def _minimize(self, learnt: List[int], seen: set) -> List[int]:
+        result: List[int] = [learnt[0]]
+        for literal in learnt[1:]:
+            reason: Optional[List[int]] = self._reasons[literal >> 1]
+            if reason is None or any((other >> 1) not in seen and self._levels[other >> 1] > 0
+                                     for other in reason if other != literal ^ 1):
+                result.append(literal)
+        return result
+
+    def _bump(self, variable: int) -> None:
+        self._activity[variable] += self._increment
+        if self._activity[variable] > 1e100:  # 넘침을 막기 위해 모두 줄인다.
+            self._activity = [a * 1e-100 for a in self._activity]
+            self._increment *= 1e-100
+            self._heap = [(-self._activity[x], x) for x in range(1, self.num_variables + 1)
+                          if self._values[2 * x] == -1]
+            self._heap.sort()
+            return
+        heappush(self._heap, (-self._activity[variable], variable))
+
+    # 활동도가 가장 높은 미정 변수. 없으면 0
+    def _pick_branch(self) -> int:
+        heap: List[tuple] = self._heap
+        while heap:
+            negative, variable = heappop(heap)
+            if self._values[2 * variable] == -1 and -negative == self._activity[variable]:
+                return variable
+        # 힙에 빠진 변수가 있을 수 있으므로 한 번 더 확인한다.
+        for variable in range(1, self.num_variables + 1):
+            if self._values[2 * variable] == -1:
+                return variable
+        return 0
+
+    def _backtrack(self, level: int) -> None:
+        if len(self._trail_limits) <= level:
+            return
+        start: int = self._trail_limits[level]
+        for code in reversed(self._trail[start:]):
+            variable: int = code >> 1
+            self._values[code] = -1
+            self._values[code ^ 1] = -1
+            self._reasons[variable] = None
+            self._phase[variable] = 1 - (code & 1)
+            heappush(self._heap, (-self._activity[variable], variable))
+        del self._trail[start:]
+        del self._trail_limits[level:]
+        self._queue_head = start
+
+    # LBD가 큰 배운 절의 절반을 버린다. 전파의 이유로 쓰이는 절과 LBD가 2 이하인 절은 남긴다.
+    def _reduce_learnts(self) -> None:
+        locked: set = {id(reason) for reason in self._reasons if reason is not None}
+        self._learnts.sort(key=lambda c: self._lbd[id(c)])
+        keep: int = len(self._learnts) // 2
+        survivors: List[List[int]] = self._learnts[:keep]
+        for clause in self._learnts[keep:]:
+            if id(clause) in locked or self._lbd[id(clause)] <= 2:
+                survivors.append(clause)
+            else:
+                del self._lbd[id(clause)]
+                clause.clear()  # 감시 리스트에서는 전파 중에 지워진다.
+        self._learnts = survivors
@@ -0,0 +1,114 @@
+# sat_tests.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import Dict, List
+from itertools import product
+from random import Random
+from sat import SATSolver, luby
+
+
+def satisfies(model: Dict[int, bool], clauses: List[List[int]]) -> bool:
+    return all(any(model[abs(literal)] == (literal > 0) for literal in clause) for clause in clauses)
+
+
+# 모든 할당을 나열해서 답의 수를 센다.
+def count_models(num_variables: int, clauses: List[List[int]]) -> int:
+    return sum(1 for values in product([False, True], repeat=num_variables)
+               if satisfies(dict(enumerate(values, 1)), clauses))
+
+
+def random_cnf(random: Random, num_variables: int, num_clauses: int) -> List[List[int]]:
+    return [[random.choice([-1, 1]) * x for x in random.sample(range(1, num_variables + 1), 3)]
+            for _ in range(num_clauses)]
+
+
+def make_solver(num_variables: int, clauses: List[List[int]]) -> SATSolver:
+    solver: SATSolver = SATSolver()
+    for _ in range(num_variables):
+        solver.new_variable()
+    for clause in clauses:
+        solver.add_clause(clause)
+    return solver
+
+
+# 비둘기 pigeons마리를 구멍 holes개에 한 마리씩 넣는다. pigeons > holes이면 답이 없다.
+def pigeonhole(pigeons: int, holes: int) -> List[List[int]]:
+    def x(p: int, h: int) -> int:
+        return p * holes + h + 1
+    clauses: List[List[int]] = [[x(p, h) for h in range(holes)] for p in range(pigeons)]
+    for h in range(holes):
+        for p in range(pigeons):
+            for q in range(p + 1, pigeons):
+                clauses.append([-x(p, h), -x(q, h)])
+    return clauses
+
+
+class SATSolverTestCase(unittest.TestCase):
+    def test_luby(self):
+        self.assertEqual([luby(i) for i in range(15)], [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8])
+
+    # 절/변수 비가 4.26 근처인 무작위 3-CNF는 답이 있는 것과 없는 것이 섞여 있다.
+    def test_random_cnf(self):
+        random: Random = Random(3)
+        outcomes: List[bool] = []
+        for _ in range(300):
+            n: int = random.randint(3, 12)
+            clauses: List[List[int]] = random_cnf(random, n, round(n * random.uniform(3.0, 6.0)))
+            solver: SATSolver = make_solver(n, clauses)
+            result = solver.solve()
+            self.assertEqual(result, count_models(n, clauses) > 0)
+            if result:
+                self.assertTrue(satisfies(solver.model(), clauses))
+            outcomes.append(result)
+        self.assertIn(True, outcomes)
+        self.assertIn(False, outcomes)
+
+    # 답을 찾을 때마다 그 답을 막는 절을 더하면, 모든 답을 한 번씩 찾은 뒤 False가 된다.
+    def test_incremental_enumeration(self):
+        random: Random = Random(5)
+        for _ in range(50):
+            n: int = random.randint(3, 8)
+            clauses: List[List[int]] = random_cnf(random, n, random.randint(1, 3 * n))
+            solver: SATSolver = make_solver(n, clauses)
+            models: set = set()
+            while solver.solve():
+                model: Dict[int, bool] = solver.model()
+                self.assertTrue(satisfies(model, clauses))
+                models.add(tuple(sorted(model.items())))
+                solver.add_clause([-x if value else x for x, value in model.items()])
+            self.assertEqual(len(models), count_models(n, clauses))
+
+    def test_pigeonhole(self):
+        self.assertTrue(make_solver(20, pigeonhole(4, 5)).solve())
+        solver: SATSolver = make_solver(30, pigeonhole(6, 5))
+        self.assertFalse(solver.solve())
+        self.assertGreater(solver.conflicts, 0)
+
+    def test_trivial_contradictions(self):
+        solver: SATSolver = make_solver(1, [[1]])
+        self.assertFalse(solver.add_clause([-1]))
+        self.assertFalse(solver.solve())
+        self.assertFalse(make_solver(1, [[]]).solve())
+        with self.assertRaises(ValueError):
+            make_solver(1, [[2]])
+
+    def test_conflict_budget(self):
+        # 비둘기 집 문제는 어렵기 때문에 충돌 10번 안에 끝나지 않는다.
+        self.assertIsNone(make_solver(72, pigeonhole(9, 8)).solve(max_conflicts=10))
+
+
+if __name__ == "__main__":
+    unittest.main()
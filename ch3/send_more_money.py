@@ -13,14 +13,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from csp import Constraint, CSP
-from typing import Dict, List, Optional
+from csp import IncrementalConstraint, CSP
+from typing import Dict, List, Optional, Set
 
 
-class SendMoreMoneyConstraint(Constraint[str, int]):
+class SendMoreMoneyConstraint(IncrementalConstraint[str, int]):
     def __init__(self, letters: List[str]) -> None:
         super().__init__(letters)
         self.letters: List[str] = letters
+        # 점진적 검사 상태: 사용한 숫자와 중복 없이 할당된 문자
+        self._used: Set[int] = set()
+        self._placed: Dict[str, int] = {}
+        self._conflicting: Set[str] = set()  # 중복된 숫자가 할당된 문자
 
     def satisfied(self, assignment: Dict[str, int]) -> bool:
         # 중복 값이 있다면, 이 할당은 답이 아니다.
@@ -43,6 +47,25 @@ class SendMoreMoneyConstraint(Constraint[str, int]):
             return send + more == money
         return True  # 충돌 없음
 
+    def on_assign(self, variable: str, value: int) -> None:
+        if value in self._used:
+            self._conflicting.add(variable)
+            return
+        self._used.add(value)
+        self._placed[variable] = value
+
+    def on_unassign(self, variable: str) -> None:
+        if variable in self._conflicting:
+            self._conflicting.remove(variable)
+            return
+        self._used.remove(self._placed.pop(variable))
+
+    def is_violated(self) -> bool:
+        if self._conflicting:
+            return True
+        # 모든 문자에 숫자가 할당되었을 때만 계산을 확인한다.
+        return len(self._placed) == len(self.letters) and not self.satisfied(self._placed)
+
 
 if __name__ == "__main__":
     letters: List[str] = ["S", "E", "N", "D", "M", "O", "R", "Y"]
@@ -0,0 +1,58 @@
+# word_search_tests.py
+# From Classic Computer Science Problems in Python Chapter 3
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import Dict, List
+from random import Random
+from csp import CSP
+from word_search import Grid, Placement, WordSearchConstraint, generate_domain
+
+
+class WordSearchTestCase(unittest.TestCase):
+    # 도메인이 generate_domain의 리스트가 아니어도(걸러지거나 순서가 바뀌어도)
+    # order_placements와 select_word는 지금 놓을 수 있는 배치를 정확히 세어야 한다.
+    def test_changed_domains(self):
+        random: Random = Random(3)
+        grid: Grid = [["A"] * 6 for _ in range(6)]
+        words: List[str] = ["CAT", "DOG", "BIRD", "FISH"]
+        for trial in range(3):
+            domains: Dict[str, List[Placement]] = {}
+            for word in words:
+                domain: List[Placement] = list(generate_domain(word, grid))
+                if trial > 0:
+                    random.shuffle(domain)
+                if trial > 1:
+                    domain = domain[::2]
+                domains[word] = domain
+            csp: CSP[str, Placement] = CSP(words, domains)
+            constraint: WordSearchConstraint = WordSearchConstraint(words, grid)
+            csp.add_constraint(constraint)
+
+            def checked_select(csp: CSP[str, Placement], unassigned: List[str],
+                               assignment: Dict[str, Placement]) -> str:
+                for word in unassigned:
+                    expected: List[Placement] = [p for p in csp.domains[word]
+                                                 if csp.consistent(word, {**assignment, word: p})]
+                    self.assertEqual(constraint.order_placements(csp, word, assignment), expected)
+                return constraint.select_word(csp, unassigned, assignment)
+
+            solution = csp.backtracking_search(select_variable=checked_select,
+                                               order_values=constraint.order_placements)
+            self.assertIsNotNone(solution)
+            self.assertTrue(constraint.satisfied(solution))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+# all_pairs.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import TypeVar, List, Optional, Dict, Tuple, Union
+from heapq import heappush, heappop
+from array import array
+from multiprocessing import Pool, RawArray
+import mmap
+import os
+from weighted_graph import WeightedGraph
+from csr_graph import CSRGraph
+
+V = TypeVar('V')  # 그래프 정점(vertice) 타입
+
+# 에지 밀도(에지 수 / 정점 수^2)가 이 값 이상이면 플로이드-워셜을 쓴다. 정점마다의 다익스트라는
+# 파이썬으로 에지 하나에 약 1마이크로초, NumPy 플로이드-워셜은 행렬 원소 하나에 약 1나노초가 들어서
+# V * E * 1us와 V^3 * 1ns가 같아지는 밀도가 0.001 정도다.
+DENSE_THRESHOLD: float = 0.001
+
+
+# 디스크의 float32 거리 행렬을 메모리 맵으로 연다. 파일은 헤더 없이 정점 인덱스 순서의
+# 행 우선(row-major) float32 배열이므로 NumPy에서 np.memmap(path, np.float32, shape=(n, n))으로도
+# 열 수 있다. 경로가 없는 정점 쌍의 거리는 inf다.
+class DistanceMatrix:
+    def __init__(self, path: str, vertex_count: int, writable: bool = False) -> None:
+        self.path: str = path
+        self.vertex_count: int = vertex_count
+        size: int = 4 * vertex_count * vertex_count
+        with open(path, "r+b" if writable else "rb") as f:
+            if os.fstat(f.fileno()).st_size != size:
+                raise ValueError(f"{path}의 크기가 정점 {vertex_count}개의 거리 행렬과 다릅니다.")
+            # 크기가 0인 파일은 매핑할 수 없다(정점이 없는 그래프).
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(
+                f.fileno(), size, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ) if size else None
+        self._view: memoryview = memoryview(self._mmap if self._mmap is not None else b"").cast('f')
+
+    def __getitem__(self, pair: Tuple[int, int]) -> float:
+        u, v = pair
+        return self._view[u * self.vertex_count + v]
+
+    # 정점 u에서 모든 정점까지의 거리(복사하지 않는 float32 뷰)
+    def row(self, u: int) -> memoryview:
+        return self._view[u * self.vertex_count:(u + 1) * self.vertex_count]
+
+    # 같은 파일을 (n, n) 모양의 np.memmap으로 연다. NumPy가 있어야 한다.
+    def to_numpy(self, mode: str = "r"):
+        import numpy as np
+        return np.memmap(self.path, dtype=np.float32, mode=mode, shape=(self.vertex_count, self.vertex_count))
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> DistanceMatrix:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def _numpy_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# 에지 밀도로 "dijkstra"(희소) 또는 "floyd_warshall"(밀집)을 고른다.
+# NumPy가 없으면 순수 파이썬 플로이드-워셜은 너무 느리므로 항상 "dijkstra"다.
+def choose_strategy(vertex_count: int, edge_count: int) -> str:
+    if vertex_count == 0 or not _numpy_available():
+        return "dijkstra"
+    return "floyd_warshall" if edge_count / vertex_count ** 2 >= DENSE_THRESHOLD else "dijkstra"
+
+
+# 모든 정점 쌍의 최단 거리를 path에 float32 행렬로 쓰고 DistanceMatrix로 연다.
+# strategy는 "dijkstra"(정점마다 다익스트라를 workers개의 프로세스로 나누어 실행하고, 그래프는
+# 공유 메모리로 넘긴다), "floyd_warshall"(NumPy 블록 플로이드-워셜), "auto"(choose_strategy)다.
+# 행렬 전체를 메모리에 올리지 않고 결과를 바로 파일에 쓴다. float32라서 거리는 유효 숫자 7자리 정도다.
+def all_pairs_shortest_paths(graph: Union[WeightedGraph[V], CSRGraph[V]], path: str,
+                             strategy: str = "auto", workers: Optional[int] = None,
+                             block: int = 64) -> DistanceMatrix:
+    csr: CSRGraph[V] = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    if csr.weights is None:
+        raise ValueError("가중치 그래프가 필요합니다.")
+    n: int = csr.vertex_count
+    if strategy == "auto":
+        strategy = choose_strategy(n, csr.edge_count)
+    if strategy not in ("dijkstra", "floyd_warshall"):
+        raise ValueError(f"알 수 없는 전략입니다: {strategy}")
+    if strategy == "floyd_warshall" and not _numpy_available():
+        raise ValueError("floyd_warshall 전략에는 NumPy가 필요합니다. NumPy를 설치하거나 \"dijkstra\" 전략을 쓰세요.")
+    with open(path, "wb") as f:
+        f.truncate(4 * n * n)
+    if strategy == "dijkstra":
+        _all_dijkstra(csr, path, workers or os.cpu_count() or 1)
+    else:
+        _floyd_warshall(csr, path, block)
+    return DistanceMatrix(path, n)
+
+
+# 작업 프로세스가 공유하는 그래프 배열과 출력 파일. _start_worker가 프로세스마다 한 번 설정한다.
+_shared: Dict[str, object] = {}
+
+
+def _start_worker(offsets: RawArray, targets: RawArray, weights: RawArray, path: str) -> None:
+    _shared["offsets"] = memoryview(offsets).cast('B').cast('q')
+    _shared["targets"] = memoryview(targets).cast('B').cast('q')
+    _shared["weights"] = memoryview(weights).cast('B').cast('d')
+    _shared["path"] = path
+
+
+# 시작 정점 [start, end)마다 다익스트라를 실행하고 그 행을 출력 파일에 쓴다.
+# 작업마다 쓰는 행이 겹치지 않으므로 여러 프로세스가 같은 파일에 동시에 써도 된다.
+def _dijkstra_rows(bounds: Tuple[int, int]) -> None:
+    start, end = bounds
+    offsets: memoryview = _shared["offsets"]
+    targets: memoryview = _shared["targets"]
+    weights: memoryview = _shared["weights"]
+    n: int = len(offsets) - 1
+    inf: float = float("inf")
+    with open(_shared["path"], "r+b") as f:
+        for source in range(start, end):
+            distances: List[float] = [inf] * n
+            distances[source] = 0
+            heap: List[Tuple[float, int]] = [(0, source)]
+            while heap:
+                dist_u, u = heappop(heap)
+                if dist_u > distances[u]:
+                    continue  # 오래된 항목
+                for i in range(offsets[u], offsets[u + 1]):
+                    v: int = targets[i]
+                    candidate: float = dist_u + weights[i]
+                    if candidate < distances[v]:
+                        distances[v] = candidate
+                        heappush(heap, (candidate, v))
+            f.seek(4 * n * source)
+            f.write(array('f', distances).tobytes())
+
+
+def _all_dijkstra(csr: CSRGraph[V], path: str, workers: int) -> None:
+    shared: List[RawArray] = []
+    for data, typecode in ((csr.offsets, 'q'), (csr.targets, 'q'), (csr.weights, 'd')):
+        raw: RawArray = RawArray(typecode, len(data))
+        memoryview(raw).cast('B')[:] = data.cast('B')
+        shared.append(raw)
+    n: int = csr.vertex_count
+    size: int = max(1, -(-n // (workers * 4)))  # 프로세스마다 작업 4개 정도
+    chunks: List[Tuple[int, int]] = [(start, min(start + size, n)) for start in range(0, n, size)]
+    if workers > 1:
+        with Pool(workers, _start_worker, shared + [path]) as pool:
+            pool.map(_dijkstra_rows, chunks)
+    else:
+        _start_worker(*shared, path)
+        try:
+            for chunk in chunks:
+                _dijkstra_rows(chunk)
+        finally:
+            _shared.clear()
+
+
+# 블록 플로이드-워셜. 경유 정점을 block개씩 묶어서, 먼저 그 블록의 행들(경유 정점 자신의 행)에
+# 보통의 플로이드-워셜을 하고, 나머지 행 블록은 한 번 읽어서 블록 안의 경유 정점을 모두 적용한다.
+# 경유 정점의 행이 이미 블록 안의 나중 정점까지 반영되어 있어도 모두 실제 경로의 길이이므로 결과는 같다.
+# 행렬은 출력 파일의 np.memmap 위에서 그대로 갱신한다.
+def _floyd_warshall(csr: CSRGraph[V], path: str, block: int) -> None:
+    import numpy as np
+    n: int = csr.vertex_count
+    if n == 0:
+        return
+    distances = np.memmap(path, dtype=np.float32, mode="r+", shape=(n, n))
+    offsets, targets, weights = csr.to_numpy()
+    distances[:] = np.inf
+    sources = np.repeat(np.arange(n), np.diff(offsets))
+    # 평행 에지가 있으면 가장 가벼운 것을 쓴다.
+    np.minimum.at(distances, (sources, targets), weights.astype(np.float32))
+    np.fill_diagonal(distances, 0)
+    for k_start in range(0, n, block):
+        k_end: int = min(k_start + block, n)
+        pivots = distances[k_start:k_end]
+        for k in range(k_start, k_end):
+            np.minimum(pivots, pivots[:, k, None] + distances[k], out=pivots)
+        for i_start in range(0, n, block):
+            if i_start == k_start:
+                continue
+            rows = distances[i_start:i_start + block]
+            for k in range(k_start, k_end):
+                np.minimum(rows, rows[:, k, None] + distances[k], out=rows)
+    distances.flush()
+    del distances
+
+
+if __name__ == "__main__":
+    import tempfile
+    from time import perf_counter
+    from benchmark import random_weighted_graph
+
+    with tempfile.TemporaryDirectory() as directory:
+        for n, m in [(1000, 3000), (1000, 100000)]:
+            graph: WeightedGraph[int] = random_weighted_graph(n, m)
+            strategies: List[str] = ["dijkstra", "floyd_warshall"] if _numpy_available() else ["dijkstra"]
+            print(f"무작위 그래프(정점 {n}, 에지 {m}): auto -> "
+                  f"{choose_strategy(graph.vertex_count, graph.edge_count)}")
+            for strategy in strategies:
+                start: float = perf_counter()
+                with all_pairs_shortest_paths(graph, os.path.join(directory, f"{strategy}.f32"),
+                                              strategy) as matrix:
+                    print(f"  {strategy:14} {perf_counter() - start:7.2f}초, "
+                          f"0에서 {n - 1}까지 {matrix[0, n - 1]:.2f}")
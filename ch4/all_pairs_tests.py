@@ -0,0 +1,81 @@
+# all_pairs_tests.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+import os
+from typing import List, Optional
+from random import Random
+from array import array
+from weighted_graph import WeightedGraph
+from csr_graph import CSRGraph
+from dijkstra import dijkstra
+from benchmark import random_weighted_graph
+from fixtures import GraphTestCase
+from all_pairs import all_pairs_shortest_paths, DistanceMatrix, _numpy_available
+
+
+class AllPairsTestCase(GraphTestCase):
+    def setUp(self) -> None:
+        self.path: str = self.temporary_path("distances.f32")
+
+    # 모든 행이 그 정점에서 시작한 dijkstra와 같은지 확인한다. 경로가 없으면 inf다.
+    def assert_matches_dijkstra(self, graph: WeightedGraph[int], **options) -> None:
+        with all_pairs_shortest_paths(graph, self.path, **options) as matrix:
+            self.assertEqual(matrix.vertex_count, graph.vertex_count)
+            for u in range(graph.vertex_count):
+                expected: List[Optional[float]] = dijkstra(graph, u)[0]
+                self.assertEqual(list(matrix.row(u)),
+                                 [float("inf") if d is None else d for d in expected])
+
+    def test_dijkstra_strategy(self):
+        random: Random = Random(12)
+        for _ in range(20):
+            n: int = random.randint(0, 30)
+            # 가중치가 작은 정수라서 float32 행렬에서도 거리가 정확하다.
+            graph: WeightedGraph[int] = random_weighted_graph(n, random.randint(0, 3 * n), random, connected=False,
+                                                              loops=True, max_weight=20)
+            for workers in (1, 2):
+                self.assert_matches_dijkstra(graph, strategy="dijkstra", workers=workers)
+
+    @unittest.skipUnless(_numpy_available(), "NumPy가 필요합니다.")
+    def test_floyd_warshall_strategy(self):
+        random: Random = Random(13)
+        for _ in range(20):
+            n: int = random.randint(0, 30)
+            # 블록 크기를 작게 두어 여러 블록으로 나뉘게 한다.
+            self.assert_matches_dijkstra(random_weighted_graph(n, random.randint(0, 3 * n), random, connected=False,
+                                                               loops=True, max_weight=20),
+                                         strategy="floyd_warshall", block=4)
+
+    @unittest.skipIf(_numpy_available(), "NumPy가 없을 때의 동작이다.")
+    def test_floyd_warshall_without_numpy(self):
+        with self.assertRaises(ValueError):
+            all_pairs_shortest_paths(random_weighted_graph(5, 10), self.path, strategy="floyd_warshall")
+        self.assertFalse(os.path.exists(self.path))  # 출력 파일을 만들기 전에 실패해야 한다.
+
+    def test_invalid_arguments(self):
+        graph: WeightedGraph[int] = random_weighted_graph(5, 10)
+        with self.assertRaises(ValueError):
+            all_pairs_shortest_paths(graph, self.path, strategy="bellman_ford")
+        with self.assertRaises(ValueError):
+            all_pairs_shortest_paths(CSRGraph([0], array('q', [0, 0]), array('q')), self.path)  # 가중치 없음
+        with all_pairs_shortest_paths(graph, self.path, strategy="dijkstra", workers=1):
+            pass
+        with self.assertRaises(ValueError):
+            DistanceMatrix(self.path, 6)  # 크기가 다른 행렬
+
+
+if __name__ == "__main__":
+    unittest.main()
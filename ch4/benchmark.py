@@ -0,0 +1,167 @@
+# benchmark.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Callable, Tuple, Any, Union, Optional
+from random import Random
+from time import perf_counter
+import tracemalloc
+import os
+from weighted_graph import WeightedGraph
+from csr_graph import CSRGraph
+from dijkstra import dijkstra, dijkstra_csr, lazy_dijkstra, DijkstraNode
+from mst import mst, mst_csr, prim, kruskal, boruvka, total_weight
+from priority_queue import PriorityQueue, IndexedHeap, PairingHeap
+from shortest_path import shortest_path, bidirectional_dijkstra
+from contraction import ContractionHierarchy
+
+
+# 정점 n개, 에지 m개의 무작위 가중치 그래프. connected면 먼저 무작위 신장 트리를 만들어 연결을 보장한다.
+# 평행 에지가 생길 수 있고, loops면 자기 루프도 생긴다. max_weight를 주면 가중치가 1 ~ max_weight의
+# 정수라서 거리를 정확히 비교할 수 있다(테스트용). seed 대신 Random을 넘기면 그 난수열을 이어서 쓴다.
+def random_weighted_graph(n: int, m: int, seed: Union[int, Random] = 0, connected: bool = True,
+                          loops: bool = False, max_weight: Optional[int] = None) -> WeightedGraph[int]:
+    random: Random = seed if isinstance(seed, Random) else Random(seed)
+
+    def weight() -> float:
+        return random.uniform(1, 100) if max_weight is None else random.randint(1, max_weight)
+
+    graph: WeightedGraph[int] = WeightedGraph(list(range(n)))
+    triples: List[Tuple[int, int, float]] = [(v, random.randrange(v), weight())
+                                             for v in range(1, n)] if connected else []
+    # 정점이 하나뿐이면 자기 루프 말고는 에지를 만들 수 없다.
+    while len(triples) < m and (n > 1 or (loops and n == 1)):
+        u, v = random.randrange(n), random.randrange(n)
+        if loops or u != v:
+            triples.append((u, v, weight()))
+    graph.add_edges_from(triples)
+    return graph
+
+
+# 가로 width, 세로 height인 격자 모양의 무작위 가중치 그래프. 정점은 (x, y)이고
+# 도로망처럼 평면에 가깝고 차수가 작아서 축약 계층의 효과를 보기 좋다.
+def random_grid_graph(width: int, height: int, seed: int = 0) -> WeightedGraph[Tuple[int, int]]:
+    random: Random = Random(seed)
+    graph: WeightedGraph[Tuple[int, int]] = WeightedGraph([(x, y) for y in range(height) for x in range(width)])
+    triples: List[Tuple[Tuple[int, int], Tuple[int, int], float]] = []
+    for y in range(height):
+        for x in range(width):
+            if x + 1 < width:
+                triples.append(((x, y), (x + 1, y), random.uniform(1, 10)))
+            if y + 1 < height:
+                triples.append(((x, y), (x, y + 1), random.uniform(1, 10)))
+    graph.add_edges_from(triples)
+    return graph
+
+
+def timed(run: Callable[[], Any]) -> Tuple[float, Any]:
+    start: float = perf_counter()
+    result: Any = run()
+    return perf_counter() - start, result
+
+
+# 에지 객체 리스트와 CSR 배열의 메모리와 다익스트라, 최소 신장 트리 실행 시간을 비교한다.
+def csr_benchmark(n: int = 100000, m: int = 500000) -> None:
+    tracemalloc.start()
+    graph: WeightedGraph[int] = random_weighted_graph(n, m)
+    graph_memory: int = tracemalloc.get_traced_memory()[0]
+    csr: CSRGraph[int] = CSRGraph.from_graph(graph)
+    csr_memory: int = tracemalloc.get_traced_memory()[0] - graph_memory
+    tracemalloc.stop()
+    print(f"무작위 그래프(정점 {n}, 에지 {m})")
+    print(f"  메모리: WeightedGraph {graph_memory / 2 ** 20:.0f}MB, CSR {csr_memory / 2 ** 20:.0f}MB")
+    for name, run in [("dijkstra", lambda: dijkstra(graph, 0)),
+                      ("dijkstra_csr", lambda: dijkstra_csr(csr, 0)),
+                      ("mst", lambda: total_weight(mst(graph))),
+                      ("mst_csr", lambda: total_weight(mst_csr(csr)))]:
+        seconds, _ = timed(run)
+        print(f"  {name:14} {seconds:8.3f}초")
+
+
+# 넣은 항목 수와 가장 컸던 크기를 세는 PriorityQueue
+class CountingQueue(PriorityQueue[DijkstraNode]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.pushes: int = 0
+        self.peak: int = 0
+
+    def push(self, item: DijkstraNode) -> None:
+        super().push(item)
+        self.pushes += 1
+        self.peak = max(self.peak, len(self._container))
+
+
+# 원래의 지연 다익스트라와 decrease-key 큐(이진 힙, 4-진 힙, 페어링 힙)를 비교한다.
+def heap_benchmark(n: int = 100000, m: int = 500000) -> None:
+    graph: WeightedGraph[int] = random_weighted_graph(n, m)
+    print(f"무작위 그래프(정점 {n}, 에지 {m})")
+    counting: CountingQueue = CountingQueue()
+    seconds, _ = timed(lambda: lazy_dijkstra(graph, 0, counting))
+    print(f"  {'dijkstra(지연)':18} {seconds:8.3f}초 넣은 항목 {counting.pushes:8} 최대 크기 {counting.peak:8}")
+    queues: List[Tuple[str, Callable[[int], Union[IndexedHeap, PairingHeap]]]] = [
+        ("이진 힙", IndexedHeap), ("4-진 힙", lambda size: IndexedHeap(size, 4)), ("페어링 힙", PairingHeap)]
+    for name, factory in queues:
+        created: List[Union[IndexedHeap, PairingHeap]] = []
+
+        def make(size: int) -> Union[IndexedHeap, PairingHeap]:
+            created.append(factory(size))
+            return created[-1]
+        seconds, _ = timed(lambda: dijkstra(graph, 0, make))
+        print(f"  {'dijkstra(' + name + ')':18} {seconds:8.3f}초 최대 크기 {created[-1].peak:8}")
+    seconds, _ = timed(lambda: mst(graph))
+    print(f"  {'mst(지연 프림)':18} {seconds:8.3f}초")
+    for name, factory in queues:
+        seconds, _ = timed(lambda: prim(graph, 0, factory))
+        print(f"  {'prim(' + name + ')':18} {seconds:8.3f}초")
+
+
+# 같은 질의들을 다익스트라, 조기 종료, 양방향 다익스트라, 축약 계층으로 풀어서 비교한다.
+def contraction_benchmark(width: int = 100, height: int = 100, queries: int = 100) -> None:
+    graph: WeightedGraph[Tuple[int, int]] = random_grid_graph(width, height)
+    random: Random = Random(1)
+    pairs: List[Tuple[Tuple[int, int], Tuple[int, int]]] = [
+        (graph.vertex_at(random.randrange(graph.vertex_count)), graph.vertex_at(random.randrange(graph.vertex_count)))
+        for _ in range(queries)]
+    print(f"격자 그래프({width}x{height}), 질의 {queries}개")
+    seconds, hierarchy = timed(lambda: ContractionHierarchy.from_graph(graph))
+    print(f"  전처리 {seconds:.2f}초, 지름길 {hierarchy.shortcut_count}개")
+    for name, run in [("dijkstra", lambda s, t: dijkstra(graph, s)),
+                      ("shortest_path", lambda s, t: shortest_path(graph, s, t)),
+                      ("bidirectional_dijkstra", lambda s, t: bidirectional_dijkstra(graph, s, t)),
+                      ("ContractionHierarchy.query", hierarchy.query)]:
+        seconds, _ = timed(lambda: [run(s, t) for s, t in pairs])
+        print(f"  {name:26} 질의당 {seconds / queries * 1000:8.3f}ms")
+
+
+# 10^6개 에지의 무작위 그래프에서 최소 신장 트리 알고리즘들을 비교한다.
+# 보루프카는 프로세스 1개와 CPU 수만큼(2개 이상)으로 실행한다.
+def spanning_tree_benchmark(n: int = 200000, m: int = 1000000) -> None:
+    graph: WeightedGraph[int] = random_weighted_graph(n, m)
+    csr: CSRGraph[int] = CSRGraph.from_graph(graph)
+    workers: int = max(2, os.cpu_count() or 1)
+    print(f"무작위 그래프(정점 {n}, 에지 {m})")
+    for name, run in [("mst(지연 프림)", lambda: mst(graph)),
+                      ("prim", lambda: prim(graph)),
+                      ("kruskal", lambda: kruskal(graph)),
+                      ("boruvka(프로세스 1개)", lambda: boruvka(csr, 1)),
+                      (f"boruvka(프로세스 {workers}개)", lambda: boruvka(csr, workers))]:
+        seconds, tree = timed(run)
+        print(f"  {name:22} {seconds:8.3f}초 가중치 총합 {total_weight(tree):.1f}")
+
+
+if __name__ == "__main__":
+    csr_benchmark()
+    heap_benchmark()
+    contraction_benchmark()
+    spanning_tree_benchmark()
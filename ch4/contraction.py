@@ -0,0 +1,348 @@
+# contraction.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import TypeVar, Generic, List, Optional, Dict, Tuple, Sequence, Set
+from heapq import heapify, heappush, heappop
+from array import array
+import json
+import sys
+from graph import vertex_not_found
+from mst import WeightedPath
+from weighted_graph import WeightedGraph
+from weighted_edge import WeightedEdge
+
+V = TypeVar('V')  # 그래프 정점(vertice) 타입
+
+MAGIC: bytes = b"CH01"  # save()가 쓰는 파일의 첫 4바이트
+
+
+# 축약 계층(contraction hierarchies). 전처리에서 정점을 중요도가 낮은 것부터 하나씩 축약(contract)한다.
+# 정점 v를 없앨 때 이웃 u, w 사이의 최단 경로가 u-v-w뿐이면 가중치가 그 합인 지름길(shortcut)
+# u-w를 추가한다. 그러면 어떤 최단 경로든 순위(rank)가 올라가다가 내려가는 경로로 바꿀 수 있으므로,
+# 질의는 양쪽에서 순위가 높아지는 쪽(upward) 에지만 따라가는 양방향 다익스트라로 충분하다.
+# 위쪽 그래프는 CSR 배열로 저장한다. 정점 v의 위쪽 에지는 offsets[v]:offsets[v + 1] 위치이고,
+# middles는 지름길이 건너뛴 정점이다(원래 에지는 -1).
+class ContractionHierarchy(Generic[V]):
+    def __init__(self, vertices: Sequence[V], rank: array, offsets: array, targets: array,
+                 weights: array, middles: array) -> None:
+        if not len(rank) == len(offsets) - 1 == len(vertices):
+            raise ValueError("rank와 offsets의 길이가 정점 수와 맞지 않습니다.")
+        if not len(targets) == len(weights) == len(middles) == offsets[-1]:
+            raise ValueError("에지 배열의 길이가 서로 다릅니다.")
+        self._vertices: List[V] = list(vertices)
+        self._indices: Dict[V, int] = {}
+        for index, vertex in enumerate(self._vertices):
+            self._indices.setdefault(vertex, index)
+        self.rank: array = rank
+        self.offsets: array = offsets
+        self.targets: array = targets
+        self.weights: array = weights
+        self.middles: array = middles
+
+    # 전처리. 정점을 에지 차이(edge difference: 추가할 지름길 수 - 없어지는 에지 수)에
+    # 이미 축약된 이웃 수를 더한 값이 작은 것부터 축약한다. 축약할 때마다 이웃의 값이 바뀌므로
+    # 큐에서 꺼낸 정점의 값을 다시 계산해서 다음 후보보다 커졌으면 도로 넣는다(lazy update).
+    # max_settled는 목격자 탐색(witness search)에서 확정할 정점 수의 한도다. 한도 때문에 우회로를
+    # 못 찾으면 필요 없는 지름길이 조금 더 생길 뿐 결과는 여전히 정확하다.
+    @classmethod
+    def from_graph(cls, wg: WeightedGraph[V], max_settled: int = 100) -> ContractionHierarchy[V]:
+        n: int = wg.vertex_count
+        # 아직 축약하지 않은 정점 사이의 에지: 정점 -> 이웃 -> (가중치, 건너뛴 정점)
+        graph: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+        for u in range(n):
+            for edge in wg.edges_for_index(u):
+                if edge.v != u and (edge.v not in graph[u] or edge.weight < graph[u][edge.v][0]):
+                    graph[u][edge.v] = (edge.weight, -1)
+        deleted: List[int] = [0] * n  # 이미 축약된 이웃의 수
+
+        def priority(v: int) -> int:
+            return len(_shortcuts(graph, v, max_settled)) - len(graph[v]) + deleted[v]
+
+        current: List[int] = [priority(v) for v in range(n)]
+        heap: List[Tuple[int, int]] = [(current[v], v) for v in range(n)]
+        heapify(heap)
+        rank: array = array('q', [0]) * n
+        upward: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+        contracted: List[bool] = [False] * n
+        order: int = 0
+        while heap:
+            value, v = heappop(heap)
+            if contracted[v] or value != current[v]:
+                continue  # 오래된 항목
+            shortcuts: List[Tuple[int, int, float]] = _shortcuts(graph, v, max_settled)
+            current[v] = len(shortcuts) - len(graph[v]) + deleted[v]
+            if heap and current[v] > heap[0][0]:
+                heappush(heap, (current[v], v))
+                continue
+            # 남은 이웃은 모두 v보다 나중에 축약되므로 순위가 높다. 이 에지가 v의 위쪽 에지다.
+            upward[v] = graph[v]
+            rank[v] = order
+            order += 1
+            contracted[v] = True
+            for u in graph[v]:
+                del graph[u][v]
+                deleted[u] += 1
+            for u, w, weight in shortcuts:
+                if w not in graph[u] or weight < graph[u][w][0]:
+                    graph[u][w] = graph[w][u] = (weight, v)
+            for u in upward[v]:
+                current[u] = priority(u)
+                heappush(heap, (current[u], u))
+            graph[v] = {}
+
+        offsets: array = array('q', [0])
+        targets: array = array('q')
+        weights: array = array('d')
+        middles: array = array('q')
+        for v in range(n):
+            for w, (weight, middle) in upward[v].items():
+                targets.append(w)
+                weights.append(weight)
+                middles.append(middle)
+            offsets.append(len(targets))
+        return cls([wg.vertex_at(i) for i in range(n)], rank, offsets, targets, weights, middles)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self._vertices)
+
+    @property
+    def shortcut_count(self) -> int:
+        return sum(1 for middle in self.middles if middle >= 0)
+
+    def vertex_at(self, index: int) -> V:
+        return self._vertices[index]
+
+    def index_of(self, vertex: V) -> int:
+        try:
+            return self._indices[vertex]
+        except KeyError:
+            raise vertex_not_found(vertex) from None
+
+    # 두 정점 사이의 최단 거리. 경로가 없으면 None
+    def distance(self, source: V, target: V) -> Optional[float]:
+        best, _, _, _ = self._search(self.index_of(source), self.index_of(target))
+        return None if best == float("inf") else best
+
+    # 두 정점 사이의 최단 경로. 지름길을 원래 에지로 풀어서 dijkstra와 같은 WeightedPath로 반환한다.
+    # 경로가 없으면 None
+    def query(self, source: V, target: V) -> Optional[WeightedPath]:
+        first: int = self.index_of(source)
+        last: int = self.index_of(target)
+        best, meeting, forward, backward = self._search(first, last)
+        if best == float("inf"):
+            return None
+        # 앞쪽 탐색의 부모를 따라 meeting에서 source까지 거슬러 올라간 뒤 뒤집는다.
+        chain: List[Tuple[int, int, int]] = []
+        v: int = meeting
+        while v != first:
+            u, position = forward[v]
+            chain.append((u, v, position))
+            v = u
+        path: WeightedPath = []
+        for u, v, position in reversed(chain):
+            self._unpack(u, v, position, path)
+        # 뒤쪽 탐색의 부모는 target 쪽이므로 그대로 따라간다.
+        v = meeting
+        while v != last:
+            u, position = backward[v]
+            self._unpack(v, u, position, path)
+            v = u
+        return path
+
+    # 양방향 위쪽 탐색. (최단 거리, 만난 정점, 앞쪽 부모, 뒤쪽 부모)를 반환한다.
+    # 부모는 정점 -> (부모 정점, 에지 위치)다. 위쪽 탐색은 목표를 지나쳐 올라갈 수 있으므로
+    # 보통의 양방향 다익스트라처럼 일찍 멈출 수 없고, 한쪽 큐의 최솟값이 최단 거리 이상이면 그쪽을 끝낸다.
+    def _search(self, first: int, last: int
+                ) -> Tuple[float, int, Dict[int, Tuple[int, int]], Dict[int, Tuple[int, int]]]:
+        inf: float = float("inf")
+        offsets: array = self.offsets
+        targets: array = self.targets
+        weights: array = self.weights
+        # 정점 수만큼의 리스트 대신 딕셔너리를 써서 질의마다 O(V) 초기화를 하지 않는다.
+        distances: Tuple[Dict[int, float], Dict[int, float]] = ({first: 0}, {last: 0})
+        parents: Tuple[Dict[int, Tuple[int, int]], Dict[int, Tuple[int, int]]] = ({}, {})
+        heaps: Tuple[List[Tuple[float, int]], List[Tuple[float, int]]] = ([(0, first)], [(0, last)])
+        best: float = 0 if first == last else inf
+        meeting: int = first if first == last else -1
+        while heaps[0] or heaps[1]:
+            side: int = 0 if heaps[0] and (not heaps[1] or heaps[0][0][0] <= heaps[1][0][0]) else 1
+            heap: List[Tuple[float, int]] = heaps[side]
+            dist_u, u = heappop(heap)
+            if dist_u >= best:
+                heap.clear()  # 이쪽에서는 더 짧은 경로를 찾을 수 없다.
+                continue
+            mine: Dict[int, float] = distances[side]
+            if dist_u > mine[u]:
+                continue  # 오래된 항목
+            other: float = distances[1 - side].get(u, inf)
+            if dist_u + other < best:
+                best = dist_u + other
+                meeting = u
+            for i in range(offsets[u], offsets[u + 1]):
+                v: int = targets[i]
+                candidate: float = dist_u + weights[i]
+                if candidate < mine.get(v, inf):
+                    mine[v] = candidate
+                    parents[side][v] = (u, i)
+                    heappush(heap, (candidate, v))
+        return best, meeting, parents[0], parents[1]
+
+    # 위치가 position인 u-v 에지를 원래 에지로 풀어서 path에 u에서 v 방향으로 추가한다.
+    # 지름길 u-v가 건너뛴 정점 m은 u, v보다 순위가 낮으므로 u-m, m-v 에지는 m의 위쪽 에지에 있다.
+    def _unpack(self, u: int, v: int, position: int, path: WeightedPath) -> None:
+        stack: List[Tuple[int, int, int]] = [(u, v, position)]
+        while stack:
+            a, b, i = stack.pop()
+            middle: int = self.middles[i]
+            if middle < 0:
+                path.append(WeightedEdge(a, b, self.weights[i]))
+                continue
+            stack.append((middle, b, self._position(middle, b)))
+            stack.append((a, middle, self._position(middle, a)))
+
+    # 정점 u의 위쪽 에지 중 v로 가는 에지의 위치
+    def _position(self, u: int, v: int) -> int:
+        for i in range(self.offsets[u], self.offsets[u + 1]):
+            if self.targets[i] == v:
+                return i
+        raise ValueError(f"{u}에서 {v}로 가는 위쪽 에지가 없습니다.")
+
+    # 위쪽 그래프를 파일에 저장한다. MAGIC, 헤더 길이(8바이트 리틀 엔디언), JSON 헤더
+    # (정점 리스트와 바이트 순서) 뒤에 rank, offsets, targets, weights, middles 배열이 이어진다.
+    # 정점은 JSON으로 바꿀 수 있는 값이어야 한다(튜플은 load()에서 튜플로 되돌린다).
+    def save(self, path: str) -> None:
+        header: bytes = json.dumps({"vertices": self._vertices, "byteorder": sys.byteorder},
+                                   ensure_ascii=False).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for data in (self.rank, self.offsets, self.targets, self.weights, self.middles):
+                data.tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> ContractionHierarchy:
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"축약 계층 파일이 아닙니다: {path}")
+            header: dict = json.loads(f.read(int.from_bytes(f.read(8), "little")).decode("utf-8"))
+            # JSON에는 튜플이 없으므로 리스트로 저장된 정점(예: 격자 좌표)은 튜플로 되돌린다.
+            vertices: list = [_hashable(vertex) for vertex in header["vertices"]]
+            n: int = len(vertices)
+
+            def read(typecode: str, count: int) -> array:
+                data: array = array(typecode)
+                data.fromfile(f, count)
+                if header["byteorder"] != sys.byteorder:
+                    data.byteswap()
+                return data
+
+            rank: array = read('q', n)
+            offsets: array = read('q', n + 1)
+            m: int = offsets[-1]
+            return cls(vertices, rank, offsets, read('q', m), read('d', m), read('q', m))
+
+
+def _hashable(value):
+    return tuple(_hashable(item) for item in value) if isinstance(value, list) else value
+
+
+# 정점 v를 축약할 때 필요한 지름길 (u, w, 가중치) 리스트. 이웃 u마다 v를 거치지 않는
+# 제한된 다익스트라(목격자 탐색)를 해서 u-v-w보다 길지 않은 우회로가 없는 w에만 지름길을 만든다.
+def _shortcuts(graph: List[Dict[int, Tuple[float, int]]], v: int,
+               max_settled: int) -> List[Tuple[int, int, float]]:
+    neighbors: List[Tuple[int, float]] = [(u, weight) for u, (weight, _) in graph[v].items()]
+    shortcuts: List[Tuple[int, int, float]] = []
+    for i, (u, to_u) in enumerate(neighbors[:-1]):
+        rest: List[Tuple[int, float]] = neighbors[i + 1:]
+        limit: float = to_u + max(weight for _, weight in rest)
+        distances: Dict[int, float] = _witness_search(graph, u, v, {w for w, _ in rest},
+                                                      limit, max_settled)
+        for w, to_w in rest:
+            if distances.get(w, float("inf")) > to_u + to_w:
+                shortcuts.append((u, w, to_u + to_w))
+    return shortcuts
+
+
+# excluded를 거치지 않는 source에서의 거리. targets를 모두 확정하거나, limit보다 멀어지거나,
+# max_settled개를 확정하면 멈춘다. 확정하지 못한 정점의 거리도 실제로 있는 경로의 길이이므로
+# 우회로의 증거로 쓸 수 있다.
+def _witness_search(graph: List[Dict[int, Tuple[float, int]]], source: int, excluded: int,
+                    targets: Set[int], limit: float, max_settled: int) -> Dict[int, float]:
+    distances: Dict[int, float] = {source: 0}
+    heap: List[Tuple[float, int]] = [(0, source)]
+    settled: int = 0
+    remaining: int = len(targets)
+    while heap:
+        dist_u, u = heappop(heap)
+        if dist_u > distances[u]:
+            continue
+        if dist_u > limit or settled >= max_settled:
+            break
+        settled += 1
+        if u in targets:
+            remaining -= 1
+            if remaining == 0:
+                break
+        for v, (weight, _) in graph[u].items():
+            if v != excluded and dist_u + weight < distances.get(v, float("inf")):
+                distances[v] = dist_u + weight
+                heappush(heap, (dist_u + weight, v))
+    return distances
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from mst import print_weighted_path
+    city_graph2: WeightedGraph[str] = WeightedGraph(
+        ["시애틀", "샌프란시스코", "로스앤젤레스", "리버사이드", "피닉스", "시카고", "보스턴", "뉴욕", "애틀랜타", "마이애미", "댈러스", "휴스턴", "디트로이트", "필라델피아", "워싱턴"])
+
+    city_graph2.add_edge_by_vertices("시애틀", "시카고", 1737)
+    city_graph2.add_edge_by_vertices("시애틀", "샌프란시스코", 678)
+    city_graph2.add_edge_by_vertices("샌프란시스코", "리버사이드", 386)
+    city_graph2.add_edge_by_vertices("샌프란시스코", "로스앤젤레스", 348)
+    city_graph2.add_edge_by_vertices("로스앤젤레스", "리버사이드", 50)
+    city_graph2.add_edge_by_vertices("로스앤젤레스", "피닉스", 357)
+    city_graph2.add_edge_by_vertices("리버사이드", "피닉스", 307)
+    city_graph2.add_edge_by_vertices("리버사이드", "시카고", 1704)
+    city_graph2.add_edge_by_vertices("피닉스", "댈러스", 887)
+    city_graph2.add_edge_by_vertices("피닉스", "휴스턴", 1015)
+    city_graph2.add_edge_by_vertices("댈러스", "시카고", 805)
+    city_graph2.add_edge_by_vertices("댈러스", "애틀랜타", 721)
+    city_graph2.add_edge_by_vertices("댈러스", "휴스턴", 225)
+    city_graph2.add_edge_by_vertices("휴스턴", "애틀랜타", 702)
+    city_graph2.add_edge_by_vertices("휴스턴", "마이애미", 968)
+    city_graph2.add_edge_by_vertices("애틀랜타", "시카고", 588)
+    city_graph2.add_edge_by_vertices("애틀랜타", "워싱턴", 543)
+    city_graph2.add_edge_by_vertices("애틀랜타", "마이애미", 604)
+    city_graph2.add_edge_by_vertices("마이애미", "워싱턴", 923)
+    city_graph2.add_edge_by_vertices("시카고", "디트로이트", 238)
+    city_graph2.add_edge_by_vertices("디트로이트", "보스턴", 613)
+    city_graph2.add_edge_by_vertices("디트로이트", "워싱턴", 396)
+    city_graph2.add_edge_by_vertices("디트로이트", "뉴욕", 482)
+    city_graph2.add_edge_by_vertices("보스턴", "뉴욕", 190)
+    city_graph2.add_edge_by_vertices("뉴욕", "필라델피아", 81)
+    city_graph2.add_edge_by_vertices("필라델피아", "워싱턴", 123)
+
+    hierarchy: ContractionHierarchy[str] = ContractionHierarchy.from_graph(city_graph2)
+    print(f"지름길 {hierarchy.shortcut_count}개")
+    with tempfile.TemporaryDirectory() as directory:
+        hierarchy.save(os.path.join(directory, "cities.ch"))
+        hierarchy = ContractionHierarchy.load(os.path.join(directory, "cities.ch"))
+    print("로스앤젤레스에서 보스턴까지의 최단 경로:")
+    print_weighted_path(city_graph2, hierarchy.query("로스앤젤레스", "보스턴"))
@@ -0,0 +1,72 @@
+# contraction_tests.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import List, Optional
+from random import Random
+from weighted_graph import WeightedGraph
+from dijkstra import dijkstra
+from contraction import ContractionHierarchy
+from benchmark import random_weighted_graph, random_grid_graph
+from fixtures import GraphTestCase
+
+
+class ContractionHierarchyTestCase(GraphTestCase):
+    # 모든 정점 쌍에서 축약 계층의 거리가 dijkstra와 같고, 풀어낸 경로가 그래프의 에지로 이어지는지 확인한다.
+    def assert_matches_dijkstra(self, graph: WeightedGraph, ch: ContractionHierarchy) -> None:
+        for source in range(graph.vertex_count):
+            expected: List[Optional[float]] = dijkstra(graph, graph.vertex_at(source))[0]
+            for target in range(graph.vertex_count):
+                u, v = graph.vertex_at(source), graph.vertex_at(target)
+                distance: Optional[float] = ch.distance(u, v)
+                if expected[target] is None:
+                    self.assertIsNone(distance)
+                else:
+                    self.assertAlmostEqual(distance, expected[target])
+                self.assert_path(graph, ch.query(u, v), source, target, expected[target])
+
+    def test_random_graphs(self):
+        random: Random = Random(9)
+        for _ in range(40):
+            n: int = random.randint(1, 25)
+            graph: WeightedGraph[int] = random_weighted_graph(n, random.randint(0, 3 * n), random,
+                                                              connected=False, loops=True, max_weight=20)
+            # 목격자 탐색을 짧게 끊으면 지름길이 더 생기지만 거리는 그대로여야 한다.
+            for max_settled in (1, 100):
+                self.assert_matches_dijkstra(graph, ContractionHierarchy.from_graph(graph, max_settled))
+
+    def test_save_load(self):
+        graphs: List[WeightedGraph] = [random_weighted_graph(30, 80, 4, connected=False, loops=True),
+                                       random_grid_graph(6, 5, seed=2)]
+        path: str = self.temporary_path("graph.ch")
+        for graph in graphs:
+            original: ContractionHierarchy = ContractionHierarchy.from_graph(graph)
+            original.save(path)
+            loaded: ContractionHierarchy = ContractionHierarchy.load(path)
+            self.assertEqual(loaded.shortcut_count, original.shortcut_count)
+            self.assertEqual([loaded.vertex_at(i) for i in range(loaded.vertex_count)],
+                             [graph.vertex_at(i) for i in range(graph.vertex_count)])
+            self.assert_matches_dijkstra(graph, loaded)
+
+    def test_not_a_hierarchy_file(self):
+        path: str = self.temporary_path("graph.ch")
+        with open(path, "wb") as f:
+            f.write(b"not a hierarchy")
+        with self.assertRaises(ValueError):
+            ContractionHierarchy.load(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# csr_graph.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import TypeVar, Generic, List, Optional, Dict, Sequence, Union
+from array import array
+from graph import Graph, vertex_not_found
+from weighted_graph import WeightedGraph
+from edge import Edge
+from weighted_edge import WeightedEdge
+
+V = TypeVar('V')  # 그래프 정점(vertice) 타입
+
+
+# 변경할 수 없는 CSR(compressed sparse row) 그래프.
+# 정점 i의 에지는 targets[offsets[i]:offsets[i + 1]]이고, 가중치 그래프면 같은 위치의
+# weights가 가중치다. 에지마다 객체를 만드는 대신 array 버퍼 세 개에 저장하므로
+# 에지 하나에 8바이트(가중치 그래프는 16바이트)만 쓴다. 무방향 에지는 Graph처럼 양방향으로 저장한다.
+# 배열 대신 memoryview(예: graph_io.load_graph가 메모리 맵한 파일)를 받아도 된다.
+class CSRGraph(Generic[V]):
+    def __init__(self, vertices: Sequence[V], offsets: Union[array, memoryview],
+                 targets: Union[array, memoryview], weights: Union[array, memoryview, None] = None) -> None:
+        if len(offsets) != len(vertices) + 1 or offsets[-1] != len(targets):
+            raise ValueError("offsets는 정점 수 + 1개이고 마지막 값이 에지 수여야 합니다.")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights와 targets의 길이가 다릅니다.")
+        # 리스트는 호출자와 공유하지 않도록 복사하고, 다른 시퀀스(예: 파일에서 필요할 때 읽는 정점 표)는
+        # 그대로 쓴다. 정점 -> 인덱스 딕셔너리는 index_of를 처음 부를 때 만든다.
+        self._vertices: Sequence[V] = list(vertices) if isinstance(vertices, list) else vertices
+        self._indices: Optional[Dict[V, int]] = None
+        # 읽기 전용 memoryview로만 내보내므로 복사 없이 잘라서 볼 수 있다.
+        self.offsets: memoryview = memoryview(offsets).toreadonly()
+        self.targets: memoryview = memoryview(targets).toreadonly()
+        self.weights: Optional[memoryview] = None if weights is None else memoryview(weights).toreadonly()
+
+    # Graph나 WeightedGraph의 에지를 CSR 배열로 옮긴다.
+    @classmethod
+    def from_graph(cls, graph: Graph[V]) -> CSRGraph[V]:
+        offsets: array = array('q', [0])
+        targets: array = array('q')
+        weights: Optional[array] = array('d') if isinstance(graph, WeightedGraph) else None
+        for i in range(graph.vertex_count):
+            edges = graph.edges_for_index(i)
+            targets.extend(edge.v for edge in edges)
+            if weights is not None:
+                weights.extend(edge.weight for edge in edges)
+            offsets.append(len(targets))
+        return cls([graph.vertex_at(i) for i in range(graph.vertex_count)], offsets, targets, weights)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self._vertices)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)  # Graph.edge_count처럼 양방향을 따로 센다.
+
+    @property
+    def weighted(self) -> bool:
+        return self.weights is not None
+
+    def vertex_at(self, index: int) -> V:
+        return self._vertices[index]
+
+    def index_of(self, vertex: V) -> int:
+        if self._indices is None:
+            self._indices = {}
+            for index, item in enumerate(self._vertices):
+                self._indices.setdefault(item, index)
+        try:
+            return self._indices[vertex]
+        except KeyError:
+            raise vertex_not_found(vertex) from None
+
+    # 이웃 정점 인덱스의 읽기 전용 뷰(복사하지 않는다)
+    def neighbor_indices(self, index: int) -> memoryview:
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    # neighbor_indices와 같은 순서의 가중치 뷰
+    def neighbor_weights(self, index: int) -> memoryview:
+        if self.weights is None:
+            raise ValueError("가중치가 없는 그래프입니다.")
+        return self.weights[self.offsets[index]:self.offsets[index + 1]]
+
+    def neighbors_for_index(self, index: int) -> List[V]:
+        return [self._vertices[v] for v in self.neighbor_indices(index)]
+
+    def neighbors_for_vertex(self, vertex: V) -> List[V]:
+        return self.neighbors_for_index(self.index_of(vertex))
+
+    # 에지 객체가 필요한 코드를 위해 정점 인덱스의 에지를 만들어서 반환한다.
+    def edges_for_index(self, index: int) -> List[Edge]:
+        start: int = self.offsets[index]
+        end: int = self.offsets[index + 1]
+        if self.weights is None:
+            return [Edge(index, self.targets[i]) for i in range(start, end)]
+        return [WeightedEdge(index, self.targets[i], self.weights[i]) for i in range(start, end)]
+
+    # NumPy 배열로 (offsets, targets, weights)를 복사 없이 반환한다. NumPy가 있어야 한다.
+    def to_numpy(self) -> tuple:
+        import numpy as np
+        return (np.frombuffer(self.offsets, dtype=np.int64),
+                np.frombuffer(self.targets, dtype=np.int64),
+                None if self.weights is None else np.frombuffer(self.weights, dtype=np.float64))
+
+    def __str__(self) -> str:
+        desc: str = ""
+        for i in range(self.vertex_count):
+            desc += f"{self.vertex_at(i)} -> {self.neighbors_for_index(i)}\n"
+        return desc
@@ -14,12 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
-from typing import TypeVar, List, Optional, Tuple, Dict
+from typing import TypeVar, List, Optional, Tuple, Dict, Callable, Union
+from heapq import heappush, heappop
+from array import array
 from dataclasses import dataclass
 from mst import WeightedPath, print_weighted_path
 from weighted_graph import WeightedGraph
 from weighted_edge import WeightedEdge
-from priority_queue import PriorityQueue
+from priority_queue import PriorityQueue, IndexedHeap, PairingHeap
+from csr_graph import CSRGraph
 
 V = TypeVar('V')  # 그래프 정점(vertice) 타입
 
@@ -36,13 +39,53 @@ class DijkstraNode:
         return self.distance == other.distance
 
 
-def dijkstra(wg: WeightedGraph[V], root: V) -> Tuple[List[Optional[float]], Dict[int, WeightedEdge]]:
+# 정점 인덱스를 키로 쓰는 decrease-key 우선순위 큐를 만드는 함수(정점 수를 받는다)
+IndexedQueue = Union[IndexedHeap, PairingHeap]
+QueueFactory = Callable[[int], IndexedQueue]
+
+
+def dijkstra(wg: WeightedGraph[V], root: V,
+             queue_factory: QueueFactory = IndexedHeap) -> Tuple[List[Optional[float]], Dict[int, WeightedEdge]]:
+    first: int = wg.index_of(root)  # 시작 인덱스를 찾는다.
+    # 처음에는 거리(distances)를 알 수 없다.
+    distances: List[Optional[float]] = [None] * wg.vertex_count
+    distances[first] = 0  # 루트(root)에서 루트 자신의 거리는 0이다.
+    path_dict: Dict[int, WeightedEdge] = {}  # 정점에 대한 경로
+    # 정점마다 큐에 한 번만 들어가고, 더 짧은 경로를 찾으면 우선순위를 줄인다(decrease-key).
+    # 그래서 큐의 크기는 정점 수를 넘지 않고, 확정된 정점을 다시 꺼내지 않는다.
+    pq: IndexedQueue = queue_factory(wg.vertex_count)
+    pq.push(first, 0)
+
+    while not pq.empty:
+        u, dist_u = pq.pop()  # 다음 가까운 정점을 탐색한다. 이 정점의 거리는 확정되었다.
+        # 이 정점에서 모든 에지 및 정점을 살펴본다.
+        for we in wg.edges_for_index(u):
+            # 이 정점에 대한 이전 거리
+            dist_v: Optional[float] = distances[we.v]
+            # 이전 거리가 없거나 혹은 새 최단 경로가 존재한다면,
+            if dist_v is None or dist_v > we.weight + dist_u:
+                # 정점의 거리를 갱신한다.
+                distances[we.v] = we.weight + dist_u
+                # 정점의 최단 경로의 에지를 갱신한다.
+                path_dict[we.v] = we
+                # 해당 정점을 큐에 넣거나 우선순위를 줄인다.
+                pq.push_or_decrease(we.v, we.weight + dist_u)
+
+    return distances, path_dict
+
+
+# decrease-key 없이 완화할 때마다 새 DijkstraNode를 넣는 원래 방식. 비교용으로 남겨둔다.
+# 큐에 같은 정점이 여러 번 들어가고, 오래된 항목도 꺼내서 에지를 다시 살펴본다.
+def lazy_dijkstra(wg: WeightedGraph[V], root: V,
+                  pq: Optional[PriorityQueue[DijkstraNode]] = None
+                  ) -> Tuple[List[Optional[float]], Dict[int, WeightedEdge]]:
     first: int = wg.index_of(root)  # 시작 인덱스를 찾는다.
     # 처음에는 거리(distances)를 알 수 없다.
     distances: List[Optional[float]] = [None] * wg.vertex_count
     distances[first] = 0  # 루트(root)에서 루트 자신의 거리는 0이다.
     path_dict: Dict[int, WeightedEdge] = {}  # 정점에 대한 경로
-    pq: PriorityQueue[DijkstraNode] = PriorityQueue()
+    if pq is None:
+        pq = PriorityQueue()
     pq.push(DijkstraNode(first, 0))
 
     while not pq.empty:
@@ -64,6 +107,40 @@ def dijkstra(wg: WeightedGraph[V], root: V) -> Tuple[List[Optional[float]], Dict
     return distances, path_dict
 
 
+# CSR 그래프에서 직접 실행하는 다익스트라 알고리즘. 결과는 dijkstra와 같은 형식이다.
+# 큐에는 (거리, 정점) 튜플을 넣고, 이미 더 짧은 거리가 확정된 오래된 항목은 건너뛴다.
+# 경로 에지 객체는 마지막에 정점마다 하나만 만든다.
+def dijkstra_csr(graph: CSRGraph[V], root: V) -> Tuple[List[Optional[float]], Dict[int, WeightedEdge]]:
+    if graph.weights is None:
+        raise ValueError("가중치 그래프가 필요합니다.")
+    first: int = graph.index_of(root)
+    offsets: memoryview = graph.offsets
+    targets: memoryview = graph.targets
+    weights: memoryview = graph.weights
+    inf: float = float("inf")
+    distances: List[float] = [inf] * graph.vertex_count
+    distances[first] = 0
+    parent_edge: array = array('q', [-1]) * graph.vertex_count  # 정점 -> 최단 경로의 마지막 에지 위치
+    parent: array = array('q', [-1]) * graph.vertex_count
+    heap: List[Tuple[float, int]] = [(0, first)]
+    while heap:
+        dist_u, u = heappop(heap)
+        if dist_u > distances[u]:
+            continue  # 오래된 항목
+        for i in range(offsets[u], offsets[u + 1]):
+            v: int = targets[i]
+            candidate: float = dist_u + weights[i]
+            if candidate < distances[v]:
+                distances[v] = candidate
+                parent[v] = u
+                parent_edge[v] = i
+                heappush(heap, (candidate, v))
+    path_dict: Dict[int, WeightedEdge] = {
+        v: WeightedEdge(parent[v], v, weights[parent_edge[v]])
+        for v in range(graph.vertex_count) if parent_edge[v] >= 0}
+    return [None if d == inf else d for d in distances], path_dict
+
+
 # 다익스트라 알고리즘 결과를 더 쉽게 접근하게 하는 헬퍼 함수
 def distance_array_to_vertex_dict(wg: WeightedGraph[V], distances: List[Optional[float]]) -> Dict[V, Optional[float]]:
     distance_dict: Dict[V, Optional[float]] = {}
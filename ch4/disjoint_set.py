@@ -0,0 +1,56 @@
+# disjoint_set.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List
+
+
+# 서로소 집합(disjoint-set, union-find). 원소 0..size-1이 처음에는 각자 하나의 집합이다.
+# find는 경로 압축(path compression)을, union은 랭크에 의한 합치기(union by rank)를 해서
+# 연산 하나가 사실상 상수 시간(역 아커만 함수)이다.
+class DisjointSet:
+    def __init__(self, size: int) -> None:
+        self._parent: List[int] = list(range(size))
+        self._rank: List[int] = [0] * size
+        self.count: int = size  # 집합의 수
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    # 원소가 속한 집합의 대표(루트)
+    def find(self, item: int) -> int:
+        parent: List[int] = self._parent
+        root: int = item
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item] != root:  # 거쳐 간 원소가 모두 루트를 가리키게 한다.
+            parent[item], item = root, parent[item]
+        return root
+
+    # 두 원소의 집합을 합친다. 이미 같은 집합이었으면 False
+    def union(self, first: int, second: int) -> bool:
+        first = self.find(first)
+        second = self.find(second)
+        if first == second:
+            return False
+        if self._rank[first] < self._rank[second]:
+            first, second = second, first
+        self._parent[second] = first  # 랭크가 낮은 트리를 높은 트리 아래에 붙인다.
+        if self._rank[first] == self._rank[second]:
+            self._rank[first] += 1
+        self.count -= 1
+        return True
+
+    def connected(self, first: int, second: int) -> bool:
+        return self.find(first) == self.find(second)
@@ -0,0 +1,162 @@
+# dynamic_dijkstra.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar, List, Optional, Dict, Tuple, Set
+from heapq import heappush, heappop
+from weighted_graph import WeightedGraph
+from weighted_edge import WeightedEdge
+
+V = TypeVar('V')  # 그래프 정점(vertice) 타입
+
+
+# 정점 u와 v 사이의 에지 하나를 바꾼(가중치 변경, 삭제, 추가) 뒤 dijkstra 결과
+# (distances, path_dict)를 처음부터 다시 계산하지 않고 그 자리에서 고친다(라말링감-렙스 방식).
+# 거리가 바뀐 정점과 그 이웃만 살펴보고, 거리가 바뀐 정점 인덱스의 집합을 반환한다.
+# 1) 최단 경로 트리의 u-v 에지가 더 무거워지거나 없어졌으면 그 아래 서브트리의 거리를 지우고,
+#    서브트리 밖의 이웃에서 들어오는 가장 짧은 에지로 다시 시작해서 서브트리 안에서만 다익스트라를 한다.
+# 2) u-v 에지가 더 가벼워졌거나 새로 생겼으면 양 끝에서 완화(relaxation)를 시작해서
+#    거리가 줄어드는 정점으로만 퍼져 나간다.
+def repair_shortest_paths(wg: WeightedGraph[V], distances: List[Optional[float]],
+                          path_dict: Dict[int, WeightedEdge], u: int, v: int) -> Set[int]:
+    changed: Set[int] = set()
+    for parent, child in ((u, v), (v, u)):
+        edge: Optional[WeightedEdge] = path_dict.get(child)
+        if edge is not None and edge.u == parent:
+            lightest: Optional[float] = _lightest(wg, parent, child)
+            if lightest is None or lightest > edge.weight:
+                changed |= _repair_increase(wg, distances, path_dict, child)
+    changed |= _repair_decrease(wg, distances, path_dict, [(u, v), (v, u)])
+    return changed
+
+
+# parent에서 child로 가는 에지 중 가장 가벼운 것의 가중치. 없으면 None
+def _lightest(wg: WeightedGraph[V], parent: int, child: int) -> Optional[float]:
+    return min((edge.weight for edge in wg.edges_for_index(parent) if edge.v == child), default=None)
+
+
+def _repair_increase(wg: WeightedGraph[V], distances: List[Optional[float]],
+                     path_dict: Dict[int, WeightedEdge], root: int) -> Set[int]:
+    # 영향받는 정점: 최단 경로 트리에서 root 아래의 모든 정점(부모를 통해 root에 닿는 정점)
+    affected: Set[int] = {root}
+    stack: List[int] = [root]
+    while stack:
+        x: int = stack.pop()
+        for edge in wg.edges_for_index(x):
+            parent_edge: Optional[WeightedEdge] = path_dict.get(edge.v)
+            if parent_edge is not None and parent_edge.u == x and edge.v not in affected:
+                affected.add(edge.v)
+                stack.append(edge.v)
+    old: Dict[int, Optional[float]] = {x: distances[x] for x in affected}
+    for x in affected:
+        distances[x] = None
+        del path_dict[x]
+    # 서브트리 밖의 거리는 그대로 맞으므로, 밖에서 들어오는 가장 짧은 에지를 후보로 큐에 넣는다.
+    heap: List[Tuple[float, int]] = []
+    for x in affected:
+        for edge in wg.edges_for_index(x):
+            dist_y: Optional[float] = distances[edge.v]
+            if edge.v not in affected and dist_y is not None:
+                candidate: float = dist_y + edge.weight
+                if distances[x] is None or candidate < distances[x]:
+                    distances[x] = candidate
+                    path_dict[x] = WeightedEdge(edge.v, x, edge.weight)
+        if distances[x] is not None:
+            heappush(heap, (distances[x], x))
+    # 서브트리 안에서만 다익스트라(밖의 정점은 거리가 늘어날 수 없으므로 고칠 필요가 없다)
+    while heap:
+        dist_x, x = heappop(heap)
+        if dist_x > distances[x]:
+            continue  # 오래된 항목
+        for edge in wg.edges_for_index(x):
+            if edge.v in affected:
+                dist_y = distances[edge.v]
+                if dist_y is None or dist_x + edge.weight < dist_y:
+                    distances[edge.v] = dist_x + edge.weight
+                    path_dict[edge.v] = edge
+                    heappush(heap, (dist_x + edge.weight, edge.v))
+    return {x for x in affected if distances[x] != old[x]}
+
+
+def _repair_decrease(wg: WeightedGraph[V], distances: List[Optional[float]],
+                     path_dict: Dict[int, WeightedEdge], pairs: List[Tuple[int, int]]) -> Set[int]:
+    changed: Set[int] = set()
+    heap: List[Tuple[float, int]] = []
+    for parent, child in pairs:
+        dist_parent: Optional[float] = distances[parent]
+        if dist_parent is None:
+            continue
+        for edge in wg.edges_for_index(parent):
+            if edge.v == child and (distances[child] is None or dist_parent + edge.weight < distances[child]):
+                distances[child] = dist_parent + edge.weight
+                path_dict[child] = edge
+                changed.add(child)
+                heappush(heap, (distances[child], child))
+    while heap:
+        dist_x, x = heappop(heap)
+        if dist_x > distances[x]:
+            continue
+        for edge in wg.edges_for_index(x):
+            dist_y: Optional[float] = distances[edge.v]
+            if dist_y is None or dist_x + edge.weight < dist_y:
+                distances[edge.v] = dist_x + edge.weight
+                path_dict[edge.v] = edge
+                changed.add(edge.v)
+                heappush(heap, (dist_x + edge.weight, edge.v))
+    return changed
+
+
+if __name__ == "__main__":
+    from dijkstra import dijkstra, path_dict_to_path
+    from mst import print_weighted_path
+
+    city_graph2: WeightedGraph[str] = WeightedGraph(
+        ["시애틀", "샌프란시스코", "로스앤젤레스", "리버사이드", "피닉스", "시카고", "보스턴", "뉴욕", "애틀랜타", "마이애미", "댈러스", "휴스턴", "디트로이트", "필라델피아", "워싱턴"])
+
+    city_graph2.add_edge_by_vertices("시애틀", "시카고", 1737)
+    city_graph2.add_edge_by_vertices("시애틀", "샌프란시스코", 678)
+    city_graph2.add_edge_by_vertices("샌프란시스코", "리버사이드", 386)
+    city_graph2.add_edge_by_vertices("샌프란시스코", "로스앤젤레스", 348)
+    city_graph2.add_edge_by_vertices("로스앤젤레스", "리버사이드", 50)
+    city_graph2.add_edge_by_vertices("로스앤젤레스", "피닉스", 357)
+    city_graph2.add_edge_by_vertices("리버사이드", "피닉스", 307)
+    city_graph2.add_edge_by_vertices("리버사이드", "시카고", 1704)
+    city_graph2.add_edge_by_vertices("피닉스", "댈러스", 887)
+    city_graph2.add_edge_by_vertices("피닉스", "휴스턴", 1015)
+    city_graph2.add_edge_by_vertices("댈러스", "시카고", 805)
+    city_graph2.add_edge_by_vertices("댈러스", "애틀랜타", 721)
+    city_graph2.add_edge_by_vertices("댈러스", "휴스턴", 225)
+    city_graph2.add_edge_by_vertices("휴스턴", "애틀랜타", 702)
+    city_graph2.add_edge_by_vertices("휴스턴", "마이애미", 968)
+    city_graph2.add_edge_by_vertices("애틀랜타", "시카고", 588)
+    city_graph2.add_edge_by_vertices("애틀랜타", "워싱턴", 543)
+    city_graph2.add_edge_by_vertices("애틀랜타", "마이애미", 604)
+    city_graph2.add_edge_by_vertices("마이애미", "워싱턴", 923)
+    city_graph2.add_edge_by_vertices("시카고", "디트로이트", 238)
+    city_graph2.add_edge_by_vertices("디트로이트", "보스턴", 613)
+    city_graph2.add_edge_by_vertices("디트로이트", "워싱턴", 396)
+    city_graph2.add_edge_by_vertices("디트로이트", "뉴욕", 482)
+    city_graph2.add_edge_by_vertices("보스턴", "뉴욕", 190)
+    city_graph2.add_edge_by_vertices("뉴욕", "필라델피아", 81)
+    city_graph2.add_edge_by_vertices("필라델피아", "워싱턴", 123)
+
+    distances, path_dict = dijkstra(city_graph2, "로스앤젤레스")
+    # 리버사이드-시카고 도로가 막혀서 두 배로 오래 걸린다.
+    city_graph2.update_edge_by_vertices("리버사이드", "시카고", 3408)
+    changed: Set[int] = repair_shortest_paths(city_graph2, distances, path_dict,
+                                              city_graph2.index_of("리버사이드"), city_graph2.index_of("시카고"))
+    print(f"거리가 바뀐 도시: {sorted(city_graph2.vertex_at(i) for i in changed)}")
+    print("로스앤젤레스에서 보스턴까지의 최단 경로:")
+    print_weighted_path(city_graph2, path_dict_to_path(
+        city_graph2.index_of("로스앤젤레스"), city_graph2.index_of("보스턴"), path_dict))
@@ -0,0 +1,133 @@
+# dynamic_dijkstra_tests.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import List, Optional, Dict
+from random import Random
+from weighted_graph import WeightedGraph
+from weighted_edge import WeightedEdge
+from dijkstra import dijkstra
+from dynamic_dijkstra import repair_shortest_paths
+from benchmark import random_weighted_graph
+from fixtures import GraphTestCase
+
+
+class DynamicDijkstraTestCase(GraphTestCase):
+    # 고친 결과가 처음부터 다시 계산한 결과와 같고, path_dict가 그래프의 에지로 된 최단 경로 트리인지 확인한다.
+    def assert_matches_recompute(self, graph: WeightedGraph[int], root: int,
+                                 distances: List[Optional[float]], path_dict: Dict[int, WeightedEdge]) -> None:
+        expected, _ = dijkstra(graph, root)
+        self.assertEqual(distances, expected)
+        self.assertEqual(set(path_dict), {v for v, d in enumerate(expected) if d is not None and v != root})
+        self.assert_graph_edges(graph, path_dict.values())
+        for v, edge in path_dict.items():
+            self.assertEqual(edge.v, v)
+            self.assertEqual(distances[edge.u] + edge.weight, distances[v])
+
+    def test_increase_on_tree_edge(self):
+        graph: WeightedGraph[int] = WeightedGraph(list(range(4)))
+        graph.add_edges_from([(0, 1, 1), (1, 2, 1), (0, 3, 5), (3, 2, 1)])
+        distances, path_dict = dijkstra(graph, 0)
+        graph.update_edge_by_indices(0, 1, 10)
+        changed = repair_shortest_paths(graph, distances, path_dict, 0, 1)
+        self.assertEqual(changed, {1, 2, 3})  # 3은 0-3 에지보다 1-2-3을 거치는 쪽이 짧았다.
+        self.assertEqual(distances, [0, 7, 6, 5])
+        self.assert_matches_recompute(graph, 0, distances, path_dict)
+
+    def test_decrease(self):
+        graph: WeightedGraph[int] = WeightedGraph(list(range(4)))
+        graph.add_edges_from([(0, 1, 1), (1, 2, 1), (0, 3, 5), (3, 2, 1)])
+        distances, path_dict = dijkstra(graph, 0)
+        graph.update_edge_by_indices(0, 3, 1)
+        changed = repair_shortest_paths(graph, distances, path_dict, 0, 3)
+        self.assertEqual(changed, {3})
+        self.assert_matches_recompute(graph, 0, distances, path_dict)
+
+    def test_removal_disconnects(self):
+        graph: WeightedGraph[int] = WeightedGraph(list(range(4)))
+        graph.add_edges_from([(0, 1, 1), (1, 2, 1), (2, 3, 1)])
+        distances, path_dict = dijkstra(graph, 0)
+        graph.remove_edge_by_indices(1, 2)
+        repair_shortest_paths(graph, distances, path_dict, 1, 2)
+        self.assertEqual(distances, [0, 1, None, None])
+        self.assert_matches_recompute(graph, 0, distances, path_dict)
+
+    def test_addition_reconnects(self):
+        graph: WeightedGraph[int] = WeightedGraph(list(range(4)))
+        graph.add_edges_from([(0, 1, 1), (2, 3, 1)])
+        distances, path_dict = dijkstra(graph, 0)
+        graph.add_edge_by_indices(1, 2, 4)
+        changed = repair_shortest_paths(graph, distances, path_dict, 1, 2)
+        self.assertEqual(changed, {2, 3})
+        self.assert_matches_recompute(graph, 0, distances, path_dict)
+
+    def test_unrelated_change(self):
+        graph: WeightedGraph[int] = WeightedGraph(list(range(3)))
+        graph.add_edges_from([(0, 1, 1), (1, 2, 1), (0, 2, 5)])
+        distances, path_dict = dijkstra(graph, 0)
+        graph.update_edge_by_indices(0, 2, 7)  # 최단 경로 트리에 없는 에지
+        self.assertEqual(repair_shortest_paths(graph, distances, path_dict, 0, 2), set())
+        self.assert_matches_recompute(graph, 0, distances, path_dict)
+
+    def test_random_updates(self):
+        random: Random = Random(42)
+        for _ in range(5):
+            graph: WeightedGraph[int] = random_weighted_graph(60, 120, random, connected=False,
+                                                              loops=True, max_weight=20)
+            root: int = random.randrange(60)
+            distances, path_dict = dijkstra(graph, root)
+            for _ in range(100):
+                u, v = random.randrange(60), random.randrange(60)
+                action: float = random.random()
+                neighbors: List[int] = [e.v for e in graph.edges_for_index(u)]
+                if action < 0.3 or not neighbors:
+                    graph.add_edge_by_indices(u, v, random.randint(1, 20))
+                else:
+                    v = random.choice(neighbors)
+                    if action < 0.5:
+                        graph.remove_edge_by_indices(u, v)
+                    else:
+                        graph.update_edge_by_indices(u, v, random.randint(1, 20))
+                repair_shortest_paths(graph, distances, path_dict, u, v)
+                self.assert_matches_recompute(graph, root, distances, path_dict)
+
+
+class GraphUpdateTestCase(unittest.TestCase):
+    def test_update_and_remove(self):
+        graph: WeightedGraph[str] = WeightedGraph(["a", "b", "c"])
+        graph.add_edge_by_vertices("a", "b", 1)
+        graph.add_edge_by_vertices("a", "b", 2)
+        version: int = graph.version
+        graph.update_edge_by_vertices("b", "a", 5)
+        self.assertEqual([e.weight for e in graph.edges_for_vertex("a")], [5, 2])
+        self.assertEqual([e.weight for e in graph.edges_for_vertex("b")], [5, 2])
+        graph.remove_edge_by_vertices("a", "b")
+        self.assertEqual([(e.v, e.weight) for e in graph.edges_for_vertex("a")], [(1, 2)])
+        self.assertEqual([(e.v, e.weight) for e in graph.edges_for_vertex("b")], [(0, 2)])
+        self.assertEqual(graph.version, version + 2)
+        with self.assertRaises(ValueError):
+            graph.remove_edge_by_vertices("a", "c")
+
+    def test_self_loop(self):
+        graph: WeightedGraph[str] = WeightedGraph(["a"])
+        graph.add_edge_by_vertices("a", "a", 1)
+        graph.update_edge_by_vertices("a", "a", 3)
+        self.assertEqual([e.weight for e in graph.edges_for_vertex("a")], [3, 3])
+        graph.remove_edge_by_vertices("a", "a")
+        self.assertEqual(graph.edges_for_vertex("a"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
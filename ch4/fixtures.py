@@ -0,0 +1,53 @@
+# fixtures.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+import os
+import tempfile
+from typing import Iterable, Optional
+from weighted_graph import WeightedGraph
+from weighted_edge import WeightedEdge
+from mst import WeightedPath, total_weight
+
+
+# 4장 테스트들이 함께 쓰는 TestCase. 무작위 그래프는 benchmark.random_weighted_graph로 만든다.
+class GraphTestCase(unittest.TestCase):
+    # 테스트가 끝나면 지워지는 임시 디렉터리 안의 파일 경로
+    def temporary_path(self, name: str) -> str:
+        directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return os.path.join(directory.name, name)
+
+    # 에지마다 그래프에 같은 가중치의 에지가 있는지 확인한다(평행 에지가 있을 수 있다).
+    def assert_graph_edges(self, graph: WeightedGraph, edges: Iterable[WeightedEdge]) -> None:
+        for edge in edges:
+            self.assertIn(edge.weight, [e.weight for e in graph.edges_for_index(edge.u) if e.v == edge.v])
+
+    # path가 source에서 target까지 그래프의 에지로 이어지고 가중치의 합이 distance인지 확인한다.
+    # distance가 None(경로 없음)이면 path도 None이어야 한다. 가중치가 실수인 그래프는 더하는 순서에 따라
+    # 마지막 자리가 다를 수 있으므로 합은 assertAlmostEqual로 비교한다.
+    def assert_path(self, graph: WeightedGraph, path: Optional[WeightedPath], source: int, target: int,
+                    distance: Optional[float]) -> None:
+        if distance is None:
+            self.assertIsNone(path)
+            return
+        self.assertIsNotNone(path)
+        self.assertAlmostEqual(total_weight(path), distance)
+        self.assert_graph_edges(graph, path)
+        at: int = source
+        for edge in path:
+            self.assertEqual(edge.u, at)
+            at = edge.v
+        self.assertEqual(at, target)
@@ -13,17 +13,30 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import TypeVar, Generic, List, Optional
+from typing import TypeVar, Generic, List, Optional, Dict, Iterable, Tuple
 from edge import Edge
 
 
 V = TypeVar('V')  # 그래프 정점(vertice) 타입
 
 
+# 그래프에 없는 정점을 찾을 때의 예외. index_of를 가진 그래프 클래스들이 함께 쓴다.
+def vertex_not_found(vertex: object) -> ValueError:
+    return ValueError(f"그래프에 {vertex!r} 정점이 없습니다.")
+
+
 class Graph(Generic[V]):
     def __init__(self, vertices: List[V] = []) -> None:
-        self._vertices: List[V] = vertices
+        self._vertices: List[V] = list(vertices)  # 호출자의 리스트(와 기본값)를 공유하지 않는다.
         self._edges: List[List[Edge]] = [[] for _ in vertices]
+        # 정점 -> 인덱스. list.index의 O(V) 탐색 대신 O(1)로 찾는다.
+        # 같은 정점이 여러 번 있으면 list.index처럼 첫 번째 인덱스를 쓴다.
+        self._indices: Dict[V, int] = {}
+        for index, vertex in enumerate(self._vertices):
+            self._indices.setdefault(vertex, index)
+        # 정점이나 에지를 추가할 때마다 1씩 늘어난다. 그래프로 계산한 결과를 캐시하는 쪽에서
+        # 저장할 때의 값과 비교해서 결과가 오래되었는지 알 수 있다.
+        self.version: int = 0
 
     @property
     def vertex_count(self) -> int:
@@ -37,12 +50,15 @@ class Graph(Generic[V]):
     def add_vertex(self, vertex: V) -> int:
         self._vertices.append(vertex)
         self._edges.append([])  # 에지에 빈 리스트를 추가한다.
+        self._indices.setdefault(vertex, self.vertex_count - 1)
+        self.version += 1
         return self.vertex_count - 1  # 추가된 정점의 인덱스를 반환한다.
 
     # 무방향(undirected) 그래프이므로 항상 양방향으로 에지를 추가한다.
     def add_edge(self, edge: Edge) -> None:
         self._edges[edge.u].append(edge)
         self._edges[edge.v].append(edge.reversed())
+        self.version += 1
 
     # # 정점 인덱스를 사용하여 에지를 추가한다(헬퍼 메서드).
     def add_edge_by_indices(self, u: int, v: int) -> None:
@@ -51,17 +67,49 @@ class Graph(Generic[V]):
 
     # 정점 인덱스를 참조하여 에지를 추가한다(헬퍼 메서드).
     def add_edge_by_vertices(self, first: V, second: V) -> None:
-        u: int = self._vertices.index(first)
-        v: int = self._vertices.index(second)
+        u: int = self.index_of(first)
+        v: int = self.index_of(second)
         self.add_edge_by_indices(u, v)
 
+    # (정점, 정점) 쌍들로 에지를 한 번에 추가한다. 없는 정점은 새로 추가한다.
+    def add_edges_from(self, pairs: Iterable[Tuple[V, V]]) -> None:
+        for first, second in pairs:
+            u: int = self._index_or_add(first)
+            v: int = self._index_or_add(second)
+            self._edges[u].append(Edge(u, v))
+            self._edges[v].append(Edge(v, u))
+            self.version += 1
+
+    # u와 v 사이의 에지를 하나 지운다(평행 에지가 있으면 먼저 추가한 것). 없으면 ValueError
+    def remove_edge_by_indices(self, u: int, v: int) -> None:
+        self._edges[u].pop(self._edge_position(u, v))
+        self._edges[v].pop(self._edge_position(v, u))
+        self.version += 1
+
+    def remove_edge_by_vertices(self, first: V, second: V) -> None:
+        self.remove_edge_by_indices(self.index_of(first), self.index_of(second))
+
+    # 정점 u의 에지 리스트에서 v로 가는 첫 번째 에지의 위치
+    def _edge_position(self, u: int, v: int) -> int:
+        for position, edge in enumerate(self._edges[u]):
+            if edge.v == v:
+                return position
+        raise ValueError(f"{u}와 {v} 사이에 에지가 없습니다.")
+
+    def _index_or_add(self, vertex: V) -> int:
+        index: Optional[int] = self._indices.get(vertex)
+        return self.add_vertex(vertex) if index is None else index
+
     # 특정 인덱스에서 정점을 찾는다.
     def vertex_at(self, index: int) -> V:
         return self._vertices[index]
 
     # 정점 인덱스를 찾는다.
     def index_of(self, vertex: V) -> int:
-        return self._vertices.index(vertex)
+        try:
+            return self._indices[vertex]
+        except KeyError:
+            raise vertex_not_found(vertex) from None
 
     # 정점 인덱스에 연결된 이웃 정점을 찾는다.
     def neighbors_for_index(self, index: int) -> List[V]:
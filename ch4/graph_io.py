@@ -0,0 +1,223 @@
+# graph_io.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar, List, Optional, Dict, Tuple, Iterator, Callable, Union, Sequence, BinaryIO
+from array import array
+from itertools import islice
+import csv
+import mmap
+import struct
+import sys
+from weighted_graph import WeightedGraph
+from csr_graph import CSRGraph
+
+V = TypeVar('V')  # 그래프 정점(vertice) 타입
+
+# 이진 그래프 파일의 헤더: 매직(8바이트), 플래그, 예약, 정점 수, 에지 수, 정점 문자열 바이트 수.
+# 모든 값은 리틀 엔디언이고 헤더 뒤의 각 구역은 8바이트 경계에서 시작한다.
+MAGIC: bytes = b"CSRG0001"
+HEADER: struct.Struct = struct.Struct("<8sIIQQQ")
+WEIGHTED: int = 1  # 플래그: weights 구역이 있다.
+INT_VERTICES: int = 2  # 플래그: 정점이 정수다(문자열 대신 int64 배열로 저장한다).
+
+
+# 구분자로 나눈 에지 목록 파일을 한 줄씩 읽어 (정점, 정점, 가중치)를 만든다. 파일 전체를 메모리에
+# 올리지 않는다. 빈 줄과 #으로 시작하는 줄은 건너뛰고, 가중치 열이 없으면 default_weight를 쓴다.
+# delimiter가 None이면 확장자가 .tsv인 파일은 탭, 나머지는 쉼표로 나눈다.
+# vertex_type은 정점 문자열을 바꿀 함수다(예: int).
+def read_edges(path: str, delimiter: Optional[str] = None, header: bool = False,
+               vertex_type: Callable[[str], V] = str,
+               default_weight: float = 1.0) -> Iterator[Tuple[V, V, float]]:
+    if delimiter is None:
+        delimiter = "\t" if path.lower().endswith(".tsv") else ","
+    with open(path, newline="", encoding="utf-8") as f:
+        rows: Iterator[List[str]] = csv.reader(f, delimiter=delimiter)
+        if header:
+            next(rows, None)
+        for row in rows:
+            if not row or row[0].startswith("#"):
+                continue
+            if len(row) < 2:
+                raise ValueError(f"{path}:{rows.line_num}: 에지에는 정점 두 개가 필요합니다.")
+            weight: float = float(row[2]) if len(row) > 2 and row[2] != "" else default_weight
+            yield vertex_type(row[0].strip()), vertex_type(row[1].strip()), weight
+
+
+# 에지 목록 파일로 WeightedGraph를 만든다. chunk_size개씩 add_edges_from에 넘기므로
+# 한 번에 메모리에 있는 것은 그래프와 에지 chunk_size개뿐이다.
+def read_weighted_graph(path: str, delimiter: Optional[str] = None, header: bool = False,
+                        vertex_type: Callable[[str], V] = str,
+                        chunk_size: int = 65536) -> WeightedGraph[V]:
+    graph: WeightedGraph[V] = WeightedGraph()
+    edges: Iterator[Tuple[V, V, float]] = read_edges(path, delimiter, header, vertex_type)
+    while True:
+        chunk: List[Tuple[V, V, float]] = list(islice(edges, chunk_size))
+        if not chunk:
+            return graph
+        graph.add_edges_from(chunk)
+
+
+# 에지 목록 파일로 CSRGraph를 바로 만든다. 에지 객체 없이 (u, v, 가중치)를 array에 모은 뒤
+# 계수 정렬로 CSR 배열을 채운다. 에지 하나에 24바이트(읽는 동안)만 쓴다.
+def read_csr_graph(path: str, delimiter: Optional[str] = None, header: bool = False,
+                   vertex_type: Callable[[str], V] = str) -> CSRGraph[V]:
+    vertices: List[V] = []
+    indices: Dict[V, int] = {}
+    us: array = array('q')
+    vs: array = array('q')
+    weights: array = array('d')
+    for first, second, weight in read_edges(path, delimiter, header, vertex_type):
+        for vertex in (first, second):
+            if vertex not in indices:
+                indices[vertex] = len(vertices)
+                vertices.append(vertex)
+        us.append(indices[first])
+        vs.append(indices[second])
+        weights.append(weight)
+    n: int = len(vertices)
+    # 무방향 에지는 양쪽 정점에 하나씩 저장한다. 먼저 정점마다 에지 수를 센다.
+    offsets: array = array('q', [0]) * (n + 1)
+    for u, v in zip(us, vs):
+        offsets[u + 1] += 1
+        offsets[v + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    positions: array = array('q', offsets[:n])  # 정점마다 다음에 쓸 위치
+    targets: array = array('q', [0]) * (2 * len(us))
+    csr_weights: array = array('d', [0.0]) * (2 * len(us))
+    for u, v, weight in zip(us, vs, weights):
+        for a, b in ((u, v), (v, u)):
+            targets[positions[a]] = b
+            csr_weights[positions[a]] = weight
+            positions[a] += 1
+    return CSRGraph(vertices, offsets, targets, csr_weights)
+
+
+# load_graph가 돌려주는 정점 표. 문자열을 전부 만들어 두지 않고 인덱스로 접근할 때 디코딩한다.
+class VertexTable(Sequence[str]):
+    def __init__(self, offsets: memoryview, data: memoryview) -> None:
+        self._offsets: memoryview = offsets
+        self._data: memoryview = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if not -len(self) <= index < len(self):
+            raise IndexError("정점 인덱스가 범위를 벗어났습니다.")
+        index %= len(self)
+        return bytes(self._data[self._offsets[index]:self._offsets[index + 1]]).decode("utf-8")
+
+
+def _write_section(f: BinaryIO, data: array) -> None:
+    if sys.byteorder != "little":
+        data = array(data.typecode, data)
+        data.byteswap()
+    data.tofile(f)
+    f.write(b"\0" * (-f.tell() % 8))  # 다음 구역을 8바이트 경계에 맞춘다.
+
+
+# 그래프를 이진 파일로 저장한다. 헤더 뒤에 정점 표, offsets, targets, weights가 이어진다.
+# 정점 표는 정수 정점이면 int64 배열이고, 아니면 UTF-8 문자열의 시작 위치(int64, 정점 수 + 1개)와
+# 이어 붙인 문자열이다. 정점은 정수나 문자열이어야 한다.
+def save_graph(graph: Union[WeightedGraph[V], CSRGraph[V]], path: str) -> None:
+    csr: CSRGraph[V] = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    vertices: List = [csr.vertex_at(i) for i in range(csr.vertex_count)]
+    flags: int = WEIGHTED if csr.weighted else 0
+    if vertices and all(isinstance(vertex, int) for vertex in vertices):
+        flags |= INT_VERTICES
+    elif not all(isinstance(vertex, str) for vertex in vertices):
+        raise ValueError("정수나 문자열 정점만 저장할 수 있습니다.")
+    with open(path, "wb") as f:
+        if flags & INT_VERTICES:
+            f.write(HEADER.pack(MAGIC, flags, 0, csr.vertex_count, csr.edge_count, 0))
+            _write_section(f, array('q', vertices))
+        else:
+            encoded: List[bytes] = [vertex.encode("utf-8") for vertex in vertices]
+            starts: array = array('q', [0])
+            for name in encoded:
+                starts.append(starts[-1] + len(name))
+            f.write(HEADER.pack(MAGIC, flags, 0, csr.vertex_count, csr.edge_count, starts[-1]))
+            _write_section(f, starts)
+            f.write(b"".join(encoded))
+            f.write(b"\0" * (-f.tell() % 8))
+        _write_section(f, array('q', csr.offsets))
+        _write_section(f, array('q', csr.targets))
+        if csr.weights is not None:
+            _write_section(f, array('d', csr.weights))
+
+
+# save_graph로 저장한 파일을 메모리 맵으로 열어 CSRGraph를 만든다. 헤더만 읽고 배열은 파일을
+# 그대로 가리키므로 파일 크기와 관계없이 O(1)이고, 실제로 읽는 부분만 운영체제가 메모리에 올린다.
+# (빅 엔디언 시스템에서는 배열을 복사해서 바이트 순서를 바꾸므로 O(V + E)다.)
+def load_graph(path: str) -> CSRGraph:
+    with open(path, "rb") as f:
+        buffer: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, flags, _, n, m, name_bytes = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"이진 그래프 파일이 아닙니다: {path}")
+    view: memoryview = memoryview(buffer)
+    position: int = HEADER.size
+
+    def section(typecode: str, count: int) -> Union[memoryview, array]:
+        nonlocal position
+        size: int = 8 * count
+        data: memoryview = view[position:position + size].cast(typecode)
+        position += size + (-size % 8)
+        if sys.byteorder != "little":
+            swapped: array = array(typecode, data)
+            swapped.byteswap()
+            return swapped
+        return data
+
+    vertices: Sequence
+    if flags & INT_VERTICES:
+        vertices = section('q', n)
+    else:
+        starts: Union[memoryview, array] = section('q', n + 1)
+        vertices = VertexTable(memoryview(starts), view[position:position + name_bytes])
+        position += name_bytes + (-name_bytes % 8)
+    offsets: Union[memoryview, array] = section('q', n + 1)
+    targets: Union[memoryview, array] = section('q', m)
+    weights: Union[memoryview, array, None] = section('d', m) if flags & WEIGHTED else None
+    return CSRGraph(vertices, offsets, targets, weights)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from random import Random
+    from time import perf_counter
+    from dijkstra import dijkstra_csr
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path: str = os.path.join(directory, "edges.tsv")
+        random: Random = Random(0)
+        with open(text_path, "w", encoding="utf-8") as f:
+            f.write("# 출발\t도착\t가중치\n")
+            for _ in range(300000):
+                f.write(f"v{random.randrange(100000)}\tv{random.randrange(100000)}\t{random.uniform(1, 100):.2f}\n")
+        start: float = perf_counter()
+        graph: CSRGraph[str] = read_csr_graph(text_path)
+        print(f"TSV 읽기: 정점 {graph.vertex_count}개, 에지 {graph.edge_count}개, {perf_counter() - start:.2f}초")
+        binary_path: str = os.path.join(directory, "edges.csrg")
+        start = perf_counter()
+        save_graph(graph, binary_path)
+        print(f"이진 파일 저장: {os.path.getsize(binary_path) / 2 ** 20:.1f}MB, {perf_counter() - start:.2f}초")
+        start = perf_counter()
+        loaded: CSRGraph[str] = load_graph(binary_path)
+        print(f"이진 파일 열기: {(perf_counter() - start) * 1000:.2f}ms")
+        distances, _ = dijkstra_csr(loaded, "v0")
+        print(f"v0에서 v1까지: {distances[loaded.index_of('v1')]}")
@@ -0,0 +1,95 @@
+# graph_io_tests.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import List
+from random import Random
+from graph import Graph
+from weighted_graph import WeightedGraph
+from csr_graph import CSRGraph
+from benchmark import random_weighted_graph
+from fixtures import GraphTestCase
+from graph_io import save_graph, load_graph, read_csr_graph
+
+
+# 무작위 그래프의 정점을 vertices로 바꾼 CSR 그래프. 자기 루프와 평행 에지도 생긴다.
+def relabeled_graph(vertices: List, m: int, random: Random) -> CSRGraph:
+    csr: CSRGraph[int] = CSRGraph.from_graph(random_weighted_graph(len(vertices), m, random, connected=False,
+                                                                   loops=True))
+    return CSRGraph(vertices, csr.offsets, csr.targets, csr.weights)
+
+
+class GraphIOTestCase(GraphTestCase):
+    def setUp(self) -> None:
+        self.path: str = self.temporary_path("graph.csrg")
+
+    # 저장했다가 읽은 그래프의 배열과 정점이 원래 그래프와 같은지 확인한다.
+    def assert_round_trip(self, graph) -> None:
+        csr: CSRGraph = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+        save_graph(graph, self.path)
+        loaded: CSRGraph = load_graph(self.path)
+        self.assertEqual(list(loaded.offsets), list(csr.offsets))
+        self.assertEqual(list(loaded.targets), list(csr.targets))
+        if csr.weights is None:
+            self.assertIsNone(loaded.weights)
+        else:
+            self.assertEqual(list(loaded.weights), list(csr.weights))
+        vertices: List = [csr.vertex_at(i) for i in range(csr.vertex_count)]
+        self.assertEqual([loaded.vertex_at(i) for i in range(loaded.vertex_count)], vertices)
+        for index, vertex in enumerate(vertices):
+            self.assertEqual(loaded.index_of(vertex), index)
+
+    def test_string_vertices(self):
+        random: Random = Random(1)
+        for _ in range(20):
+            n: int = random.randint(1, 30)
+            # 여러 바이트로 인코딩되는 문자와 빈 문자열도 저장할 수 있어야 한다.
+            vertices: List[str] = [random.choice(["", "서울", "a,b", "정점"]) + str(i) for i in range(n)]
+            self.assert_round_trip(relabeled_graph(vertices, random.randint(0, 3 * n), random))
+
+    def test_int_vertices(self):
+        random: Random = Random(2)
+        for _ in range(20):
+            n: int = random.randint(1, 30)
+            vertices: List[int] = random.sample(range(-2 ** 40, 2 ** 40), n)
+            self.assert_round_trip(relabeled_graph(vertices, random.randint(0, 3 * n), random))
+        # WeightedGraph는 save_graph가 CSR로 바꿔서 저장한다.
+        self.assert_round_trip(random_weighted_graph(30, 60, random, connected=False, loops=True))
+
+    def test_unweighted_and_empty(self):
+        graph: Graph[str] = Graph(["가", "나", "다"])
+        graph.add_edges_from([("가", "나"), ("나", "다"), ("다", "다")])
+        self.assert_round_trip(CSRGraph.from_graph(graph))
+        self.assert_round_trip(WeightedGraph([]))
+
+    def test_csv_to_binary(self):
+        edges_path: str = self.temporary_path("edges.csv")
+        with open(edges_path, "w", encoding="utf-8") as f:
+            f.write("# 출발,도착,가중치\n1,2,3.5\n2,3,1\n\n3,1,2\n")
+        self.assert_round_trip(read_csr_graph(edges_path, vertex_type=int))
+
+    def test_invalid_files(self):
+        with self.assertRaises(ValueError):
+            save_graph(WeightedGraph([1, "2"]), self.path)  # 정수와 문자열이 섞인 정점
+        with self.assertRaises(ValueError):
+            save_graph(WeightedGraph([(0, 0)]), self.path)
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            load_graph(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
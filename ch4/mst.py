@@ -13,10 +13,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import TypeVar, List, Optional
+from typing import TypeVar, List, Optional, Tuple, Callable, Union, Dict, Iterable
+from heapq import heappush, heappop
+from array import array
+from operator import attrgetter
+from multiprocessing import Pool, RawArray
+import os
 from weighted_graph import WeightedGraph
 from weighted_edge import WeightedEdge
-from priority_queue import PriorityQueue
+from priority_queue import PriorityQueue, IndexedHeap, PairingHeap
+from csr_graph import CSRGraph
+from disjoint_set import DisjointSet
 
 V = TypeVar('V')  # 그래프 정점(vertice) 타입
 WeightedPath = List[WeightedEdge]  # 경로 타입 앨리어스
@@ -52,6 +59,196 @@ def mst(wg: WeightedGraph[V], start: int = 0) -> Optional[WeightedPath]:
     return result
 
 
+# decrease-key를 쓰는 즉시(eager) 프림 알고리즘. 에지 대신 트리 밖의 정점을 큐에 넣고,
+# 우선순위는 그 정점을 트리에 잇는 가장 가벼운 에지의 가중치다. 큐의 크기는 정점 수를 넘지 않는다.
+# 결과는 mst와 같이 트리에 추가된 순서의 에지 리스트다.
+def prim(wg: WeightedGraph[V], start: int = 0,
+         queue_factory: Callable[[int], Union[IndexedHeap, PairingHeap]] = IndexedHeap
+         ) -> Optional[WeightedPath]:
+    if start > (wg.vertex_count - 1) or start < 0:
+        return None
+    result: WeightedPath = []
+    in_tree: List[bool] = [False] * wg.vertex_count
+    best_edge: Dict[int, WeightedEdge] = {}  # 트리 밖의 정점 -> 트리에 잇는 가장 가벼운 에지
+    pq: Union[IndexedHeap, PairingHeap] = queue_factory(wg.vertex_count)
+    pq.push(start, 0)
+    while not pq.empty:
+        u, _ = pq.pop()
+        in_tree[u] = True
+        if u != start:
+            result.append(best_edge.pop(u))
+        for edge in wg.edges_for_index(u):
+            if not in_tree[edge.v] and pq.push_or_decrease(edge.v, edge.weight):
+                best_edge[edge.v] = edge
+    return result
+
+
+# CSR 그래프에서 직접 실행하는 지연(lazy) 프림 알고리즘. 결과는 mst와 같다.
+# 큐에는 에지 객체 대신 (가중치, 출발, 도착) 튜플을 넣고 트리에 들어간 에지만 객체로 만든다.
+def mst_csr(graph: CSRGraph[V], start: int = 0) -> Optional[WeightedPath]:
+    if start > (graph.vertex_count - 1) or start < 0:
+        return None
+    if graph.weights is None:
+        raise ValueError("가중치 그래프가 필요합니다.")
+    offsets: memoryview = graph.offsets
+    targets: memoryview = graph.targets
+    weights: memoryview = graph.weights
+    result: WeightedPath = []
+    visited: List[bool] = [False] * graph.vertex_count
+    heap: List[Tuple[float, int, int]] = []
+
+    def visit(index: int) -> None:
+        visited[index] = True
+        for i in range(offsets[index], offsets[index + 1]):
+            if not visited[targets[i]]:
+                heappush(heap, (weights[i], index, targets[i]))
+
+    visit(start)
+    while heap:
+        weight, u, v = heappop(heap)
+        if visited[v]:
+            continue
+        result.append(WeightedEdge(u, v, weight))
+        visit(v)
+    return result
+
+
+# 크루스칼(Kruskal) 알고리즘. 모든 에지를 가중치 순으로 보면서 서로 다른 트리를 잇는 에지만
+# 서로소 집합으로 확인해서 추가한다. 시작 정점이 필요 없다.
+# 그래프가 연결되어 있지 않으면 None을 반환하고, forest=True면 연결 요소마다의 최소 신장 트리를
+# 모은 최소 신장 숲(minimum spanning forest)을 반환한다. 결과는 추가한 순서(가중치 순)의 에지 리스트다.
+def kruskal(wg: WeightedGraph[V], forest: bool = False) -> Optional[WeightedPath]:
+    # 무방향 에지는 양쪽에 저장되어 있으므로 u < v인 쪽만 쓴다.
+    edges: List[WeightedEdge] = [edge for u in range(wg.vertex_count)
+                                 for edge in wg.edges_for_index(u) if edge.u < edge.v]
+    edges.sort(key=attrgetter("weight"))
+    sets: DisjointSet = DisjointSet(wg.vertex_count)
+    result: WeightedPath = []
+    for edge in edges:
+        if sets.union(edge.u, edge.v):
+            result.append(edge)
+            if sets.count == 1:
+                break  # 신장 트리가 완성되었다.
+    if sets.count > 1 and not forest:
+        return None
+    return result
+
+
+# 작업 프로세스가 공유하는 배열. _start_worker가 프로세스마다 한 번 설정한다.
+_shared: Dict[str, memoryview] = {}
+
+
+def _start_worker(us: RawArray, vs: RawArray, weights: RawArray, labels: RawArray) -> None:
+    # ctypes 배열을 그대로 인덱싱하는 것보다 memoryview가 빠르다.
+    _shared["us"] = memoryview(us).cast('B').cast('q')
+    _shared["vs"] = memoryview(vs).cast('B').cast('q')
+    _shared["weights"] = memoryview(weights).cast('B').cast('d')
+    _shared["labels"] = memoryview(labels).cast('B').cast('q')
+
+
+# 에지 배열의 [start, end) 구간에서 연결 요소마다 밖으로 나가는 가장 가벼운 에지를 찾는다.
+# 이미 같은 요소 안에 들어간 에지는 지우고 남은 에지를 구간 앞쪽으로 모은다. 구간은 작업마다
+# 겹치지 않으므로 여러 프로세스가 동시에 써도 된다. (남은 구간의 끝, 요소 -> (가중치, u, v))를 반환한다.
+def _cheapest_edges(bounds: Tuple[int, int]) -> Tuple[int, Dict[int, Tuple[float, int, int]]]:
+    start, end = bounds
+    us: memoryview = _shared["us"]
+    vs: memoryview = _shared["vs"]
+    weights: memoryview = _shared["weights"]
+    labels: memoryview = _shared["labels"]
+    cheapest: Dict[int, Tuple[float, int, int]] = {}
+    kept: int = start
+    for i in range(start, end):
+        u: int = us[i]
+        v: int = vs[i]
+        first: int = labels[u]
+        second: int = labels[v]
+        if first == second:
+            continue
+        # (가중치, u, v)로 비교해서 가중치가 같은 에지 사이에도 일정한 순서를 둔다.
+        # 그래야 요소들이 서로 다른 같은 가중치 에지를 골라 사이클을 만드는 일이 없다.
+        candidate: Tuple[float, int, int] = (weights[i], u, v)
+        if first not in cheapest or candidate < cheapest[first]:
+            cheapest[first] = candidate
+        if second not in cheapest or candidate < cheapest[second]:
+            cheapest[second] = candidate
+        us[kept], vs[kept], weights[kept] = u, v, weights[i]
+        kept += 1
+    return kept, cheapest
+
+
+def _edge_arrays(graph: Union[WeightedGraph[V], CSRGraph[V]]) -> Tuple[array, array, array]:
+    us: array = array('q')
+    vs: array = array('q')
+    weights: array = array('d')
+    for u in range(graph.vertex_count):
+        if isinstance(graph, CSRGraph):
+            edges: Iterable[Tuple[int, float]] = zip(graph.neighbor_indices(u), graph.neighbor_weights(u))
+        else:
+            edges = ((edge.v, edge.weight) for edge in graph.edges_for_index(u))
+        for v, weight in edges:
+            if u < v:
+                us.append(u)
+                vs.append(v)
+                weights.append(weight)
+    return us, vs, weights
+
+
+# 보루프카(Borůvka) 알고리즘. 라운드마다 모든 연결 요소가 밖으로 나가는 가장 가벼운 에지를
+# 동시에 고르고 그 에지로 요소들을 합친다. 요소 수가 라운드마다 절반 이하로 줄어드므로 O(log V)
+# 라운드면 끝난다. 에지 배열을 구간으로 나누어 workers개의 프로세스가 나누어 훑고(공유 메모리),
+# 같은 요소 안에 들어간 에지는 그때 지운다. workers가 1이면 프로세스를 만들지 않는다.
+# 연결되어 있지 않은 그래프와 forest는 kruskal과 같다. WeightedGraph와 CSRGraph를 모두 받는다.
+def boruvka(graph: Union[WeightedGraph[V], CSRGraph[V]], workers: Optional[int] = None,
+            forest: bool = False) -> Optional[WeightedPath]:
+    n: int = graph.vertex_count
+    if isinstance(graph, CSRGraph) and graph.weights is None:
+        raise ValueError("가중치 그래프가 필요합니다.")
+    workers = workers or os.cpu_count() or 1
+    edge_arrays: Tuple[array, array, array] = _edge_arrays(graph)
+    m: int = len(edge_arrays[0])
+    shared: List[RawArray] = []
+    for data in edge_arrays + (array('q', range(n)),):  # 마지막은 정점 -> 연결 요소 번호
+        raw: RawArray = RawArray(data.typecode, len(data))
+        memoryview(raw).cast('B')[:] = memoryview(data).cast('B')
+        shared.append(raw)
+    labels: memoryview = memoryview(shared[3]).cast('B').cast('q')
+    # 작업 수를 프로세스 수보다 넉넉히 두어 남은 에지 수가 달라져도 고르게 나눈다.
+    size: int = max(1, -(-m // (workers * 4)))
+    chunks: List[Tuple[int, int]] = [(start, min(start + size, m)) for start in range(0, m, size)]
+    sets: DisjointSet = DisjointSet(n)
+    result: WeightedPath = []
+    pool: Optional[Pool] = Pool(workers, _start_worker, shared) if workers > 1 else None
+    if pool is None:
+        _start_worker(*shared)
+    try:
+        while chunks and sets.count > 1:
+            found: List[Tuple[int, Dict[int, Tuple[float, int, int]]]] = \
+                pool.map(_cheapest_edges, chunks) if pool is not None else list(map(_cheapest_edges, chunks))
+            cheapest: Dict[int, Tuple[float, int, int]] = {}
+            for _, part in found:
+                for component, candidate in part.items():
+                    if component not in cheapest or candidate < cheapest[component]:
+                        cheapest[component] = candidate
+            if not cheapest:
+                break  # 남은 요소를 잇는 에지가 없다.
+            for weight, u, v in set(cheapest.values()):
+                if sets.union(u, v):
+                    result.append(WeightedEdge(u, v, weight))
+            for v in range(n):
+                labels[v] = sets.find(v)
+            chunks = [(start, kept) for (start, _), (kept, _) in zip(chunks, found) if kept > start]
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        else:
+            _shared.clear()
+        labels.release()
+    if sets.count > 1 and not forest:
+        return None
+    return result
+
+
 def print_weighted_path(wg: WeightedGraph, wp: WeightedPath) -> None:
     for edge in wp:
         print(f"{wg.vertex_at(edge.u)} {edge.weight}> {wg.vertex_at(edge.v)}")
@@ -94,3 +291,6 @@ if __name__ == "__main__":
         print("[최소 신장 트리] 답을 찾을 수 없습니다.")
     else:
         print_weighted_path(city_graph2, result)
+    print("")
+    print("[크루스칼]")
+    print_weighted_path(city_graph2, kruskal(city_graph2))
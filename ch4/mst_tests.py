@@ -0,0 +1,91 @@
+# mst_tests.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import Optional, Set, Tuple
+from random import Random
+from array import array
+from weighted_graph import WeightedGraph
+from csr_graph import CSRGraph
+from disjoint_set import DisjointSet
+from mst import WeightedPath, total_weight, prim, kruskal, boruvka
+from benchmark import random_weighted_graph
+from fixtures import GraphTestCase
+
+
+# 연결 요소마다 프림 알고리즘을 실행한 최소 신장 숲의 가중치와 연결 요소의 수
+def prim_forest(graph: WeightedGraph[int]) -> Tuple[float, int]:
+    seen: Set[int] = set()
+    weight: float = 0
+    components: int = 0
+    for start in range(graph.vertex_count):
+        if start in seen:
+            continue
+        tree: WeightedPath = prim(graph, start)
+        seen.add(start)
+        seen.update(edge.v for edge in tree)
+        weight += total_weight(tree)
+        components += 1
+    return weight, components
+
+
+class SpanningTreeTestCase(GraphTestCase):
+    # 결과가 그래프의 에지로 된 숲이고(사이클 없음) 에지 수가 정점 수 - 연결 요소 수인지 확인한다.
+    def assert_spanning_forest(self, graph: WeightedGraph[int], result: Optional[WeightedPath],
+                               weight: float, components: int) -> None:
+        self.assertIsNotNone(result)
+        self.assertEqual(total_weight(result), weight)
+        self.assertEqual(len(result), graph.vertex_count - components)
+        self.assert_graph_edges(graph, result)
+        sets: DisjointSet = DisjointSet(graph.vertex_count)
+        for edge in result:
+            self.assertTrue(sets.union(edge.u, edge.v))
+
+    def test_connected(self):
+        random: Random = Random(6)
+        for _ in range(60):
+            n: int = random.randint(1, 40)
+            # 가중치를 작은 정수로 두어 가중치가 같은 에지가 많고, 합을 정확히 비교할 수 있다.
+            graph: WeightedGraph[int] = random_weighted_graph(n, random.randint(n - 1, 4 * n), random,
+                                                              loops=True, max_weight=5)
+            weight: float = total_weight(prim(graph))
+            self.assert_spanning_forest(graph, kruskal(graph), weight, 1)
+            for workers in (1, 2):
+                self.assert_spanning_forest(graph, boruvka(graph, workers), weight, 1)
+            self.assert_spanning_forest(graph, boruvka(CSRGraph.from_graph(graph), 1), weight, 1)
+
+    def test_disconnected(self):
+        random: Random = Random(8)
+        for _ in range(60):
+            n: int = random.randint(2, 40)
+            graph: WeightedGraph[int] = random_weighted_graph(n, random.randint(0, n), random, connected=False,
+                                                              loops=True, max_weight=5)
+            weight, components = prim_forest(graph)
+            if components == 1:
+                continue
+            self.assertIsNone(kruskal(graph))
+            self.assertIsNone(boruvka(graph, 1))
+            self.assert_spanning_forest(graph, kruskal(graph, forest=True), weight, components)
+            for workers in (1, 2):
+                self.assert_spanning_forest(graph, boruvka(graph, workers, forest=True), weight, components)
+
+    def test_unweighted_csr(self):
+        graph: CSRGraph[int] = CSRGraph([0, 1], array('q', [0, 1, 2]), array('q', [1, 0]))
+        with self.assertRaises(ValueError):
+            boruvka(graph)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# path_cache.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar, Generic, List, Optional, Dict, Tuple
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from mst import WeightedPath
+from weighted_graph import WeightedGraph
+from weighted_edge import WeightedEdge
+from dijkstra import dijkstra, QueueFactory
+from priority_queue import IndexedHeap
+
+V = TypeVar('V')  # 그래프 정점(vertice) 타입
+
+
+@dataclass
+class CacheStatistics:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # 메모리 한도 때문에 버린 트리 수
+    invalidations: int = 0  # 그래프가 바뀌어서 캐시를 비운 횟수
+
+    @property
+    def hit_rate(self) -> float:
+        total: int = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# 한 시작 정점의 최단 경로 트리. 정점마다 거리, 부모 정점, 부모 에지의 가중치를 array에 저장한다.
+# 거리 리스트와 WeightedEdge 딕셔너리 대신 정점 하나에 24바이트만 쓴다.
+class _Tree:
+    def __init__(self, vertex_count: int, distances: List[Optional[float]],
+                 path_dict: Dict[int, WeightedEdge]) -> None:
+        self.distances: array = array('d', [float("inf") if d is None else d for d in distances])
+        self.parents: array = array('q', [-1]) * vertex_count
+        self.weights: array = array('d', [0.0]) * vertex_count
+        for v, edge in path_dict.items():
+            self.parents[v] = edge.u
+            self.weights[v] = edge.weight
+
+    @property
+    def size(self) -> int:
+        return sum(data.itemsize * len(data) for data in (self.distances, self.parents, self.weights))
+
+    def distance_list(self) -> List[Optional[float]]:
+        return [None if d == float("inf") else d for d in self.distances]
+
+    def path_dict(self) -> Dict[int, WeightedEdge]:
+        return {v: WeightedEdge(u, v, self.weights[v]) for v, u in enumerate(self.parents) if u >= 0}
+
+
+# 시작 정점별로 dijkstra 결과를 기억하는 캐시. 같은 시작 정점의 질의가 반복되면 다시 계산하지 않는다.
+# 트리들의 크기 합이 memory_budget(바이트)을 넘으면 가장 오래 쓰지 않은 트리부터 버린다(LRU).
+# 그래프의 version이 저장할 때와 달라지면(정점이나 에지를 추가하면) 캐시를 모두 비운다.
+class ShortestPathCache(Generic[V]):
+    def __init__(self, wg: WeightedGraph[V], memory_budget: int = 64 * 2 ** 20,
+                 queue_factory: QueueFactory = IndexedHeap) -> None:
+        self.graph: WeightedGraph[V] = wg
+        self.memory_budget: int = memory_budget
+        self.queue_factory: QueueFactory = queue_factory
+        self.statistics: CacheStatistics = CacheStatistics()
+        self._trees: OrderedDict[int, _Tree] = OrderedDict()  # 시작 인덱스 -> 트리(최근에 쓴 것이 끝)
+        self._version: int = wg.version
+        self._memory: int = 0
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    def __contains__(self, source: V) -> bool:
+        return self._version == self.graph.version and self.graph.index_of(source) in self._trees
+
+    @property
+    def memory(self) -> int:
+        return self._memory  # 저장한 트리들의 크기(바이트)
+
+    def clear(self) -> None:
+        self._trees.clear()
+        self._memory = 0
+
+    def _tree(self, source: V) -> _Tree:
+        if self._version != self.graph.version:
+            if self._trees:
+                self.statistics.invalidations += 1
+            self.clear()
+            self._version = self.graph.version
+        first: int = self.graph.index_of(source)
+        tree: Optional[_Tree] = self._trees.get(first)
+        if tree is not None:
+            self.statistics.hits += 1
+            self._trees.move_to_end(first)
+            return tree
+        self.statistics.misses += 1
+        distances, path_dict = dijkstra(self.graph, source, self.queue_factory)
+        tree = _Tree(self.graph.vertex_count, distances, path_dict)
+        if tree.size > self.memory_budget:
+            return tree  # 한도보다 큰 트리는 저장하지 않는다.
+        self._trees[first] = tree
+        self._memory += tree.size
+        while self._memory > self.memory_budget:
+            _, evicted = self._trees.popitem(last=False)
+            self._memory -= evicted.size
+            self.statistics.evictions += 1
+        return tree
+
+    # dijkstra(wg, source)와 같은 (거리 리스트, path_dict)를 반환한다.
+    def dijkstra(self, source: V) -> Tuple[List[Optional[float]], Dict[int, WeightedEdge]]:
+        tree: _Tree = self._tree(source)
+        return tree.distance_list(), tree.path_dict()
+
+    # source에서 target까지의 거리. 경로가 없으면 None
+    def distance(self, source: V, target: V) -> Optional[float]:
+        d: float = self._tree(source).distances[self.graph.index_of(target)]
+        return None if d == float("inf") else d
+
+    # source에서 target까지의 최단 경로. 전체 path_dict를 만들지 않고 부모를 따라간다.
+    def path(self, source: V, target: V) -> Optional[WeightedPath]:
+        tree: _Tree = self._tree(source)
+        first: int = self.graph.index_of(source)
+        v: int = self.graph.index_of(target)
+        if tree.distances[v] == float("inf"):
+            return None
+        path: WeightedPath = []
+        while v != first:
+            path.append(WeightedEdge(tree.parents[v], v, tree.weights[v]))
+            v = tree.parents[v]
+        return list(reversed(path))
+
+
+if __name__ == "__main__":
+    from random import Random
+    from time import perf_counter
+    from benchmark import random_weighted_graph
+
+    graph: WeightedGraph[int] = random_weighted_graph(10000, 30000)
+    # 정점 10000개 그래프의 트리는 240KB이므로 트리 20개 정도를 저장할 수 있다.
+    cache: ShortestPathCache[int] = ShortestPathCache(graph, memory_budget=5 * 2 ** 20)
+    random: Random = Random(0)
+    depots: List[int] = [random.randrange(graph.vertex_count) for _ in range(10)]
+    start: float = perf_counter()
+    for _ in range(200):
+        # 질의의 90%는 몇 안 되는 출발지(depot)에서 나온다.
+        source: int = random.choice(depots) if random.random() < 0.9 else random.randrange(graph.vertex_count)
+        cache.path(source, random.randrange(graph.vertex_count))
+    print(f"질의 200개: {perf_counter() - start:.2f}초, 적중률 {cache.statistics.hit_rate:.0%}, "
+          f"트리 {len(cache)}개({cache.memory / 2 ** 20:.1f}MB), 버림 {cache.statistics.evictions}번")
+    graph.add_edge_by_indices(0, 1, 1.0)  # 그래프가 바뀌면 다음 질의에서 캐시를 비운다.
+    cache.path(depots[0], 1)
+    print(f"에지 추가 후: 트리 {len(cache)}개, 무효화 {cache.statistics.invalidations}번")
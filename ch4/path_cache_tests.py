@@ -0,0 +1,91 @@
+# path_cache_tests.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import List, Optional
+from random import Random
+from weighted_graph import WeightedGraph
+from dijkstra import dijkstra
+from path_cache import ShortestPathCache
+from priority_queue import PairingHeap
+from benchmark import random_weighted_graph
+from fixtures import GraphTestCase
+
+TREE_SIZE: int = 24 * 10  # 정점 10개 그래프의 트리 하나의 크기(바이트)
+
+
+class ShortestPathCacheTestCase(GraphTestCase):
+    def setUp(self) -> None:
+        self.graph: WeightedGraph[int] = random_weighted_graph(10, 20, 3, max_weight=20)
+
+    def test_lru_eviction(self):
+        cache: ShortestPathCache[int] = ShortestPathCache(self.graph, memory_budget=2 * TREE_SIZE)
+        cache.distance(0, 5)
+        cache.distance(1, 5)
+        cache.distance(0, 6)  # 0을 다시 써서 1이 가장 오래 쓰지 않은 트리가 된다.
+        cache.distance(2, 5)
+        self.assertEqual([v for v in range(10) if v in cache], [0, 2])
+        self.assertEqual(cache.memory, 2 * TREE_SIZE)
+        cache.path(1, 5)
+        self.assertEqual([v for v in range(10) if v in cache], [1, 2])
+        self.assertEqual((cache.statistics.hits, cache.statistics.misses, cache.statistics.evictions), (1, 4, 2))
+        self.assertEqual(cache.statistics.hit_rate, 1 / 5)
+
+    def test_tree_larger_than_budget(self):
+        cache: ShortestPathCache[int] = ShortestPathCache(self.graph, memory_budget=TREE_SIZE - 1)
+        expected: List[Optional[float]] = dijkstra(self.graph, 0)[0]
+        for _ in range(2):
+            self.assertEqual(cache.distance(0, 7), expected[7])
+        self.assertEqual((len(cache), cache.memory), (0, 0))
+        self.assertEqual((cache.statistics.hits, cache.statistics.misses, cache.statistics.evictions), (0, 2, 0))
+
+    def test_graph_change_invalidates(self):
+        cache: ShortestPathCache[int] = ShortestPathCache(self.graph)
+        cache.distance(0, 5)
+        cache.distance(1, 5)
+        self.graph.add_edge_by_indices(0, 5, 0.5)
+        self.assertNotIn(0, cache)  # 바뀐 그래프에서는 저장한 트리를 쓰지 않는다.
+        self.assertEqual(cache.distance(0, 5), 0.5)
+        self.assertEqual(cache.statistics.invalidations, 1)
+        self.assertEqual((len(cache), cache.memory, cache.statistics.misses), (1, TREE_SIZE, 3))
+        self.assertEqual(cache.dijkstra(1)[0], dijkstra(self.graph, 1)[0])
+        # 비어 있는 캐시를 비우는 것은 무효화로 세지 않는다.
+        cache.clear()
+        self.graph.update_edge_by_indices(0, 5, 2)
+        cache.distance(0, 5)
+        self.assertEqual(cache.statistics.invalidations, 1)
+
+    # 연결되지 않은 무작위 그래프의 모든 정점 쌍에서 거리와 경로가 dijkstra와 같아야 한다.
+    # 트리 세 개만 저장할 수 있게 해서 버리고 다시 계산하는 경우도 섞는다.
+    def test_matches_dijkstra(self):
+        random: Random = Random(5)
+        for _ in range(20):
+            n: int = random.randint(1, 20)
+            graph: WeightedGraph[int] = random_weighted_graph(n, random.randint(0, 2 * n), random, connected=False,
+                                                              loops=True)
+            cache: ShortestPathCache[int] = ShortestPathCache(graph, memory_budget=3 * 24 * n,
+                                                              queue_factory=PairingHeap)
+            for _ in range(3 * n):
+                source: int = random.randrange(n)
+                distances, path_dict = dijkstra(graph, source)
+                self.assertEqual(cache.dijkstra(source), (distances, path_dict))
+                for target in range(n):
+                    self.assertEqual(cache.distance(source, target), distances[target])
+                    self.assert_path(graph, cache.path(source, target), source, target, distances[target])
+            self.assertLessEqual(cache.memory, cache.memory_budget)
+
+
+if __name__ == "__main__":
+    unittest.main()
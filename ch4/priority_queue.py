@@ -13,7 +13,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, List, Tuple
 from heapq import heappush, heappop
 
 
@@ -36,3 +36,211 @@ class PriorityQueue(Generic[T]):
 
     def __repr__(self) -> str:
         return repr(self._container)
+
+
+# 인덱스(0..capacity-1, 예: 정점 인덱스)를 키로 쓰는 d-진 힙. 항목마다 힙 안의 위치를
+# 기억하므로 decrease_key가 O(log n)이다. 같은 인덱스는 한 번만 들어갈 수 있다.
+# arity=2면 이진 힙이고, 4처럼 크게 하면 트리가 얕아져 decrease_key가 많은 다익스트라에 유리하다.
+class IndexedHeap:
+    def __init__(self, capacity: int, arity: int = 2) -> None:
+        if arity < 2:
+            raise ValueError("arity는 2 이상이어야 합니다.")
+        self._arity: int = arity
+        self._heap: List[int] = []  # 힙 순서의 인덱스
+        self._position: List[int] = [-1] * capacity  # 인덱스 -> 힙 위치(-1이면 없음)
+        self._priority: List[float] = [0.0] * capacity
+        self.peak: int = 0  # 가장 컸던 크기
+
+    @property
+    def empty(self) -> bool:
+        return not self._heap
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, index: int) -> bool:
+        return self._position[index] >= 0
+
+    def priority(self, index: int) -> float:
+        return self._priority[index]
+
+    def push(self, index: int, priority: float) -> None:
+        if self._position[index] >= 0:
+            raise ValueError(f"{index}는 이미 큐에 있습니다.")
+        self._priority[index] = priority
+        self._heap.append(index)
+        self._position[index] = len(self._heap) - 1
+        self.peak = max(self.peak, len(self._heap))
+        self._sift_up(len(self._heap) - 1)
+
+    def decrease_key(self, index: int, priority: float) -> None:
+        if priority > self._priority[index]:
+            raise ValueError("우선순위를 높일 수는 없습니다.")
+        self._priority[index] = priority
+        self._sift_up(self._position[index])
+
+    # 큐에 없으면 넣고, 있으면 더 작을 때만 줄인다. 바뀌었으면 True
+    def push_or_decrease(self, index: int, priority: float) -> bool:
+        if self._position[index] < 0:
+            self.push(index, priority)
+            return True
+        if priority < self._priority[index]:
+            self.decrease_key(index, priority)
+            return True
+        return False
+
+    # 우선순위가 가장 작은 (인덱스, 우선순위)를 꺼내지 않고 반환한다.
+    def top(self) -> Tuple[int, float]:
+        return self._heap[0], self._priority[self._heap[0]]
+
+    # 우선순위가 가장 작은 (인덱스, 우선순위)를 꺼낸다.
+    def pop(self) -> Tuple[int, float]:
+        heap: List[int] = self._heap
+        top: int = heap[0]
+        last: int = heap.pop()
+        self._position[top] = -1
+        if heap:
+            heap[0] = last
+            self._position[last] = 0
+            self._sift_down(0)
+        return top, self._priority[top]
+
+    def _sift_up(self, i: int) -> None:
+        heap: List[int] = self._heap
+        item: int = heap[i]
+        priority: float = self._priority[item]
+        while i > 0:
+            parent: int = (i - 1) // self._arity
+            if self._priority[heap[parent]] <= priority:
+                break
+            heap[i] = heap[parent]
+            self._position[heap[i]] = i
+            i = parent
+        heap[i] = item
+        self._position[item] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap: List[int] = self._heap
+        size: int = len(heap)
+        item: int = heap[i]
+        priority: float = self._priority[item]
+        while True:
+            first: int = self._arity * i + 1
+            if first >= size:
+                break
+            best: int = first
+            best_priority: float = self._priority[heap[first]]
+            for c in range(first + 1, min(first + self._arity, size)):
+                if self._priority[heap[c]] < best_priority:
+                    best, best_priority = c, self._priority[heap[c]]
+            if best_priority >= priority:
+                break
+            heap[i] = heap[best]
+            self._position[heap[i]] = i
+            i = best
+        heap[i] = item
+        self._position[item] = i
+
+    def __repr__(self) -> str:
+        return repr([(i, self._priority[i]) for i in self._heap])
+
+
+# IndexedHeap과 같은 인터페이스의 페어링 힙(pairing heap).
+# push와 decrease_key는 O(1)(상각)이고 pop은 O(log n)(상각)이다. 노드는 인덱스마다
+# 자식, 형제, 앞(부모 또는 왼쪽 형제) 배열로 표현한다.
+class PairingHeap:
+    def __init__(self, capacity: int) -> None:
+        self._priority: List[float] = [0.0] * capacity
+        self._child: List[int] = [-1] * capacity
+        self._sibling: List[int] = [-1] * capacity
+        self._previous: List[int] = [-1] * capacity
+        self._present: List[bool] = [False] * capacity
+        self._root: int = -1
+        self._size: int = 0
+        self.peak: int = 0
+
+    @property
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, index: int) -> bool:
+        return self._present[index]
+
+    def priority(self, index: int) -> float:
+        return self._priority[index]
+
+    def push(self, index: int, priority: float) -> None:
+        if self._present[index]:
+            raise ValueError(f"{index}는 이미 큐에 있습니다.")
+        self._priority[index] = priority
+        self._child[index] = self._sibling[index] = self._previous[index] = -1
+        self._present[index] = True
+        self._size += 1
+        self.peak = max(self.peak, self._size)
+        self._root = index if self._root < 0 else self._meld(self._root, index)
+
+    def decrease_key(self, index: int, priority: float) -> None:
+        if priority > self._priority[index]:
+            raise ValueError("우선순위를 높일 수는 없습니다.")
+        self._priority[index] = priority
+        if index == self._root:
+            return
+        # 부모에서 잘라내서 루트와 합친다.
+        previous: int = self._previous[index]
+        sibling: int = self._sibling[index]
+        if self._child[previous] == index:
+            self._child[previous] = sibling
+        else:
+            self._sibling[previous] = sibling
+        if sibling >= 0:
+            self._previous[sibling] = previous
+        self._sibling[index] = self._previous[index] = -1
+        self._root = self._meld(self._root, index)
+
+    def push_or_decrease(self, index: int, priority: float) -> bool:
+        if not self._present[index]:
+            self.push(index, priority)
+            return True
+        if priority < self._priority[index]:
+            self.decrease_key(index, priority)
+            return True
+        return False
+
+    def top(self) -> Tuple[int, float]:
+        return self._root, self._priority[self._root]
+
+    def pop(self) -> Tuple[int, float]:
+        top: int = self._root
+        self._present[top] = False
+        self._size -= 1
+        # 자식들을 왼쪽부터 둘씩 합친 뒤, 오른쪽부터 차례로 합친다(two-pass).
+        children: List[int] = []
+        child: int = self._child[top]
+        while child >= 0:
+            following: int = self._sibling[child]
+            self._sibling[child] = self._previous[child] = -1
+            children.append(child)
+            child = following
+        pairs: List[int] = [self._meld(children[i], children[i + 1]) if i + 1 < len(children)
+                            else children[i] for i in range(0, len(children), 2)]
+        root: int = -1
+        for node in reversed(pairs):
+            root = node if root < 0 else self._meld(root, node)
+        self._root = root
+        self._child[top] = -1
+        return top, self._priority[top]
+
+    # 두 트리의 루트를 비교해서 큰 쪽을 작은 쪽의 첫 자식으로 붙인다.
+    def _meld(self, a: int, b: int) -> int:
+        if self._priority[b] < self._priority[a]:
+            a, b = b, a
+        first: int = self._child[a]
+        self._sibling[b] = first
+        if first >= 0:
+            self._previous[first] = b
+        self._child[a] = b
+        self._previous[b] = a
+        return a
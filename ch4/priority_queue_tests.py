@@ -0,0 +1,113 @@
+# priority_queue_tests.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import List, Dict, Tuple, Callable
+from heapq import heappush, heappop
+from random import Random
+from priority_queue import IndexedHeap, PairingHeap
+from dijkstra import IndexedQueue
+
+# 비교할 큐. 이진 힙, 4진 힙, 페어링 힙
+FACTORIES: List[Tuple[str, Callable[[int], IndexedQueue]]] = [
+    ("IndexedHeap(arity=2)", lambda capacity: IndexedHeap(capacity, 2)),
+    ("IndexedHeap(arity=4)", lambda capacity: IndexedHeap(capacity, 4)),
+    ("PairingHeap", PairingHeap)]
+
+
+# heapq로 만든 기준 큐. decrease_key는 새 항목을 넣고 오래된 항목은 꺼낼 때 건너뛴다(지연 삭제).
+class ReferenceQueue:
+    def __init__(self) -> None:
+        self.heap: List[Tuple[float, int, int]] = []  # (우선순위, 인덱스, 번호)
+        self.current: Dict[int, Tuple[float, int]] = {}  # 인덱스 -> (우선순위, 번호)
+        self.stamp: int = 0
+
+    def set(self, index: int, priority: float) -> None:
+        self.stamp += 1
+        self.current[index] = (priority, self.stamp)
+        heappush(self.heap, (priority, index, self.stamp))
+
+    def min_priority(self) -> float:
+        while self.current.get(self.heap[0][1], (None, None))[1] != self.heap[0][2]:
+            heappop(self.heap)
+        return self.heap[0][0]
+
+
+class IndexedQueueTestCase(unittest.TestCase):
+    # 무작위 연산을 기준 큐와 함께 실행한다. 우선순위가 같은 인덱스는 어느 것이 먼저 나와도 된다.
+    def test_matches_heapq(self):
+        random: Random = Random(17)
+        for name, factory in FACTORIES:
+            for _ in range(100):
+                capacity: int = random.randint(1, 40)
+                queue: IndexedQueue = factory(capacity)
+                reference: ReferenceQueue = ReferenceQueue()
+                peak: int = 0
+                for _ in range(random.randint(1, 300)):
+                    index: int = random.randrange(capacity)
+                    priority: float = random.randint(0, 30)  # 같은 우선순위가 자주 나오도록 작은 정수
+                    action: float = random.random()
+                    if action < 0.3 and reference.current:
+                        popped, popped_priority = queue.pop()
+                        self.assertEqual(popped_priority, reference.min_priority(), name)
+                        self.assertEqual(reference.current.pop(popped)[0], popped_priority, name)
+                    elif action < 0.5:
+                        if index in reference.current:
+                            continue
+                        queue.push(index, priority)
+                        reference.set(index, priority)
+                    elif action < 0.7:
+                        if index not in reference.current or priority > reference.current[index][0]:
+                            continue
+                        queue.decrease_key(index, priority)
+                        reference.set(index, priority)
+                    else:
+                        changed: bool = index not in reference.current or priority < reference.current[index][0]
+                        self.assertEqual(queue.push_or_decrease(index, priority), changed, name)
+                        if changed:
+                            reference.set(index, priority)
+                    peak = max(peak, len(reference.current))
+                    self.assertEqual(len(queue), len(reference.current), name)
+                    self.assertEqual(queue.empty, not reference.current, name)
+                    for i in range(capacity):
+                        self.assertEqual(i in queue, i in reference.current, name)
+                        if i in reference.current:
+                            self.assertEqual(queue.priority(i), reference.current[i][0], name)
+                    if reference.current:
+                        self.assertEqual(queue.top()[1], reference.min_priority(), name)
+                self.assertEqual(queue.peak, peak, name)
+                # 남은 항목을 모두 꺼내면 우선순위 순서여야 한다.
+                drained: List[float] = [queue.pop()[1] for _ in range(len(queue))]
+                self.assertEqual(drained, sorted(priority for priority, _ in reference.current.values()), name)
+                self.assertTrue(queue.empty, name)
+
+    def test_errors(self):
+        for name, factory in FACTORIES:
+            queue: IndexedQueue = factory(3)
+            queue.push(1, 5)
+            with self.assertRaises(ValueError, msg=name):
+                queue.push(1, 2)  # 이미 큐에 있는 인덱스
+            with self.assertRaises(ValueError, msg=name):
+                queue.decrease_key(1, 6)  # 우선순위를 높일 수 없다.
+            self.assertFalse(queue.push_or_decrease(1, 6), name)
+            self.assertEqual(queue.pop(), (1, 5), name)
+            queue.push(1, 7)  # 꺼낸 인덱스는 다시 넣을 수 있다.
+            self.assertEqual(queue.top(), (1, 7), name)
+        with self.assertRaises(ValueError):
+            IndexedHeap(3, arity=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+# shortest_path.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import TypeVar, List, Optional, Dict, Callable, Mapping, Tuple
+from math import radians, sin, cos, asin, sqrt
+from mst import WeightedPath, print_weighted_path
+from weighted_graph import WeightedGraph
+from weighted_edge import WeightedEdge
+from dijkstra import IndexedQueue, QueueFactory, path_dict_to_path
+from priority_queue import IndexedHeap
+
+V = TypeVar('V')  # 그래프 정점(vertice) 타입
+Heuristic = Callable[[V], float]  # 정점 -> 목표 정점까지 남은 거리의 추정값
+
+
+# 한 정점에서 다른 한 정점까지의 최단 경로. dijkstra처럼 모든 정점의 거리를 구하지 않고
+# 목표 정점이 큐에서 나오는(거리가 확정되는) 순간 멈춘다. 경로가 없으면 None을 반환한다.
+def shortest_path(wg: WeightedGraph[V], source: V, target: V,
+                  queue_factory: QueueFactory = IndexedHeap) -> Optional[WeightedPath]:
+    return _search(wg, wg.index_of(source), wg.index_of(target), None, queue_factory)
+
+
+# A* 탐색. 큐의 우선순위로 (시작점에서의 거리 + heuristic(정점))을 써서 목표 쪽 정점을 먼저 꺼낸다.
+# heuristic은 실제 남은 거리를 넘지 않아야(admissible) 최단 경로가 보장된다.
+# 일관적(consistent)이지 않은 휴리스틱도 더 짧은 경로를 찾은 정점을 다시 큐에 넣으므로 괜찮다.
+def astar(wg: WeightedGraph[V], source: V, target: V, heuristic: Heuristic,
+          queue_factory: QueueFactory = IndexedHeap) -> Optional[WeightedPath]:
+    return _search(wg, wg.index_of(source), wg.index_of(target), heuristic, queue_factory)
+
+
+def _search(wg: WeightedGraph[V], first: int, last: int, heuristic: Optional[Heuristic],
+            queue_factory: QueueFactory) -> Optional[WeightedPath]:
+    if first == last:
+        return []
+    distances: List[Optional[float]] = [None] * wg.vertex_count
+    distances[first] = 0
+    estimates: Dict[int, float] = {}  # 정점 인덱스 -> 휴리스틱 값(정점마다 한 번만 계산한다)
+
+    def estimate(index: int) -> float:
+        if heuristic is None:
+            return 0
+        if index not in estimates:
+            estimates[index] = heuristic(wg.vertex_at(index))
+        return estimates[index]
+
+    path_dict: Dict[int, WeightedEdge] = {}
+    pq: IndexedQueue = queue_factory(wg.vertex_count)
+    pq.push(first, estimate(first))
+    while not pq.empty:
+        u, _ = pq.pop()
+        if u == last:  # 목표 정점의 거리가 확정되었다.
+            return path_dict_to_path(first, last, path_dict)
+        dist_u: float = distances[u]
+        for we in wg.edges_for_index(u):
+            dist_v: Optional[float] = distances[we.v]
+            if dist_v is None or dist_v > dist_u + we.weight:
+                distances[we.v] = dist_u + we.weight
+                path_dict[we.v] = we
+                pq.push_or_decrease(we.v, dist_u + we.weight + estimate(we.v))
+    return None
+
+
+# 양방향 다익스트라. 시작 정점과 목표 정점 양쪽에서 번갈아 탐색하고, 두 탐색이 만나서 찾은
+# 가장 짧은 경로 mu가 양쪽 큐의 최솟값의 합보다 짧거나 같으면 멈춘다.
+# 반지름 r인 원 하나 대신 반지름 r/2인 원 두 개만 탐색하므로 보통 훨씬 적은 정점을 꺼낸다.
+# 그래프는 무방향이므로 뒤쪽 탐색도 같은 에지를 쓴다.
+def bidirectional_dijkstra(wg: WeightedGraph[V], source: V, target: V,
+                           queue_factory: QueueFactory = IndexedHeap) -> Optional[WeightedPath]:
+    first: int = wg.index_of(source)
+    last: int = wg.index_of(target)
+    if first == last:
+        return []
+    # 0은 앞쪽(source에서) 탐색, 1은 뒤쪽(target에서) 탐색
+    distances: Tuple[List[Optional[float]], List[Optional[float]]] = (
+        [None] * wg.vertex_count, [None] * wg.vertex_count)
+    path_dicts: Tuple[Dict[int, WeightedEdge], Dict[int, WeightedEdge]] = ({}, {})
+    queues: Tuple[IndexedQueue, IndexedQueue] = (
+        queue_factory(wg.vertex_count), queue_factory(wg.vertex_count))
+    for side, start in ((0, first), (1, last)):
+        distances[side][start] = 0
+        queues[side].push(start, 0)
+    best: float = float("inf")  # 지금까지 찾은 가장 짧은 경로(mu)
+    meeting: int = -1  # 그 경로에서 두 탐색이 만난 정점
+
+    while not queues[0].empty and not queues[1].empty:
+        tops: List[float] = [queues[0].top()[1], queues[1].top()[1]]
+        if tops[0] + tops[1] >= best:
+            break
+        side: int = 0 if tops[0] <= tops[1] else 1
+        u, dist_u = queues[side].pop()
+        mine: List[Optional[float]] = distances[side]
+        other: List[Optional[float]] = distances[1 - side]
+        for we in wg.edges_for_index(u):
+            candidate: float = dist_u + we.weight
+            if mine[we.v] is None or mine[we.v] > candidate:
+                mine[we.v] = candidate
+                path_dicts[side][we.v] = we
+                queues[side].push_or_decrease(we.v, candidate)
+            if other[we.v] is not None and candidate + other[we.v] < best:
+                best = candidate + other[we.v]
+                meeting = we.v
+
+    if meeting < 0:
+        return None
+    path: WeightedPath = path_dict_to_path(first, meeting, path_dicts[0]) if meeting != first else []
+    # 뒤쪽 탐색의 에지는 target 쪽에서 meeting으로 향하므로 뒤집어서 이어 붙인다.
+    v: int = meeting
+    while v != last:
+        edge: WeightedEdge = path_dicts[1][v]
+        path.append(edge.reversed())
+        v = edge.u
+    return path
+
+
+# (위도, 경도) 좌표(도 단위)로 대권(great-circle) 거리를 구하는 A* 휴리스틱을 만든다.
+# radius는 지구 반지름으로, 기본값은 마일(mile) 단위다. 에지 가중치도 같은 단위여야 한다.
+def great_circle_heuristic(coordinates: Mapping[V, Tuple[float, float]], target: V,
+                           radius: float = 3958.8) -> Heuristic:
+    latitude, longitude = map(radians, coordinates[target])
+
+    def heuristic(vertex: V) -> float:
+        vertex_latitude, vertex_longitude = map(radians, coordinates[vertex])
+        h: float = sin((latitude - vertex_latitude) / 2) ** 2 + \
+            cos(latitude) * cos(vertex_latitude) * sin((longitude - vertex_longitude) / 2) ** 2
+        return 2 * radius * asin(sqrt(h))
+    return heuristic
+
+
+if __name__ == "__main__":
+    city_graph2: WeightedGraph[str] = WeightedGraph(
+        ["시애틀", "샌프란시스코", "로스앤젤레스", "리버사이드", "피닉스", "시카고", "보스턴", "뉴욕", "애틀랜타", "마이애미", "댈러스", "휴스턴", "디트로이트", "필라델피아", "워싱턴"])
+
+    city_graph2.add_edge_by_vertices("시애틀", "시카고", 1737)
+    city_graph2.add_edge_by_vertices("시애틀", "샌프란시스코", 678)
+    city_graph2.add_edge_by_vertices("샌프란시스코", "리버사이드", 386)
+    city_graph2.add_edge_by_vertices("샌프란시스코", "로스앤젤레스", 348)
+    city_graph2.add_edge_by_vertices("로스앤젤레스", "리버사이드", 50)
+    city_graph2.add_edge_by_vertices("로스앤젤레스", "피닉스", 357)
+    city_graph2.add_edge_by_vertices("리버사이드", "피닉스", 307)
+    city_graph2.add_edge_by_vertices("리버사이드", "시카고", 1704)
+    city_graph2.add_edge_by_vertices("피닉스", "댈러스", 887)
+    city_graph2.add_edge_by_vertices("피닉스", "휴스턴", 1015)
+    city_graph2.add_edge_by_vertices("댈러스", "시카고", 805)
+    city_graph2.add_edge_by_vertices("댈러스", "애틀랜타", 721)
+    city_graph2.add_edge_by_vertices("댈러스", "휴스턴", 225)
+    city_graph2.add_edge_by_vertices("휴스턴", "애틀랜타", 702)
+    city_graph2.add_edge_by_vertices("휴스턴", "마이애미", 968)
+    city_graph2.add_edge_by_vertices("애틀랜타", "시카고", 588)
+    city_graph2.add_edge_by_vertices("애틀랜타", "워싱턴", 543)
+    city_graph2.add_edge_by_vertices("애틀랜타", "마이애미", 604)
+    city_graph2.add_edge_by_vertices("마이애미", "워싱턴", 923)
+    city_graph2.add_edge_by_vertices("시카고", "디트로이트", 238)
+    city_graph2.add_edge_by_vertices("디트로이트", "보스턴", 613)
+    city_graph2.add_edge_by_vertices("디트로이트", "워싱턴", 396)
+    city_graph2.add_edge_by_vertices("디트로이트", "뉴욕", 482)
+    city_graph2.add_edge_by_vertices("보스턴", "뉴욕", 190)
+    city_graph2.add_edge_by_vertices("뉴욕", "필라델피아", 81)
+    city_graph2.add_edge_by_vertices("필라델피아", "워싱턴", 123)
+
+    # 도시의 (위도, 경도)
+    coordinates: Dict[str, Tuple[float, float]] = {
+        "시애틀": (47.61, -122.33), "샌프란시스코": (37.77, -122.42), "로스앤젤레스": (34.05, -118.24),
+        "리버사이드": (33.95, -117.40), "피닉스": (33.45, -112.07), "시카고": (41.88, -87.63),
+        "보스턴": (42.36, -71.06), "뉴욕": (40.71, -74.01), "애틀랜타": (33.75, -84.39),
+        "마이애미": (25.76, -80.19), "댈러스": (32.78, -96.80), "휴스턴": (29.76, -95.37),
+        "디트로이트": (42.33, -83.05), "필라델피아": (39.95, -75.17), "워싱턴": (38.91, -77.04)}
+    # 에지 가중치는 반올림한 거리라서 대권 거리보다 몇 마일 짧을 수 있다.
+    # 휴리스틱이 남은 거리를 넘지 않도록 1% 줄여서 쓴다.
+    to_boston: Heuristic = great_circle_heuristic(coordinates, "보스턴", radius=3958.8 * 0.99)
+
+    print("로스앤젤레스에서 보스턴까지의 최단 경로(shortest_path):")
+    print_weighted_path(city_graph2, shortest_path(city_graph2, "로스앤젤레스", "보스턴"))
+    print("")
+    print("로스앤젤레스에서 보스턴까지의 최단 경로(bidirectional_dijkstra):")
+    print_weighted_path(city_graph2, bidirectional_dijkstra(city_graph2, "로스앤젤레스", "보스턴"))
+    print("")
+    print("로스앤젤레스에서 보스턴까지의 최단 경로(astar):")
+    print_weighted_path(city_graph2, astar(city_graph2, "로스앤젤레스", "보스턴", to_boston))
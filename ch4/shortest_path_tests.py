@@ -0,0 +1,100 @@
+# shortest_path_tests.py
+# From Classic Computer Science Problems in Python Chapter 4
+# Copyright 2018 David Kopec
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from typing import List, Optional, Dict, Tuple
+from math import pi
+from random import Random
+from weighted_graph import WeightedGraph
+from dijkstra import dijkstra
+from priority_queue import IndexedHeap, PairingHeap
+from shortest_path import shortest_path, bidirectional_dijkstra, astar, great_circle_heuristic
+from benchmark import random_weighted_graph
+from fixtures import GraphTestCase
+
+
+# 연결되지 않았을 수 있는 무작위 그래프에 가중치가 0인 에지를 섞는다.
+def graph_with_zero_weights(random: Random) -> WeightedGraph[int]:
+    n: int = random.randint(1, 20)
+    graph: WeightedGraph[int] = random_weighted_graph(n, random.randint(0, 2 * n), random, connected=False,
+                                                      loops=True, max_weight=10)
+    graph.add_edges_from((random.randrange(n), random.randrange(n), 0) for _ in range(random.randint(0, n)))
+    return graph
+
+
+class ShortestPathTestCase(GraphTestCase):
+    # 모든 정점 쌍(같은 정점, 연결되지 않은 쌍 포함)에서 경로의 길이가 dijkstra의 거리와 같아야 한다.
+    def test_matches_dijkstra(self):
+        random: Random = Random(21)
+        for _ in range(60):
+            graph: WeightedGraph[int] = graph_with_zero_weights(random)
+            for source in range(graph.vertex_count):
+                expected: List[Optional[float]] = dijkstra(graph, source)[0]
+                for target in range(graph.vertex_count):
+                    # 목표까지의 실제 거리 이하인 휴리스틱. 0.5배는 일관적이고, 무작위 배수는 일관적이지 않다.
+                    remaining: List[Optional[float]] = dijkstra(graph, target)[0]
+                    scales: Dict[int, float] = {v: random.random() for v in range(graph.vertex_count)}
+                    for queue_factory in (IndexedHeap, PairingHeap):
+                        paths = [shortest_path(graph, source, target, queue_factory),
+                                 bidirectional_dijkstra(graph, source, target, queue_factory),
+                                 astar(graph, source, target, lambda v: 0.5 * (remaining[v] or 0), queue_factory),
+                                 astar(graph, source, target, lambda v: scales[v] * (remaining[v] or 0),
+                                       queue_factory)]
+                        for path in paths:
+                            self.assert_path(graph, path, source, target, expected[target])
+
+    def test_same_vertex(self):
+        graph: WeightedGraph[str] = WeightedGraph(["a", "b"])
+        graph.add_edge_by_vertices("a", "a", 3)
+        self.assertEqual(shortest_path(graph, "a", "a"), [])
+        self.assertEqual(bidirectional_dijkstra(graph, "a", "a"), [])
+        self.assertEqual(astar(graph, "a", "a", lambda v: 0), [])
+        self.assertIsNone(bidirectional_dijkstra(graph, "a", "b"))
+
+    # 양쪽 큐의 최솟값의 합이 mu와 같아지는 순간 멈춰도 최단 경로를 놓치면 안 된다.
+    def test_bidirectional_stopping_rule(self):
+        graph: WeightedGraph[int] = WeightedGraph(list(range(4)))
+        graph.add_edges_from([(0, 3, 4), (0, 1, 2), (1, 2, 0), (2, 3, 2)])
+        self.assert_path(graph, bidirectional_dijkstra(graph, 0, 3), 0, 3, 4)
+        graph.add_edge_by_indices(0, 2, 1)
+        self.assert_path(graph, bidirectional_dijkstra(graph, 0, 3), 0, 3, 3)
+
+
+class GreatCircleTestCase(GraphTestCase):
+    def test_distance(self):
+        coordinates: Dict[str, Tuple[float, float]] = {"적도": (0, 0), "동경 90도": (0, 90), "북극": (90, 0)}
+        heuristic = great_circle_heuristic(coordinates, "적도", radius=1)
+        self.assertEqual(heuristic("적도"), 0)
+        self.assertAlmostEqual(heuristic("동경 90도"), pi / 2)
+        self.assertAlmostEqual(heuristic("북극"), pi / 2)
+
+    # 에지 가중치가 대권 거리 이상인 무작위 지도에서 astar는 dijkstra와 같은 거리를 찾는다.
+    def test_astar_on_sphere(self):
+        random: Random = Random(2)
+        for _ in range(10):
+            n: int = random.randint(2, 30)
+            coordinates: Dict[int, Tuple[float, float]] = {v: (random.uniform(-80, 80), random.uniform(-180, 180))
+                                                           for v in range(n)}
+            graph: WeightedGraph[int] = WeightedGraph(list(range(n)))
+            for _ in range(2 * n):
+                u, v = random.randrange(n), random.randrange(n)
+                graph.add_edge_by_indices(u, v, great_circle_heuristic(coordinates, v)(u) * random.uniform(1, 1.5))
+            source, target = random.randrange(n), random.randrange(n)
+            self.assert_path(graph, astar(graph, source, target, great_circle_heuristic(coordinates, target)),
+                             source, target, dijkstra(graph, source)[0][target])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,7 +13,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import TypeVar, Generic, List, Tuple
+from typing import TypeVar, Generic, List, Tuple, Iterable
 from graph import Graph
 from weighted_edge import WeightedEdge
 
@@ -22,7 +22,7 @@ V = TypeVar('V')  # 그래프 정점(vertice) 타입
 
 class WeightedGraph(Generic[V], Graph[V]):
     def __init__(self, vertices: List[V] = []) -> None:
-        self._vertices: List[V] = vertices
+        super().__init__(vertices)
         self._edges: List[List[WeightedEdge]] = [[] for _ in vertices]
 
     def add_edge_by_indices(self, u: int, v: int, weight: float) -> None:
@@ -30,10 +30,34 @@ class WeightedGraph(Generic[V], Graph[V]):
         self.add_edge(edge)  # 슈퍼 클래스 메서드 호출
 
     def add_edge_by_vertices(self, first: V, second: V, weight: float) -> None:
-        u: int = self._vertices.index(first)
-        v: int = self._vertices.index(second)
+        u: int = self.index_of(first)
+        v: int = self.index_of(second)
         self.add_edge_by_indices(u, v, weight)
 
+    # (정점, 정점, 가중치) 튜플들로 에지를 한 번에 추가한다. 없는 정점은 새로 추가한다.
+    def add_edges_from(self, triples: Iterable[Tuple[V, V, float]]) -> None:
+        for first, second, weight in triples:
+            u: int = self._index_or_add(first)
+            v: int = self._index_or_add(second)
+            self._edges[u].append(WeightedEdge(u, v, weight))
+            self._edges[v].append(WeightedEdge(v, u, weight))
+            self.version += 1
+
+    # u와 v 사이의 에지(평행 에지가 있으면 먼저 추가한 것)의 가중치를 바꾼다. 없으면 ValueError
+    # 에지 객체를 고치지 않고 새로 만들어 바꾸므로 이전 dijkstra 결과의 path_dict는 그대로 남는다.
+    def update_edge_by_indices(self, u: int, v: int, weight: float) -> None:
+        forward: int = self._edge_position(u, v)
+        backward: int = self._edge_position(v, u)
+        if u == v:  # 자기 루프는 같은 리스트에 두 번 들어 있다.
+            backward = next(position for position, edge in enumerate(self._edges[u])
+                            if edge.v == u and position != forward)
+        self._edges[u][forward] = WeightedEdge(u, v, weight)
+        self._edges[v][backward] = WeightedEdge(v, u, weight)
+        self.version += 1
+
+    def update_edge_by_vertices(self, first: V, second: V, weight: float) -> None:
+        self.update_edge_by_indices(self.index_of(first), self.index_of(second), weight)
+
     def neighbors_for_index_with_weights(self, index: int) -> List[Tuple[V, float]]:
         distance_tuples: List[Tuple[V, float]] = []
         for edge in self.edges_for_index(index):